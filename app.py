@@ -13,7 +13,8 @@ License: MIT
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional
+import tempfile
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -21,10 +22,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
+from werkzeug.datastructures import FileStorage
 from werkzeug.exceptions import BadRequest, InternalServerError
 import traceback
 
-from core.generator import generate_summary
+from core.generator import generate_summary, generate_summary_from_pdf
+from core.model_registry import get_registry
+from core.batching import get_scheduler
+from core.cache import get_summary_cache
+from core.jobs import get_job_manager, JobQueueFullError
+from core.logic import STATUS_ERROR, STATUS_FAILED
+from utils.extraction_cache import get_extraction_cache
+from utils.pdf_extractor import parse_page_ranges
+from utils.pdf_inspect import InvalidPDFError, inspect_pdf
+from utils.languages_detect import get_detection_cache_stats, preload_language_profiles
+from utils.preprocessing import get_lemma_cache_stats
 
 
 # Configure logging
@@ -45,6 +57,12 @@ app.config.update(
     MAX_CONTENT_LENGTH=16 * 1024 * 1024  # 16MB max file size
 )
 
+# Route concurrent /summarize requests through the micro-batching scheduler
+BATCHED_SUMMARIZATION = os.environ.get('BATCHED_SUMMARIZATION', '1') == '1'
+
+# Re-detect the language of every summary and log mismatches (auditing only)
+VERIFY_SUMMARY_LANGUAGE = os.environ.get('VERIFY_SUMMARY_LANGUAGE', '0') == '1'
+
 
 @app.errorhandler(400)
 def bad_request(error) -> Response:
@@ -66,6 +84,277 @@ def internal_error(error) -> Response:
     }), 500
 
 
+def _coerce_form_value(value: Any) -> Any:
+    """Convert multipart form strings to int or bool; other values pass through."""
+    if not isinstance(value, str):
+        return value
+    stripped = value.strip().lower()
+    if stripped in ('true', 'false'):
+        return stripped == 'true'
+    try:
+        return int(stripped)
+    except ValueError:
+        return value
+
+
+def _parse_summary_options(
+    data: Dict[str, Any],
+    hierarchical_default: bool = False,
+    form: bool = False
+) -> Tuple[Dict[str, Any], Optional[Tuple[Response, int]]]:
+    """
+    Extract and validate the optional summarization parameters of a request.
+    
+    Args:
+        data (Dict[str, Any]): JSON body or multipart form fields
+        hierarchical_default (bool, optional): Default for "hierarchical";
+                                               PDF uploads summarize the whole
+                                               document. Defaults to False.
+        form (bool, optional): `data` holds multipart form strings, which are
+                               converted to int or bool first; JSON values must
+                               already have the right type. Defaults to False.
+    
+    Returns:
+        Tuple: (options, error) - validated options, and an error response
+               tuple if validation failed (None otherwise)
+    """
+    # Extract optional parameters with defaults
+    max_length = data.get('max_length', 150)
+    min_length = data.get('min_length', 50)
+    hierarchical = data.get('hierarchical', hierarchical_default)
+    segmented = data.get('segmented', False)
+    if form:
+        max_length = _coerce_form_value(max_length)
+        min_length = _coerce_form_value(min_length)
+        hierarchical = _coerce_form_value(hierarchical)
+        segmented = _coerce_form_value(segmented)
+    options = {
+        "max_length": max_length,
+        "min_length": min_length,
+        "hierarchical": hierarchical,
+        "segmented": segmented
+    }
+    
+    # Validate parameters
+    if isinstance(max_length, bool) or not isinstance(max_length, int) or max_length < 10 or max_length > 1000:
+        return options, (jsonify({
+            "error": "Invalid max_length",
+            "message": "max_length must be an integer between 10 and 1000",
+            "status_code": 400
+        }), 400)
+    
+    if isinstance(min_length, bool) or not isinstance(min_length, int) or min_length < 5 or min_length >= max_length:
+        return options, (jsonify({
+            "error": "Invalid min_length", 
+            "message": f"min_length must be an integer between 5 and {max_length-1}",
+            "status_code": 400
+        }), 400)
+    
+    if not isinstance(hierarchical, bool):
+        return options, (jsonify({
+            "error": "Invalid hierarchical",
+            "message": "hierarchical must be a boolean",
+            "status_code": 400
+        }), 400)
+    
+    if not isinstance(segmented, bool):
+        return options, (jsonify({
+            "error": "Invalid segmented",
+            "message": "segmented must be a boolean",
+            "status_code": 400
+        }), 400)
+    
+    return options, None
+
+
+def _parse_pages(
+    data: Dict[str, Any],
+    page_count: int
+) -> Tuple[Optional[List[int]], Optional[Tuple[Response, int]]]:
+    """
+    Extract and validate the optional "pages" range of a PDF request.
+    
+    Args:
+        data (Dict[str, Any]): JSON body or multipart form fields
+        page_count (int): Page count of the uploaded PDF; ranges past it are rejected
+    
+    Returns:
+        Tuple: (pages, error) - page numbers (None for all pages), and an
+               error response tuple if validation failed (None otherwise)
+    """
+    spec = data.get('pages')
+    if spec is None or (isinstance(spec, str) and not spec.strip()):
+        return None, None
+    
+    try:
+        return parse_page_ranges(str(spec), max_page=page_count), None
+    except ValueError as e:
+        return None, (jsonify({
+            "error": "Invalid pages",
+            "message": f"pages must be page numbers or ranges like '1-5,8': {str(e)}",
+            "status_code": 400
+        }), 400)
+
+
+def _is_pdf_upload(upload: FileStorage) -> bool:
+    """Return True if an upload is named like a PDF document."""
+    return bool(upload.filename) and upload.filename.lower().endswith('.pdf')
+
+
+def _invalid_pdf_response() -> Tuple[Response, int]:
+    """Error response for uploads that are not PDF documents."""
+    return jsonify({
+        "error": "Invalid File",
+        "message": "The uploaded file must be a PDF",
+        "status_code": 400
+    }), 400
+
+
+def _inspect_upload(pdf_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[Response, int]]]:
+    """
+    Cheaply check a spooled upload before any extraction work is queued.
+    
+    Args:
+        pdf_path (str): Path of the spooled upload
+    
+    Returns:
+        Tuple: (inspection, error) - result of inspect_pdf(), and an error
+               response tuple if the upload is not a usable PDF (None otherwise)
+    """
+    try:
+        inspection = inspect_pdf(pdf_path)
+    except InvalidPDFError as e:
+        return None, (jsonify({
+            "error": "Invalid File",
+            "message": f"The uploaded file is not a valid PDF: {str(e)}",
+            "status_code": 400
+        }), 400)
+    
+    if inspection["page_count"] == 0:
+        return None, (jsonify({
+            "error": "Invalid File",
+            "message": "The uploaded PDF contains no pages",
+            "status_code": 400
+        }), 400)
+    
+    return inspection, None
+
+
+def _spool_upload(upload: FileStorage) -> str:
+    """
+    Write an uploaded file to a temporary file on disk.
+    
+    Args:
+        upload (FileStorage): Uploaded file from request.files
+    
+    Returns:
+        str: Path of the temporary file; the caller is responsible for deleting it
+    """
+    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
+        upload.save(tmp_file)
+        return tmp_file.name
+
+
+def _pipeline_error(result: Any) -> Optional[Tuple[Response, int]]:
+    """
+    Map an unsuccessful pipeline result to an error response.
+    
+    Args:
+        result (Any): Return value of generate_summary() or generate_summary_from_pdf()
+    
+    Returns:
+        Optional[Tuple[Response, int]]: 422 if the input could not be summarized
+                                        (undetected or unsupported language,
+                                        failed translation), 500 for processing
+                                        errors, None if the pipeline succeeded
+    """
+    if not isinstance(result, dict):
+        return jsonify({
+            "error": "Summarization Failed",
+            "message": str(result) if result else "Summary generation produced no output",
+            "status_code": 500
+        }), 500
+    
+    status = result.get('status')
+    if status == STATUS_FAILED:
+        return jsonify({
+            "error": "Summarization Failed",
+            "message": result.get('text', ''),
+            "language": result.get('source_lang'),
+            "status_code": 422
+        }), 422
+    if status == STATUS_ERROR:
+        return jsonify({
+            "error": "Summarization Error",
+            "message": result.get('text', ''),
+            "status_code": 500
+        }), 500
+    
+    return None
+
+
+def _run_summary_job(
+    text: Optional[str] = None,
+    pdf_path: Optional[str] = None,
+    max_length: int = 150,
+    min_length: int = 50,
+    hierarchical: bool = False,
+    segmented: bool = False,
+    pages: Optional[List[int]] = None
+) -> Dict[str, Any]:
+    """
+    Background job body: summarize text or a spooled PDF upload.
+    
+    Returns:
+        Dict[str, Any]: Summary, detected language and cache flag
+    
+    Raises:
+        RuntimeError: If the pipeline returns an error message or a failed status
+    """
+    try:
+        if pdf_path is not None:
+            result = generate_summary_from_pdf(
+                pdf_path,
+                input_max_length=1024,
+                sum_max_length=max_length,
+                sum_min_length=min_length,
+                num_beams=2,
+                hierarchical=hierarchical,
+                pages=pages,
+                verify_language=VERIFY_SUMMARY_LANGUAGE,
+                segmented=segmented
+            )
+        else:
+            result = generate_summary(
+                text,
+                input_max_length=1024,
+                sum_max_length=max_length,
+                sum_min_length=min_length,
+                num_beams=2,
+                hierarchical=hierarchical,
+                batched=BATCHED_SUMMARIZATION,
+                verify_language=VERIFY_SUMMARY_LANGUAGE,
+                segmented=segmented
+            )
+    finally:
+        if pdf_path is not None:
+            try:
+                os.unlink(pdf_path)
+            except OSError:
+                logger.warning("Failed to remove temporary upload: %s", pdf_path)
+    
+    if not isinstance(result, dict):
+        raise RuntimeError(str(result))
+    if result.get('status') in (STATUS_FAILED, STATUS_ERROR):
+        raise RuntimeError(result.get('text') or "Summary generation failed")
+    
+    return {
+        "summary": result.get('text', '').strip(),
+        "language": result.get('lang', 'unknown'),
+        "cached": result.get('cached', False)
+    }
+
+
 @app.route('/', methods=['GET'])
 def health_check() -> Response:
     """
@@ -73,7 +362,7 @@ def health_check() -> Response:
     
     Returns:
         Response: JSON response with API status and version information
-        
+    
     Examples:
         GET / -> {"status": "healthy", "version": "1.0.0", "service": "PDF Summarizer API"}
     """
@@ -84,11 +373,37 @@ def health_check() -> Response:
         "endpoints": {
             "/": "Health check",
             "/summarize": "POST - Generate text summary",
-            "/api/info": "GET - API information"
+            "/summarize/pdf": "POST - Generate summary from a PDF upload",
+            "/api/info": "GET - API information",
+            "/api/ready": "GET - Model readiness",
+            "/api/metrics": "GET - Runtime metrics",
+            "/jobs": "POST - Submit an asynchronous summarization job",
+            "/jobs/<job_id>": "GET - Poll job status and result"
         }
     })
 
 
+@app.route('/api/ready', methods=['GET'])
+def readiness() -> Response:
+    """
+    Report whether the summarization and translation models are loaded.
+    
+    Returns:
+        Response: JSON response with per-model load state and load time.
+                  Status code is 200 when all models are loaded, 503 otherwise.
+    
+    Examples:
+        GET /api/ready -> {"ready": true, "models": {"bart": {"state": "loaded", ...}}}
+    """
+    registry = get_registry()
+    ready = registry.is_ready()
+    
+    return jsonify({
+        "ready": ready,
+        "models": registry.status()
+    }), 200 if ready else 503
+
+
 @app.route('/api/info', methods=['GET'])
 def api_info() -> Response:
     """
@@ -124,13 +439,69 @@ def api_info() -> Response:
                     "text": "string (required) - Text to summarize",
                     "max_length": "integer (optional) - Maximum summary length (default: 150)",
                     "min_length": "integer (optional) - Minimum summary length (default: 50)",
-                    "language": "string (optional) - Target language for summary (default: auto-detect)"
+                    "language": "string (optional) - Target language for summary (default: auto-detect)",
+                    "hierarchical": "boolean (optional) - Summarize the full text with map-reduce summarization "
+                                    "instead of truncating it (default: false)",
+                    "segmented": "boolean (optional) - Detect languages per paragraph and translate only non-English "
+                                 "parts of mixed-language text (default: false)"
+                }
+            },
+            "POST /summarize/pdf": {
+                "description": "Generate summary from an uploaded PDF (multipart/form-data)",
+                "parameters": {
+                    "file": "file (required) - PDF document, up to 16MB",
+                    "max_length": "integer (optional) - Maximum summary length (default: 150)",
+                    "min_length": "integer (optional) - Minimum summary length (default: 50)",
+                    "hierarchical": "boolean (optional) - Summarize the whole document with "
+                                    "map-reduce summarization (default: true)",
+                    "segmented": "boolean (optional) - Detect languages per paragraph and translate only non-English "
+                                 "parts of mixed-language text (default: false)",
+                    "pages": "string (optional) - Page numbers or ranges to summarize, e.g. '1-5,8' "
+                             "(default: all pages)"
                 }
+            },
+            "POST /jobs": {
+                "description": "Submit an asynchronous summarization job from text or a PDF upload",
+                "parameters": {
+                    "text": "string (required without file) - Text to summarize (JSON body)",
+                    "file": "file (required without text) - PDF document (multipart upload)",
+                    "max_length": "integer (optional) - Maximum summary length (default: 150)",
+                    "min_length": "integer (optional) - Minimum summary length (default: 50)",
+                    "hierarchical": "boolean (optional) - Map-reduce summarization of long text "
+                                    "(default: false for text, true for PDF)",
+                    "segmented": "boolean (optional) - Detect languages per paragraph and translate only non-English "
+                                 "parts of mixed-language text (default: false)",
+                    "pages": "string (optional) - Page numbers or ranges of a PDF upload, e.g. '1-5,8' "
+                             "(default: all pages)"
+                }
+            },
+            "GET /jobs/<job_id>": {
+                "description": "Poll job status; the result is included once the job has succeeded"
             }
         }
     })
 
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics() -> Response:
+    """
+    Get runtime metrics for the summarization pipeline.
+    
+    Returns:
+        Response: JSON response with micro-batching queue depth and batch sizes,
+                  summary, PDF extraction, language detection and lemma
+                  cache counters and job counts
+    """
+    return jsonify({
+        "batching": get_scheduler().metrics(),
+        "summary_cache": get_summary_cache().stats(),
+        "extraction_cache": get_extraction_cache().stats(),
+        "language_detection": get_detection_cache_stats(),
+        "lemma_cache": get_lemma_cache_stats(),
+        "jobs": get_job_manager().metrics()
+    })
+
+
 @app.route('/summarize', methods=['POST'])
 def summarize() -> Response:
     """
@@ -145,12 +516,14 @@ def summarize() -> Response:
             "text": "Text to summarize (required)",
             "max_length": 150,  // Optional: Maximum summary length
             "min_length": 50,   // Optional: Minimum summary length  
-            "language": "en"    // Optional: Target language
+            "language": "en",   // Optional: Target language
+            "hierarchical": false,  // Optional: Map-reduce summarization of long text
+            "segmented": false  // Optional: Per-paragraph language routing
         }
-        
+    
     Returns:
         Response: JSON response with generated summary and metadata
-        
+    
     Response Format:
         {
             "summary": "Generated summary text",
@@ -159,15 +532,17 @@ def summarize() -> Response:
                 "summary_length": 120,
                 "compression_ratio": 0.12,
                 "processing_time": 2.5,
-                "model_used": "facebook/bart-large-cnn"
+                "model_used": "facebook/bart-large-cnn",
+                "cached": false
             },
             "status": "success"
         }
-        
+    
     Raises:
         400: If request is malformed or missing required text
+        422: If the text cannot be summarized (e.g. unsupported language)
         500: If summarization process fails
-        
+    
     Examples:
         >>> # Basic summarization
         >>> curl -X POST http://localhost:5000/summarize \\
@@ -203,6 +578,14 @@ def summarize() -> Response:
                 "status_code": 400
             }), 400
         
+        if not isinstance(data, dict):
+            logger.warning("Request body is not a JSON object")
+            return jsonify({
+                "error": "Invalid Request",
+                "message": "Request body must be a JSON object",
+                "status_code": 400
+            }), 400
+        
         # Validate required text parameter
         text = data.get('text')
         if not text or not isinstance(text, str) or not text.strip():
@@ -213,25 +596,13 @@ def summarize() -> Response:
                 "status_code": 400
             }), 400
         
-        # Extract optional parameters with defaults
-        max_length = data.get('max_length', 150)
-        min_length = data.get('min_length', 50)
-        target_language = data.get('language', 'auto')
-        
-        # Validate parameters
-        if not isinstance(max_length, int) or max_length < 10 or max_length > 1000:
-            return jsonify({
-                "error": "Invalid max_length",
-                "message": "max_length must be an integer between 10 and 1000",
-                "status_code": 400
-            }), 400
-        
-        if not isinstance(min_length, int) or min_length < 5 or min_length >= max_length:
-            return jsonify({
-                "error": "Invalid min_length", 
-                "message": f"min_length must be an integer between 5 and {max_length-1}",
-                "status_code": 400
-            }), 400
+        # Extract and validate optional parameters
+        options, error = _parse_summary_options(data)
+        if error is not None:
+            return error
+        max_length = options['max_length']
+        min_length = options['min_length']
+        hierarchical = options['hierarchical']
         
         # Log request details
         logger.info("Summarization request received - text length: %d, max_length: %d, min_length: %d", 
@@ -246,30 +617,29 @@ def summarize() -> Response:
             input_max_length=1024,  # Default input length
             sum_max_length=max_length,
             sum_min_length=min_length,
-            num_beams=2  # Default beam search parameter
+            num_beams=2,  # Default beam search parameter
+            hierarchical=hierarchical,
+            batched=BATCHED_SUMMARIZATION,  # Share generate calls across concurrent requests
+            verify_language=VERIFY_SUMMARY_LANGUAGE,
+            segmented=options['segmented']
         )
         
         processing_time = time.time() - start_time
         
-        # Handle different result formats from generator
-        if isinstance(result, dict):
-            summary = result.get('text') or result.get('summary', '')
-            detected_language = result.get('lang', 'unknown')
-            if not summary:
-                logger.error("Generator returned empty summary in dict format")
-                return jsonify({
-                    "error": "Empty Summary",
-                    "message": "Summary generation produced no output",
-                    "status_code": 500
-                }), 500
-        elif isinstance(result, str):
-            summary = result
-            detected_language = 'auto'
-        else:
-            logger.error("Generator returned unexpected format: %s", type(result))
+        # Failed or errored pipelines carry a message instead of a summary
+        error = _pipeline_error(result)
+        if error is not None:
+            logger.error("Summarization did not succeed: %s", result)
+            return error
+        
+        summary = result.get('text', '')
+        detected_language = result.get('lang', 'unknown')
+        cached = result.get('cached', False)
+        if not summary:
+            logger.error("Generator returned empty summary in dict format")
             return jsonify({
-                "error": "Invalid Response Format",
-                "message": "Summary generator returned unexpected format",
+                "error": "Empty Summary",
+                "message": "Summary generation produced no output",
                 "status_code": 500
             }), 500
         
@@ -288,9 +658,12 @@ def summarize() -> Response:
                 "compression_ratio": round(compression_ratio, 3),
                 "processing_time": round(processing_time, 2),
                 "model_used": "facebook/bart-large-cnn",
+                "cached": cached,
                 "parameters": {
                     "max_length": max_length,
                     "min_length": min_length,
+                    "hierarchical": hierarchical,
+                    "segmented": options['segmented'],
                     "detected_language": detected_language
                 }
             },
@@ -301,7 +674,7 @@ def summarize() -> Response:
                     compression_ratio, processing_time)
         
         return jsonify(response_data)
-        
+    
     except Exception as e:
         # Log full error details
         logger.error("Summarization failed: %s", str(e))
@@ -314,6 +687,274 @@ def summarize() -> Response:
         }), 500
 
 
+@app.route('/summarize/pdf', methods=['POST'])
+def summarize_pdf() -> Response:
+    """
+    Generate a summary from an uploaded PDF document.
+    
+    The PDF is sent as a multipart upload in the "file" field and spooled to a
+    temporary file, so clients do not need to extract the text themselves and
+    post it as a large JSON body. Text is extracted, preprocessed and
+    summarized hierarchically unless "hierarchical" is set to false.
+    
+    Form Fields:
+        file: PDF document (required)
+        max_length: Maximum summary length (optional, default: 150)
+        min_length: Minimum summary length (optional, default: 50)
+        hierarchical: Map-reduce summarization of the whole document
+                      (optional, default: true)
+        pages: Page numbers or ranges to summarize, e.g. "1-5,8"
+               (optional, default: all pages)
+    
+    Returns:
+        Response: JSON response with generated summary and metadata, in the
+                  same format as /summarize
+    
+    Raises:
+        400: If no PDF is uploaded or parameters are invalid
+        413: If the upload exceeds MAX_CONTENT_LENGTH
+        422: If the text cannot be summarized (e.g. unsupported language)
+        500: If extraction or summarization fails
+    
+    Examples:
+        >>> curl -X POST http://localhost:5000/summarize/pdf \\
+        ...      -F "file=@report.pdf" -F "max_length=200"
+    """
+    pdf_path = None
+    try:
+        upload = request.files.get('file')
+        if upload is None:
+            return jsonify({
+                "error": "Missing File",
+                "message": "A PDF must be uploaded in the 'file' field",
+                "status_code": 400
+            }), 400
+        
+        if not _is_pdf_upload(upload):
+            return _invalid_pdf_response()
+        
+        form = request.form.to_dict()
+        options, error = _parse_summary_options(form, hierarchical_default=True, form=True)
+        if error is not None:
+            return error
+        
+        pdf_path = _spool_upload(upload)
+        inspection, error = _inspect_upload(pdf_path)
+        if error is None:
+            pages, error = _parse_pages(form, inspection["page_count"])
+        if error is not None:
+            return error
+        
+        logger.info("PDF summarization request received - file: %s, size: %d bytes, pages: %d",
+                    upload.filename, inspection["file_size"], inspection["page_count"])
+        
+        import time
+        start_time = time.time()
+        
+        result = generate_summary_from_pdf(
+            pdf_path,
+            input_max_length=1024,
+            sum_max_length=options['max_length'],
+            sum_min_length=options['min_length'],
+            num_beams=2,
+            hierarchical=options['hierarchical'],
+            pages=pages,
+            verify_language=VERIFY_SUMMARY_LANGUAGE,
+            segmented=options['segmented']
+        )
+        
+        processing_time = time.time() - start_time
+        
+        error = _pipeline_error(result)
+        if error is None and not result.get('text'):
+            error = _pipeline_error(None)
+        if error is not None:
+            logger.error("PDF summarization did not succeed: %s", result)
+            return error
+        
+        summary = result['text'].strip()
+        detected_language = result.get('lang', 'unknown')
+        original_length = result.get('input_length', 0)
+        compression_ratio = len(summary) / original_length if original_length > 0 else 0
+        
+        logger.info("PDF summarization completed - time: %.2fs", processing_time)
+        
+        return jsonify({
+            "summary": summary,
+            "language": detected_language,
+            "metadata": {
+                "filename": upload.filename,
+                "page_count": inspection["page_count"],
+                "original_length": original_length,
+                "summary_length": len(summary),
+                "compression_ratio": round(compression_ratio, 3),
+                "processing_time": round(processing_time, 2),
+                "model_used": "facebook/bart-large-cnn",
+                "cached": result.get('cached', False),
+                "parameters": {
+                    "max_length": options['max_length'],
+                    "min_length": options['min_length'],
+                    "hierarchical": options['hierarchical'],
+                    "segmented": options['segmented'],
+                    "pages": form.get('pages') or "all",
+                    "detected_language": detected_language
+                }
+            },
+            "status": "success"
+        })
+    
+    except Exception as e:
+        logger.error("PDF summarization failed: %s", str(e))
+        logger.error("Full traceback: %s", traceback.format_exc())
+        
+        return jsonify({
+            "error": "Summarization Failed",
+            "message": f"An error occurred during PDF summarization: {str(e)}",
+            "status_code": 500
+        }), 500
+    
+    finally:
+        if pdf_path is not None:
+            try:
+                os.unlink(pdf_path)
+            except OSError:
+                logger.warning("Failed to remove temporary upload: %s", pdf_path)
+
+
+@app.route('/jobs', methods=['POST'])
+def create_job() -> Response:
+    """
+    Submit a summarization job and return its id immediately.
+    
+    Accepts either a JSON body with a "text" field, or a multipart upload with
+    a PDF in the "file" field. Optional parameters (max_length, min_length,
+    hierarchical, and pages for PDFs) are read from the JSON body or the form
+    fields.
+    
+    Returns:
+        Response: 202 with the job id and its status URL, 400 for invalid
+                  input, 503 when the job queue is full
+    
+    Examples:
+        >>> curl -X POST http://localhost:5000/jobs \\
+        ...      -H "Content-Type: application/json" \\
+        ...      -d '{"text": "Long document text here..."}'
+        
+        >>> curl -X POST http://localhost:5000/jobs -F "file=@report.pdf" -F "max_length=200"
+    """
+    pdf_path = None
+    try:
+        upload = request.files.get('file')
+        data = request.form.to_dict() if upload is not None else (request.get_json(silent=True) or {})
+        if not isinstance(data, dict):
+            return jsonify({
+                "error": "Invalid Request",
+                "message": "Request body must be a JSON object",
+                "status_code": 400
+            }), 400
+        
+        options, error = _parse_summary_options(
+            data,
+            hierarchical_default=upload is not None,
+            form=upload is not None
+        )
+        if error is not None:
+            return error
+        
+        if upload is not None:
+            if not _is_pdf_upload(upload):
+                return _invalid_pdf_response()
+            pdf_path = _spool_upload(upload)
+            inspection, error = _inspect_upload(pdf_path)
+            if error is None:
+                options["pages"], error = _parse_pages(data, inspection["page_count"])
+            if error is not None:
+                return error
+            kind = "pdf"
+        else:
+            text = data.get('text')
+            if not text or not isinstance(text, str) or not text.strip():
+                return jsonify({
+                    "error": "Missing Input",
+                    "message": "Provide a non-empty 'text' field or a PDF 'file' upload",
+                    "status_code": 400
+                }), 400
+            kind = "text"
+        
+        job_id = get_job_manager().submit(
+            _run_summary_job,
+            text=data.get('text') if kind == "text" else None,
+            pdf_path=pdf_path,
+            kind=kind,
+            **options
+        )
+        pdf_path = None  # Owned by the job from here on
+        
+        logger.info("Job %s queued (%s input)", job_id, kind)
+        
+        response = jsonify({
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/jobs/{job_id}"
+        })
+        response.headers['Location'] = f"/jobs/{job_id}"
+        return response, 202
+    
+    except JobQueueFullError as e:
+        logger.warning("Job rejected: %s", str(e))
+        return jsonify({
+            "error": "Queue Full",
+            "message": str(e),
+            "status_code": 503
+        }), 503
+    
+    except Exception as e:
+        logger.error("Job submission failed: %s", str(e))
+        return jsonify({
+            "error": "Job Submission Failed",
+            "message": str(e),
+            "status_code": 500
+        }), 500
+    
+    finally:
+        if pdf_path is not None:
+            try:
+                os.unlink(pdf_path)
+            except OSError:
+                logger.warning("Failed to remove temporary upload: %s", pdf_path)
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id: str) -> Response:
+    """
+    Poll a summarization job.
+    
+    Returns:
+        Response: Job status; includes "result" once succeeded and "error"
+                  once failed. 404 if the job is unknown or expired.
+    
+    Response Format:
+        {
+            "job_id": "3f2a...",
+            "kind": "pdf",
+            "status": "succeeded",
+            "created_at": 1735689600.0,
+            "started_at": 1735689600.1,
+            "finished_at": 1735689604.7,
+            "result": {"summary": "...", "language": "en", "cached": false}
+        }
+    """
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({
+            "error": "Job Not Found",
+            "message": f"No job with id '{job_id}'",
+            "status_code": 404
+        }), 404
+    
+    return jsonify(job)
+
+
 @app.route('/api/validate', methods=['POST'])
 def validate_text() -> Response:
     """
@@ -334,7 +975,7 @@ def validate_text() -> Response:
         }
         
         return jsonify(validation_result)
-        
+    
     except Exception as e:
         logger.error("Text validation failed: %s", str(e))
         return jsonify({
@@ -354,6 +995,12 @@ if __name__ == '__main__':
     logger.info("Debug mode: %s", debug_mode)
     logger.info("Port: %d", port)
     
+    # Warm up models in the background so /api/ready reflects real load state
+    if os.environ.get('PRELOAD_MODELS', '1') == '1':
+        import threading
+        preload_language_profiles()
+        threading.Thread(target=get_registry().preload, daemon=True).start()
+    
     try:
         app.run(
             host='0.0.0.0',
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+PDF Summarize - Preprocessing Normalization Benchmark
+
+Compares the original step-by-step normalization of preprocess() (five
+str.replace passes, a whitespace regex, lower(), translate() and a digit
+regex) with the fused normalize_text() on synthetic PDF-like text. For each
+variant it reports the number of full-text copies, wall time and the peak
+memory allocated while normalizing. Copy counts are counted by hand from
+the code, not measured.
+
+Usage:
+    python benchmarks/bench_preprocessing.py --size-mb 8 --repeat 5
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import re
+import sys
+import time
+import string
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.preprocessing import normalize_text
+
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Excerpt resembling extracted PDF text: non-breaking spaces, hard line
+# breaks, tabs, page numbers and punctuation
+_SAMPLE = (
+    "ACME Corp Annual Report 2025\xa0\xa0Page 12 of 60\n"
+    "Revenue grew by 14.2% to $3,450 million in fiscal 2025, driven by\n"
+    "strong demand in Europe\t(+18%) and Asia-Pacific (+11%).\r\n"
+    "Operating costs, however, rose faster than expected; see Note 7.\n\n"
+)
+
+
+def legacy_normalize(text: str) -> str:
+    """Steps 1-5 of preprocess() as originally written: 10 full-text copies."""
+    text = text.replace('\xa0', ' ')
+    text = text.replace('\u00a0', ' ')
+    text = text.replace('\n', ' ')
+    text = text.replace('\t', ' ')
+    text = text.replace('\r', ' ')
+    text = re.sub(r'\s+', ' ', text).strip()
+    text = text.lower()
+    text = text.translate(_PUNCTUATION_TABLE)
+    text = re.sub(r'\d+', '', text)
+    return text
+
+
+# Full-text copies made by each variant on ASCII input, counted by hand
+# (legacy: 5 replace + sub + strip + lower + translate + sub;
+#  fused: sub + strip + lower + translate)
+PASSES = {"legacy": 10, "fused": 4}
+
+
+def measure(fn: Callable[[str], str], text: str, repeat: int) -> Tuple[float, int]:
+    """
+    Time a normalizer and measure its peak allocation.
+    
+    Returns:
+        Tuple[float, int]: (best wall time in seconds, peak bytes allocated)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    
+    tracemalloc.start()
+    fn(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark preprocessing normalization")
+    parser.add_argument("--size-mb", type=float, default=8, help="Size of the synthetic text in MB")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant")
+    args = parser.parse_args()
+    
+    text = _SAMPLE * max(1, int(args.size_mb * 1024 * 1024 / len(_SAMPLE)))
+    
+    if legacy_normalize(text) != normalize_text(text):
+        print("[ERROR] Fused normalization output differs from the legacy steps")
+        return 1
+    
+    print(f"Input: {len(text) / (1024 * 1024):.1f} MB, best of {args.repeat} runs")
+    print(f"{'variant':<8} {'copies*':>7} {'time (ms)':>10} {'peak alloc (MB)':>16}")
+    
+    results = {}
+    for name, fn in (("legacy", legacy_normalize), ("fused", normalize_text)):
+        results[name] = measure(fn, text, args.repeat)
+        elapsed, peak = results[name]
+        print(f"{name:<8} {PASSES[name]:>7} {elapsed * 1000:>10.1f} {peak / (1024 * 1024):>16.1f}")
+    
+    speedup = results["legacy"][0] / results["fused"][0]
+    print(f"Speedup: {speedup:.2f}x")
+    print("* full-text copies counted by hand from the code, not measured")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
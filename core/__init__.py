@@ -9,10 +9,19 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .generator import generate_summary
-from .summarizer import summarize_model
+from .generator import generate_summary, generate_summary_from_pdf
+from .summarizer import summarize_model, summarize_long_model, summarize_batch
+from .model_registry import ModelRegistry, get_registry
+from .cache import SummaryCache, get_summary_cache
 
 __all__ = [
     "generate_summary",
+    "generate_summary_from_pdf",
     "summarize_model",
+    "summarize_long_model",
+    "summarize_batch",
+    "ModelRegistry",
+    "get_registry",
+    "SummaryCache",
+    "get_summary_cache",
 ]
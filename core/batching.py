@@ -0,0 +1,334 @@
+"""
+PDF Summarize - Dynamic Micro-Batching Module
+
+This module provides an in-process scheduler that collects concurrent
+summarization requests for a short time window, groups them by compatible
+generation parameters and runs one batched BART generate call per group.
+Each caller receives its own future, so request threads block only on
+their own result.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import os
+import sys
+import time
+import queue
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Generation parameters that must match for requests to share a batch:
+# (input_max_length, sum_max_length, sum_min_length, num_beams)
+BatchKey = Tuple[int, int, int, int]
+
+
+class _PendingRequest:
+    """A queued summarization request and the future resolving it."""
+    
+    def __init__(self, text: str, key: BatchKey):
+        self.text = text
+        self.key = key
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class BatchScheduler:
+    """
+    Micro-batching scheduler in front of the BART summarizer.
+    
+    A background worker waits for the first request, then keeps collecting
+    requests for up to `max_wait_ms` milliseconds or until `max_batch_size`
+    requests are pending. Collected requests are grouped by generation
+    parameters and each group is summarized with one batched call.
+    
+    Attributes:
+        max_batch_size (int): Maximum requests collected per scheduling round
+        max_wait_ms (float): Maximum time to wait for a batch to fill
+    
+    Examples:
+        >>> scheduler = BatchScheduler(max_batch_size=8, max_wait_ms=20)
+        >>> summary = scheduler.summarize(
+        ...     text="Long article text here...",
+        ...     input_max_length=1024,
+        ...     sum_max_length=150,
+        ...     sum_min_length=50,
+        ...     num_beams=2
+        ... )
+        >>> scheduler.metrics()["batches_run"]
+        1
+    """
+    
+    def __init__(
+        self,
+        summarize_batch_fn: Optional[Callable[..., List[str]]] = None,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20.0
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            summarize_batch_fn (Callable, optional): Batched summarization function
+                with the signature of core.summarizer.summarize_batch. Defaults to
+                summarize_batch.
+            max_batch_size (int, optional): Maximum requests per round. Defaults to 8.
+            max_wait_ms (float, optional): Maximum wait for a batch to fill in
+                                           milliseconds. Defaults to 20.
+        
+        Raises:
+            ValueError: If max_batch_size or max_wait_ms is invalid
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0.")
+        
+        if summarize_batch_fn is None:
+            from core.summarizer import summarize_batch
+            summarize_batch_fn = summarize_batch
+        
+        self.summarize_batch_fn = summarize_batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        
+        self._queue: "queue.Queue[Optional[_PendingRequest]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stopped = False
+        
+        # Metrics
+        self._metrics_lock = threading.Lock()
+        self._batches_run = 0
+        self._requests_processed = 0
+        self._requests_failed = 0
+        self._batch_sizes: Counter = Counter()
+        self._total_wait = 0.0
+    
+    def _ensure_started(self) -> None:
+        """Start the background worker on first use."""
+        if self._worker is not None:
+            return
+        
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="bart-batch-scheduler", daemon=True
+                )
+                self._worker.start()
+    
+    def submit(
+        self,
+        text: str,
+        input_max_length: int,
+        sum_max_length: int,
+        sum_min_length: int,
+        num_beams: int
+    ) -> Future:
+        """
+        Queue a summarization request.
+        
+        Args:
+            text (str): The input text to summarize
+            input_max_length (int): Maximum length for input tokenization
+            sum_max_length (int): Maximum length of the generated summary
+            sum_min_length (int): Minimum length of the generated summary
+            num_beams (int): Number of beams for beam search decoding
+        
+        Returns:
+            Future: Resolves to the summary text
+        
+        Raises:
+            ValueError: If input text is empty or invalid
+            RuntimeError: If the scheduler has been shut down
+        """
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("Input text must be a non-empty string.")
+        
+        if self._stopped:
+            raise RuntimeError("Batch scheduler has been shut down.")
+        
+        self._ensure_started()
+        request = _PendingRequest(
+            text, (input_max_length, sum_max_length, sum_min_length, num_beams)
+        )
+        self._queue.put(request)
+        return request.future
+    
+    def summarize(
+        self,
+        text: str,
+        input_max_length: int,
+        sum_max_length: int,
+        sum_min_length: int,
+        num_beams: int
+    ) -> str:
+        """
+        Summarize text through the scheduler and wait for the result.
+        
+        The signature matches summarize_model, so this method can be passed to
+        process_text as its summarize_model callable.
+        
+        Returns:
+            str: The generated summary text
+        """
+        future = self.submit(
+            text, input_max_length, sum_max_length, sum_min_length, num_beams
+        )
+        return future.result()
+    
+    def _collect(self) -> List[_PendingRequest]:
+        """Block for the first request, then gather more until the window closes."""
+        first = self._queue.get()
+        if first is None:
+            return []
+        
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                # Shutdown sentinel: finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(request)
+        
+        return batch
+    
+    def _run(self) -> None:
+        """Worker loop: collect, group by parameters and run batched generate."""
+        while True:
+            batch = self._collect()
+            if not batch:
+                return
+            
+            groups: Dict[BatchKey, List[_PendingRequest]] = defaultdict(list)
+            for request in batch:
+                groups[request.key].append(request)
+            
+            for key, requests in groups.items():
+                try:
+                    self._run_group(key, requests)
+                except Exception as e:
+                    # Keep the worker alive; fail only this group's callers
+                    print(f"[ERROR] Batched summarization failed unexpectedly: {str(e)}")
+                    for request in requests:
+                        if not request.future.done():
+                            try:
+                                request.future.set_exception(e)
+                            except InvalidStateError:
+                                pass
+    
+    def _run_group(self, key: BatchKey, requests: List[_PendingRequest]) -> None:
+        """Run one batched summarization call and resolve each caller's future."""
+        input_max_length, sum_max_length, sum_min_length, num_beams = key
+        started = time.perf_counter()
+        
+        # Cancelled callers are dropped; the rest can no longer be cancelled
+        requests = [request for request in requests if request.future.set_running_or_notify_cancel()]
+        if not requests:
+            return
+        
+        try:
+            summaries = self.summarize_batch_fn(
+                [request.text for request in requests],
+                input_max_length=input_max_length,
+                sum_max_length=sum_max_length,
+                sum_min_length=sum_min_length,
+                num_beams=num_beams,
+                batch_size=len(requests)
+            )
+            if len(summaries) != len(requests):
+                raise RuntimeError(
+                    f"Batched summarization returned {len(summaries)} summaries for {len(requests)} texts"
+                )
+        except Exception as e:
+            for request in requests:
+                request.future.set_exception(e)
+            failed = len(requests)
+        else:
+            for request, summary in zip(requests, summaries):
+                request.future.set_result(summary)
+            failed = 0
+        
+        with self._metrics_lock:
+            self._batches_run += 1
+            self._requests_processed += len(requests)
+            self._requests_failed += failed
+            self._batch_sizes[len(requests)] += 1
+            self._total_wait += sum(started - request.enqueued_at for request in requests)
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get scheduler metrics.
+        
+        Returns:
+            Dict[str, Any]: Queue depth, batch counts and batch size distribution
+        """
+        with self._metrics_lock:
+            processed = self._requests_processed
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches_run": self._batches_run,
+                "requests_processed": processed,
+                "requests_failed": self._requests_failed,
+                "average_batch_size": round(processed / self._batches_run, 2) if self._batches_run else 0,
+                "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+                "average_queue_wait_ms": round(self._total_wait * 1000 / processed, 2) if processed else 0,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait_ms
+            }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting requests and stop the worker after pending requests finish.
+        
+        Args:
+            wait (bool, optional): Block until the worker exits. Defaults to True.
+        """
+        self._stopped = True
+        if self._worker is not None:
+            self._queue.put(None)
+            if wait:
+                self._worker.join()
+
+
+_scheduler: Optional[BatchScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> BatchScheduler:
+    """
+    Get the process-wide batch scheduler, creating it on first use.
+    
+    The batch window is configured through the BATCH_MAX_SIZE and
+    BATCH_MAX_WAIT_MS environment variables.
+    
+    Returns:
+        BatchScheduler: The shared scheduler
+    """
+    global _scheduler
+    
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = BatchScheduler(
+                    max_batch_size=int(os.environ.get("BATCH_MAX_SIZE", 8)),
+                    max_wait_ms=float(os.environ.get("BATCH_MAX_WAIT_MS", 20))
+                )
+    
+    return _scheduler
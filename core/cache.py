@@ -0,0 +1,293 @@
+"""
+PDF Summarize - Summary Result Cache Module
+
+This module provides a content-addressed cache for generated summaries.
+Entries are keyed by a hash of the normalized input text, the generation
+parameters and the model versions, and are kept in an in-memory LRU tier
+with an optional size-bounded SQLite tier on disk.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import os
+import re
+import sys
+import copy
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.lru_cache import LRUCache
+
+
+# Bump when the pipeline changes in a way that invalidates cached summaries
+CACHE_VERSION = 2
+
+# Model identifiers folded into every cache key
+MODEL_VERSIONS = (
+    "facebook/bart-large-cnn",
+    "Helsinki-NLP/opus-mt-ROMANCE-en",
+    "Helsinki-NLP/opus-mt-en-ROMANCE",
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def make_cache_key(text: str, **params: Any) -> str:
+    """
+    Build a content-addressed cache key.
+    
+    Whitespace differences in the text do not change the key; any change in
+    generation parameters, model versions or CACHE_VERSION does.
+    
+    Args:
+        text (str): Input text
+        **params: Generation parameters (input_max_length, sum_max_length, ...)
+    
+    Returns:
+        str: Hex SHA-256 digest
+    
+    Examples:
+        >>> make_cache_key("Some  text", sum_max_length=200) == make_cache_key("Some text", sum_max_length=200)
+        True
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip()
+    header = json.dumps(
+        {"version": CACHE_VERSION, "models": MODEL_VERSIONS, "params": params},
+        sort_keys=True
+    )
+    
+    digest = hashlib.sha256()
+    digest.update(header.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalized.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _DiskTier:
+    """SQLite-backed cache tier evicting least recently accessed entries by total size."""
+    
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.path = Path(cache_dir) / "summaries.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON summaries (accessed)")
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT value FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE summaries SET accessed = ? WHERE key = ?", (time.time(), key))
+            return json.loads(row[0])
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        payload = json.dumps(value)
+        size = len(payload.encode("utf-8"))
+        
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, size, time.time())
+            )
+            
+            # Evict least recently accessed entries until under the size budget
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute(
+                    "SELECT key, size FROM summaries ORDER BY accessed ASC"
+                ).fetchall()
+                evicted = []
+                for old_key, old_size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((old_key,))
+                    total -= old_size
+                conn.executemany("DELETE FROM summaries WHERE key = ?", evicted)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as conn:
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+            ).fetchone()
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "size_bytes": total,
+            "max_bytes": self.max_bytes
+        }
+
+
+class SummaryCache:
+    """
+    Two-tier cache for generated summaries.
+    
+    Lookups check the in-memory LRU first, then the optional disk tier; disk
+    hits are promoted to memory.
+    
+    Examples:
+        >>> cache = SummaryCache(memory_entries=256, cache_dir="./cache")
+        >>> key = make_cache_key(text, sum_max_length=200)
+        >>> cache.put(key, {"lang": "en", "text": "Summary"})
+        >>> cache.get(key)
+        {'lang': 'en', 'text': 'Summary'}
+    """
+    
+    def __init__(
+        self,
+        memory_entries: int = 256,
+        cache_dir: Optional[str] = None,
+        max_disk_mb: float = 512
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            memory_entries (int, optional): Capacity of the memory tier. Defaults to 256.
+            cache_dir (str, optional): Directory for the disk tier. Defaults to None
+                                       (memory only).
+            max_disk_mb (float, optional): Size budget of the disk tier in MB.
+                                           Defaults to 512.
+        """
+        self._memory = LRUCache(maxsize=memory_entries)
+        self._disk = _DiskTier(Path(cache_dir), int(max_disk_mb * 1024 * 1024)) if cache_dir else None
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached summary.
+        
+        Args:
+            key (str): Key from make_cache_key()
+        
+        Returns:
+            Optional[Dict[str, Any]]: Cached result, or None on a miss
+        """
+        value = self._memory.get(key)
+        
+        if value is None and self._disk is not None:
+            try:
+                value = self._disk.get(key)
+            except sqlite3.Error as e:
+                print(f"[WARNING] Summary cache read failed: {str(e)}")
+                value = None
+            if value is not None:
+                self._memory.put(key, value)
+                with self._stats_lock:
+                    self.disk_hits += 1
+        
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        
+        # Deep copies: results hold nested dicts/lists callers may mutate
+        return copy.deepcopy(value) if value is not None else None
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a summary result in every tier.
+        
+        Args:
+            key (str): Key from make_cache_key()
+            value (Dict[str, Any]): JSON-serializable summary result
+        """
+        self._memory.put(key, copy.deepcopy(value))
+        
+        if self._disk is not None:
+            try:
+                self._disk.put(key, value)
+            except sqlite3.Error as e:
+                print(f"[WARNING] Summary cache write failed: {str(e)}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Hit/miss counters and per-tier sizes
+        """
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+        
+        memory_stats = self._memory.stats()
+        stats["memory"] = {
+            "entries": memory_stats["entries"],
+            "maxsize": memory_stats["maxsize"]
+        }
+        
+        if self._disk is not None:
+            try:
+                stats["disk"] = self._disk.stats()
+            except sqlite3.Error as e:
+                stats["disk"] = {"error": str(e)}
+        
+        return stats
+
+
+_summary_cache: Optional[SummaryCache] = None
+_summary_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """
+    Get the process-wide summary cache, creating it on first use.
+    
+    Configured through environment variables:
+        SUMMARY_CACHE_SIZE: Memory tier capacity in entries (default 256)
+        SUMMARY_CACHE_DIR: Directory enabling the SQLite disk tier (default unset)
+        SUMMARY_CACHE_MAX_MB: Disk tier size budget in MB (default 512)
+    
+    Returns:
+        SummaryCache: The shared cache
+    """
+    global _summary_cache
+    
+    if _summary_cache is None:
+        with _summary_cache_lock:
+            if _summary_cache is None:
+                _summary_cache = SummaryCache(
+                    memory_entries=int(os.environ.get("SUMMARY_CACHE_SIZE", 256)),
+                    cache_dir=os.environ.get("SUMMARY_CACHE_DIR") or None,
+                    max_disk_mb=float(os.environ.get("SUMMARY_CACHE_MAX_MB", 512))
+                )
+    
+    return _summary_cache
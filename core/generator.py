@@ -12,18 +12,26 @@ License: MIT
 
 import os
 import sys
-from typing import Dict, Union, Any
+from typing import Dict, Iterable, Optional, Union, Any
 from pathlib import Path
 
 # Add project root to Python path for proper imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.summarizer import summarize_model
-from src.translator_models import Translator
-from core.logic import process_text
+from core.summarizer import summarize_model, summarize_long_model
+from core.model_registry import get_translator
+from core.batching import get_scheduler
+from core.logic import process_text_with_metadata, STATUS_ERROR
+from core.cache import get_summary_cache, make_cache_key
 from utils.languages_detect import support_languages, detect_languages
-from utils.pdf_extractor import extract_text_from_pdf
-from utils.preprocessing import preprocess
+from utils.pdf_extractor import iter_pdf_pages, iter_strip_boilerplate
+from utils.preprocessing import preprocess_stream
+
+
+# Raw characters extracted per character of summarizer input when a PDF is
+# truncated: preprocessing drops stop words, punctuation and digits, which
+# typically shrinks PDF text to well under half its size
+PDF_EXTRACTION_HEADROOM = 3
 
 
 def generate_summary(
@@ -31,16 +39,25 @@ def generate_summary(
     input_max_length: int = 1024,
     sum_max_length: int = 200,
     sum_min_length: int = 20,
-    num_beams: int = 2
+    num_beams: int = 2,
+    hierarchical: bool = False,
+    batched: bool = False,
+    use_cache: bool = True,
+    verify_language: bool = False,
+    segmented: bool = False
 ) -> Union[Dict[str, Any], str]:
     """
     Generate a summary for the given text input.
     
     This function implements the complete summarization pipeline:
-    1. Initialize translation models
+    1. Get the shared translation models from the model registry
     2. Process text through language detection and translation
     3. Generate summary using BART model
-    4. Return results with detected language information
+    4. Return results with the language information reported by the pipeline
+    
+    The summary language is known from the pipeline (the source language the
+    summary is translated back into), so it is not detected a second time
+    unless verify_language is set.
     
     Args:
         text (str): The source text to summarize
@@ -52,6 +69,24 @@ def generate_summary(
                                     Defaults to 20.
         num_beams (int, optional): Number of beams for beam search generation. 
                                 Defaults to 2.
+        hierarchical (bool, optional): Summarize the whole text with map-reduce
+                                    summarization instead of truncating it to
+                                    input_max_length characters. Defaults to False.
+        batched (bool, optional): Route BART generation through the shared
+                                micro-batching scheduler so concurrent calls
+                                share one batched generate. Ignored when
+                                hierarchical is set. Defaults to False.
+        use_cache (bool, optional): Return a cached summary for identical text
+                                and parameters, and cache new results.
+                                Defaults to True.
+        verify_language (bool, optional): Also run language detection on the
+                                summary and report it as "detected_lang" for
+                                auditing. Defaults to False.
+        segmented (bool, optional): Detect languages per paragraph segment and
+                                translate only non-English segments, for
+                                mixed-language documents. Segments are detected
+                                over the whole text even when it is truncated
+                                to input_max_length. Defaults to False.
     
     Returns:
         Union[Dict[str, Any], str]: Dictionary containing language and summary text
@@ -59,8 +94,11 @@ def generate_summary(
                                 
         Success format:
         {
-            "lang": str,  # Detected language code
-            "text": str   # Generated summary
+            "lang": str,         # Language of the summary
+            "text": str,         # Generated summary, or a message on failure
+            "source_lang": str,  # Detected input language (None if undetected)
+            "status": str,       # "success", "failed" or "error" (see core.logic)
+            "cached": bool       # True if served from the summary cache
         }
     
     Raises:
@@ -78,43 +116,209 @@ def generate_summary(
         ...     sum_max_length=150
         ... )
     """
+    # Serve repeated documents from the summary cache
+    cache_key = None
+    if use_cache:
+        cache_key = make_cache_key(
+            text,
+            input_max_length=input_max_length,
+            sum_max_length=sum_max_length,
+            sum_min_length=sum_min_length,
+            num_beams=num_beams,
+            hierarchical=hierarchical,
+            segmented=segmented
+        )
+        cached = get_summary_cache().get(cache_key)
+        if cached is not None:
+            print("[INFO] Summary served from cache")
+            cached["cached"] = True
+            if verify_language:
+                _verify_summary_language(cached)
+            return cached
+    
     try:
-        # Initialize translator with proper model directory path
-        model_dir = Path(__file__).parent.parent / "models" / "translation_models"
-        translator = Translator(model_dir=str(model_dir))
+        # Reuse the process-wide translator (loaded once on first call)
+        translator = get_translator()
     except Exception as e:
         raise RuntimeError(f"Failed to initialize translator: {str(e)}") from e
 
     # Validate and truncate input text if necessary
-    if len(text) > input_max_length:
-        text = text[:input_max_length]
-        print(f"[INFO] Text too long. Using first {input_max_length} characters only.")
+    max_chars = None
+    if hierarchical:
+        summarize_fn = summarize_long_model
+    else:
+        summarize_fn = get_scheduler().summarize if batched else summarize_model
+        if len(text) > input_max_length:
+            if segmented:
+                # Segment languages are detected over the whole text and the
+                # segments cut to input_max_length afterwards
+                max_chars = input_max_length
+            else:
+                text = text[:input_max_length]
+                print(f"[INFO] Text too long. Using first {input_max_length} characters only.")
 
     try:
         # Execute the complete processing pipeline
-        result = process_text(
+        result = process_text_with_metadata(
             text=text,
             translator=translator,
-            summarize_model=summarize_model,
+            summarize_model=summarize_fn,
             input_max_length=input_max_length,
             sum_max_length=sum_max_length,
             sum_min_length=sum_min_length,
             num_beams=num_beams,
-            support_languages=support_languages
+            support_languages=support_languages,
+            segmented=segmented,
+            max_chars=max_chars
         )
         
-        # Detect language of the generated summary
-        detected_lang = detect_languages(result)
-        
-        return {
-            "lang": detected_lang,
-            "text": result
+        summary = {
+            "lang": result["target_lang"],
+            "text": result["text"],
+            "source_lang": result["source_lang"],
+            "status": result["status"]
         }
+        if "segment_languages" in result:
+            summary["segment_languages"] = result["segment_languages"]
+        
+        # Transient processing errors must not be cached
+        if cache_key is not None and result["status"] != STATUS_ERROR:
+            get_summary_cache().put(cache_key, summary)
+        
+        summary["cached"] = False
+        if verify_language:
+            _verify_summary_language(summary)
+        
+        return summary
         
     except Exception as e:
         return f"[ERROR] An error occurred during processing: {str(e)}"
 
 
+def _verify_summary_language(summary: Dict[str, Any]) -> None:
+    """Detect the summary language and record it next to the reported one."""
+    detected_lang = detect_languages(summary["text"])
+    summary["detected_lang"] = detected_lang
+    
+    if detected_lang != summary["lang"]:
+        print(f"[WARNING] Summary language mismatch: reported {summary['lang']}, detected {detected_lang}")
+
+
+def generate_summary_from_pdf(
+    pdf_path: str,
+    input_max_length: int = 1024,
+    sum_max_length: int = 200,
+    sum_min_length: int = 20,
+    num_beams: int = 2,
+    hierarchical: bool = True,
+    batched: bool = False,
+    use_cache: bool = True,
+    pages: Optional[Iterable[int]] = None,
+    max_chars: Optional[int] = None,
+    remove_boilerplate: bool = True,
+    verify_language: bool = False,
+    segmented: bool = False
+) -> Union[Dict[str, Any], str]:
+    """
+    Generate a summary for a PDF document.
+    
+    Extracts and preprocesses the PDF text, then runs generate_summary on it.
+    PDFs are summarized hierarchically by default so that the whole document
+    is covered rather than its first characters. Without hierarchical
+    summarization only the first input_max_length characters are used, so
+    extraction stops once PDF_EXTRACTION_HEADROOM times that much raw text
+    is available instead of parsing every page. Running headers, footers and
+    page numbers are removed before preprocessing so they do not take up the
+    model's input window; they are learned from the first
+    BOILERPLATE_SAMPLE_PAGES pages so that pages can still be streamed.
+    Pages are preprocessed as a stream, so neither the raw pages nor the
+    token lists of the whole document are held at once.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        input_max_length (int, optional): Maximum input length per model call.
+                                        Defaults to 1024.
+        sum_max_length (int, optional): Maximum length of generated summary.
+                                    Defaults to 200.
+        sum_min_length (int, optional): Minimum length of generated summary.
+                                    Defaults to 20.
+        num_beams (int, optional): Number of beams for beam search generation.
+                                Defaults to 2.
+        hierarchical (bool, optional): Use map-reduce summarization. Defaults to True.
+        batched (bool, optional): Use the micro-batching scheduler. Defaults to False.
+        use_cache (bool, optional): Use the summary cache. Defaults to True.
+        pages (Iterable[int], optional): 1-based page numbers to summarize.
+                                         Defaults to all pages.
+        max_chars (int, optional): Character budget for extraction. Defaults
+                                   to no budget when hierarchical, otherwise
+                                   input_max_length * PDF_EXTRACTION_HEADROOM.
+        remove_boilerplate (bool, optional): Strip lines repeated at the top or
+                                             bottom of many pages. Defaults to True.
+        verify_language (bool, optional): Detect the summary language for
+                                          auditing. Defaults to False.
+        segmented (bool, optional): Per-segment language routing for
+                                    mixed-language documents. Defaults to False.
+    
+    Returns:
+        Union[Dict[str, Any], str]: Same format as generate_summary, plus
+                                "input_length" (characters summarized after
+                                preprocessing); an error message string if no
+                                text could be extracted.
+        
+    Examples:
+        >>> result = generate_summary_from_pdf("report.pdf", sum_max_length=150)
+        >>> print(result["text"])
+    """
+    # Extract and preprocess text from PDF
+    print(f"[INFO] Processing PDF: {pdf_path}")
+    if max_chars is None and not hierarchical:
+        max_chars = input_max_length * PDF_EXTRACTION_HEADROOM
+    page_texts: Iterable[str] = (
+        page_text for _, page_text in iter_pdf_pages(str(pdf_path), pages=pages, max_chars=max_chars)
+    )
+    if remove_boilerplate:
+        # Repeated lines are learned from the first pages, then stripped lazily
+        page_texts = iter_strip_boilerplate(page_texts)
+    
+    extracted_chars = 0
+    
+    def counted(texts: Iterable[str]) -> Iterable[str]:
+        nonlocal extracted_chars
+        for text in texts:
+            if text and not text.isspace():
+                extracted_chars += len(text)
+            yield text
+    
+    processed_text = " ".join(preprocess_stream(counted(page_texts), separator="\n"))
+    
+    if not extracted_chars:
+        print("[WARNING] No text could be extracted from any page")
+        return "[ERROR] No text could be extracted from the PDF."
+    
+    print(f"[INFO] Extracted {len(processed_text)} characters after preprocessing.")
+    
+    if not processed_text:
+        return "[ERROR] No text left after preprocessing the PDF."
+    
+    result = generate_summary(
+        processed_text,
+        input_max_length=input_max_length,
+        sum_max_length=sum_max_length,
+        sum_min_length=sum_min_length,
+        num_beams=num_beams,
+        hierarchical=hierarchical,
+        batched=batched,
+        use_cache=use_cache,
+        verify_language=verify_language,
+        segmented=segmented
+    )
+    
+    if isinstance(result, dict):
+        result["input_length"] = len(processed_text)
+    
+    return result
+
+
 def main(file_path: str) -> None:
     """
     Main function for command-line usage.
@@ -132,24 +336,14 @@ def main(file_path: str) -> None:
         raise FileNotFoundError(f"Sample PDF file '{pdf_path}' not found.")
     
     try:
-        # Extract and preprocess text from PDF
-        print(f"[INFO] Processing PDF: {pdf_path}")
-        raw_text = extract_text_from_pdf(str(pdf_path))
-        
-        if not raw_text.strip():
-            print("[WARNING] No text extracted from PDF.")
-            return
-            
-        processed_text = preprocess(raw_text)
-        print(f"[INFO] Extracted {len(processed_text)} characters after preprocessing.")
-        
-        # Generate summary with extended input length for PDFs
-        result = generate_summary(
-            processed_text,
+        # Summarize the whole PDF with hierarchical summarization
+        result = generate_summary_from_pdf(
+            str(pdf_path),
             input_max_length=4024,  # Larger limit for PDF content
             sum_max_length=200,
             sum_min_length=20,
-            num_beams=2
+            num_beams=2,
+            hierarchical=True
         )
         
         # Display results
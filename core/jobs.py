@@ -0,0 +1,239 @@
+"""
+PDF Summarize - Asynchronous Job Module
+
+This module provides a bounded background job manager used by the web API
+to run summarization without holding a request thread for the whole
+pipeline. Clients submit work, receive a job id immediately and poll the
+job status until the result is available.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import os
+import sys
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Job states reported by JobManager.get()
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the job manager already holds the maximum number of pending jobs."""
+
+
+class _Job:
+    """State of a single submitted job."""
+    
+    def __init__(self, job_id: str, kind: str):
+        self.id = job_id
+        self.kind = kind
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.status == JOB_SUCCEEDED:
+            data["result"] = self.result
+        elif self.status == JOB_FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """
+    Bounded worker pool executing jobs in the background.
+    
+    At most `max_workers` jobs run concurrently and at most `max_pending` jobs
+    may be queued or running at once; further submissions are rejected.
+    Finished jobs are kept for `result_ttl` seconds so clients can fetch them.
+    
+    Examples:
+        >>> manager = JobManager(max_workers=2)
+        >>> job_id = manager.submit(generate_summary, "Long text...", kind="text")
+        >>> manager.get(job_id)["status"]
+        'queued'
+    """
+    
+    def __init__(self, max_workers: int = 2, max_pending: int = 100, result_ttl: float = 3600):
+        """
+        Initialize the job manager.
+        
+        Args:
+            max_workers (int, optional): Concurrent worker threads. Defaults to 2.
+            max_pending (int, optional): Maximum queued or running jobs. Defaults to 100.
+            result_ttl (float, optional): Seconds finished jobs are retained. Defaults to 3600.
+        
+        Raises:
+            ValueError: If max_workers or max_pending is invalid
+        """
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must be >= 1.")
+        
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="summary-job")
+        self._jobs: Dict[str, _Job] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    def submit(self, fn: Callable[..., Any], *args: Any, kind: str = "text", **kwargs: Any) -> str:
+        """
+        Queue a callable for background execution.
+        
+        Args:
+            fn (Callable): Function to run; its return value becomes the job result
+            *args: Positional arguments for fn
+            kind (str, optional): Label describing the job input. Defaults to "text".
+            **kwargs: Keyword arguments for fn
+        
+        Returns:
+            str: The new job id
+        
+        Raises:
+            JobQueueFullError: If max_pending jobs are already queued or running
+        """
+        self._purge_expired()
+        
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFullError(
+                    f"Job queue is full ({self.max_pending} pending jobs)"
+                )
+            job = _Job(uuid.uuid4().hex, kind)
+            self._jobs[job.id] = job
+            self._pending += 1
+        
+        try:
+            self._executor.submit(self._run, job, fn, args, kwargs)
+        except Exception:
+            # Executor refused the job (e.g. after shutdown): roll back
+            with self._lock:
+                self._jobs.pop(job.id, None)
+                self._pending -= 1
+            raise
+        
+        return job.id
+    
+    def _run(self, job: _Job, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        """Execute a job and record its outcome."""
+        with self._lock:
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+        
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                job.status = JOB_FAILED
+                job.error = str(e)
+        else:
+            with self._lock:
+                job.status = JOB_SUCCEEDED
+                job.result = result
+        finally:
+            with self._lock:
+                job.finished_at = time.time()
+                self._pending -= 1
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a job, including its result once finished.
+        
+        Args:
+            job_id (str): Id returned by submit()
+        
+        Returns:
+            Optional[Dict[str, Any]]: Job status, or None if unknown or expired
+        """
+        self._purge_expired()
+        
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job is not None else None
+    
+    def _purge_expired(self) -> None:
+        """Drop finished jobs older than result_ttl."""
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get job manager metrics.
+        
+        Returns:
+            Dict[str, Any]: Job counts per status and pool limits
+        """
+        with self._lock:
+            counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_SUCCEEDED: 0, JOB_FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return {
+                "jobs": counts,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "max_workers": self.max_workers
+            }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=wait)
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    Get the process-wide job manager, creating it on first use.
+    
+    Configured through the JOB_WORKERS (default 2), JOB_MAX_PENDING
+    (default 100) and JOB_RESULT_TTL (seconds, default 3600) variables.
+    
+    Returns:
+        JobManager: The shared job manager
+    """
+    global _job_manager
+    
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = JobManager(
+                    max_workers=int(os.environ.get("JOB_WORKERS", 2)),
+                    max_pending=int(os.environ.get("JOB_MAX_PENDING", 100)),
+                    result_ttl=float(os.environ.get("JOB_RESULT_TTL", 3600))
+                )
+    
+    return _job_manager
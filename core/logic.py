@@ -11,12 +11,36 @@ License: MIT
 
 import os
 import sys
-from typing import Callable, List, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.languages_detect import detect_languages
+from utils.languages_detect import detect_languages, detect_segments
+
+
+# Prefix of the message returned when processing fails with an exception
+PROCESSING_ERROR_PREFIX = "Error during text processing"
+
+# Status values reported by process_text_with_metadata()
+STATUS_SUCCESS = "success"  # Summary produced
+STATUS_FAILED = "failed"    # Deterministic failure (language, translation, empty output)
+STATUS_ERROR = "error"      # Exception raised; may be transient
+
+
+def _result(
+    text: str,
+    status: str,
+    source_lang: Optional[str] = None,
+    target_lang: Optional[str] = "en"
+) -> Dict[str, Any]:
+    """Build a process_text_with_metadata() result; messages are in English."""
+    return {
+        "text": text,
+        "status": status,
+        "source_lang": source_lang,
+        "target_lang": target_lang
+    }
 
 
 def process_text(
@@ -32,6 +56,9 @@ def process_text(
     """
     Process text through the complete summarization pipeline.
     
+    Returns only the final text; see process_text_with_metadata() for the
+    source language, the language of the output and the processing status.
+    
     This function implements the core logic for multilingual text summarization:
     1. Detect the source language of the input text
     2. Translate to English if necessary (for non-English languages)
@@ -48,18 +75,18 @@ def process_text(
         sum_min_length (int): Minimum length of generated summary
         num_beams (int): Number of beams for beam search generation
         support_languages (List[str]): List of supported language codes
-        
+    
     Returns:
         str: The final summary text in the original language, or error message
-        
+    
     Raises:
         Exception: Various exceptions may be raised during processing steps
-        
+    
     Processing Flow:
         - For English text: Direct summarization
         - For supported non-English text: Translate → Summarize → Translate back
         - For unsupported languages: Return error message
-        
+    
     Examples:
         >>> # English text (direct processing)
         >>> result = process_text(
@@ -85,13 +112,87 @@ def process_text(
         ...     support_languages=['en', 'fr', 'es']
         ... )
     """
+    return process_text_with_metadata(
+        text=text,
+        translator=translator,
+        summarize_model=summarize_model,
+        input_max_length=input_max_length,
+        sum_max_length=sum_max_length,
+        sum_min_length=sum_min_length,
+        num_beams=num_beams,
+        support_languages=support_languages
+    )["text"]
+
+
+def process_text_with_metadata(
+    text: str,
+    translator: 'Translator',
+    summarize_model: Callable,
+    input_max_length: int,
+    sum_max_length: int,
+    sum_min_length: int,
+    num_beams: int,
+    support_languages: List[str],
+    segmented: bool = False,
+    max_chars: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Process text through the summarization pipeline and report its languages.
+    
+    Runs the same steps as process_text(), but also returns what the pipeline
+    already knows: the detected source language and the language of the
+    returned text. Callers do not need to detect the summary language again.
+    
+    With `segmented`, mixed-language documents are handled per paragraph
+    segment instead (see _process_segments()).
+    
+    Args:
+        Same as process_text(), plus:
+        segmented (bool, optional): Detect languages per segment and translate
+                                    only non-English segments. Defaults to False.
+        max_chars (int, optional): With `segmented`, characters of the text
+                                   to summarize; segments are detected over
+                                   the whole text first. Defaults to no limit.
+    
+    Returns:
+        Dict[str, Any]: {
+            "text": str,                  # Summary, or a message on failure
+            "status": str,                # STATUS_SUCCESS, STATUS_FAILED or STATUS_ERROR
+            "source_lang": Optional[str], # Detected input language
+            "target_lang": Optional[str], # Language of "text" ("en" for messages)
+            "segment_languages": dict     # Characters per language (segmented only)
+        }
+    
+    Examples:
+        >>> result = process_text_with_metadata(
+        ...     text="Article français à résumer...",
+        ...     translator=translator_instance,
+        ...     summarize_model=bart_model,
+        ...     input_max_length=1024,
+        ...     sum_max_length=200,
+        ...     sum_min_length=20,
+        ...     num_beams=2,
+        ...     support_languages=['en', 'fr', 'es']
+        ... )
+        >>> result["source_lang"], result["target_lang"], result["status"]
+        ('fr', 'fr', 'success')
+    """
+    if segmented:
+        return _process_segments(
+            text, translator, summarize_model, input_max_length,
+            sum_max_length, sum_min_length, num_beams, support_languages,
+            max_chars
+        )
+    
+    text_lang = None
+    
     try:
         # Step 1: Detect the language of input text
         text_lang = detect_languages(text)
         print(f"[INFO] Detected language: {text_lang}")
         
         if text_lang is None:
-            return "Unable to detect text language."
+            return _result("Unable to detect text language.", STATUS_FAILED)
         
         # Step 2: Process based on detected language
         if text_lang == "en":
@@ -104,8 +205,8 @@ def process_text(
                 sum_min_length=sum_min_length,
                 num_beams=num_beams,
             )
-            return summary
-            
+            return _result(summary, STATUS_SUCCESS, text_lang, text_lang)
+        
         elif text_lang in support_languages:
             # Translation pipeline for supported non-English languages
             print(f"[INFO] Processing {text_lang} text with translation pipeline")
@@ -115,7 +216,7 @@ def process_text(
             translated_text = translator.translate(text, direction="XToEN")
             
             if not translated_text or not translated_text.strip():
-                return "Translation to English failed."
+                return _result("Translation to English failed.", STATUS_FAILED, text_lang)
             
             print(f"[INFO] Translation successful: {len(translated_text)} characters")
             
@@ -130,7 +231,7 @@ def process_text(
             )
             
             if not english_summary or not english_summary.strip():
-                return "Summary generation failed."
+                return _result("Summary generation failed.", STATUS_FAILED, text_lang)
             
             # Step 2c: Translate summary back to original language
             print(f"[INFO] Translating summary back to {text_lang}...")
@@ -140,19 +241,135 @@ def process_text(
             final_summary = translator.translate(prefixed_summary, direction="EnToX")
             
             if not final_summary or not final_summary.strip():
-                return "Back-translation failed."
-                
-            print("[INFO] Processing completed successfully")
-            return final_summary
+                return _result("Back-translation failed.", STATUS_FAILED, text_lang)
             
+            print("[INFO] Processing completed successfully")
+            return _result(final_summary, STATUS_SUCCESS, text_lang, text_lang)
+        
         else:
             # Unsupported language
-            return f"Language '{text_lang}' is not supported. Supported languages: {', '.join(support_languages)}"
+            return _result(
+                f"Language '{text_lang}' is not supported. Supported languages: {', '.join(support_languages)}",
+                STATUS_FAILED,
+                text_lang
+            )
+    
+    except Exception as e:
+        error_msg = f"{PROCESSING_ERROR_PREFIX}: {str(e)}"
+        print(f"[ERROR] {error_msg}")
+        return _result(error_msg, STATUS_ERROR, text_lang)
+
+
+def _process_segments(
+    text: str,
+    translator: 'Translator',
+    summarize_model: Callable,
+    input_max_length: int,
+    sum_max_length: int,
+    sum_min_length: int,
+    num_beams: int,
+    support_languages: List[str],
+    max_chars: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Summarize a possibly mixed-language document segment by segment.
+    
+    English segments go to the summarizer unchanged; all other segments are
+    translated to English in one batched translate call. The summary is
+    translated back into the dominant language (the one covering the most
+    characters). Languages are detected over the whole text, so the dominant
+    language and the supported-language check cover the entire document even
+    when `max_chars` limits what is translated and summarized.
+    
+    Returns:
+        Dict[str, Any]: Same format as process_text_with_metadata()
+    """
+    dominant = None
+    
+    try:
+        segments = detect_segments(text)
+        
+        segment_languages: Dict[str, int] = {}
+        for segment, lang in segments:
+            if lang is not None:
+                segment_languages[lang] = segment_languages.get(lang, 0) + len(segment)
+        
+        if not segment_languages:
+            return _result("Unable to detect text language.", STATUS_FAILED)
+        
+        dominant = max(segment_languages, key=segment_languages.get)
+        print(f"[INFO] Segment languages: {segment_languages} (dominant: {dominant})")
+        
+        unsupported = [lang for lang in segment_languages if lang not in support_languages]
+        if unsupported:
+            return _result(
+                f"Language '{unsupported[0]}' is not supported. Supported languages: {', '.join(support_languages)}",
+                STATUS_FAILED,
+                dominant
+            )
+        
+        if max_chars is not None:
+            segments = _truncate_segments(segments, max_chars)
+            print(f"[INFO] Text too long. Using first {max_chars} characters only.")
+        
+        # Translate only the non-English segments, batched in one call
+        foreign = [index for index, (_, lang) in enumerate(segments) if lang != "en"]
+        english_segments = [segment for segment, _ in segments]
+        
+        if foreign:
+            print(f"[INFO] Translating {len(foreign)} of {len(segments)} segments to English...")
+            translated = translator.translate(
+                [segments[index][0] for index in foreign], direction="XToEN"
+            )
+            for index, translated_segment in zip(foreign, translated):
+                if not translated_segment or not translated_segment.strip():
+                    return _result("Translation to English failed.", STATUS_FAILED, dominant)
+                english_segments[index] = translated_segment
+        
+        print("[INFO] Generating summary...")
+        english_summary = summarize_model(
+            text="\n".join(english_segments),
+            input_max_length=input_max_length,
+            sum_max_length=sum_max_length,
+            sum_min_length=sum_min_length,
+            num_beams=num_beams,
+        )
+        
+        if not english_summary or not english_summary.strip():
+            return _result("Summary generation failed.", STATUS_FAILED, dominant)
+        
+        final_summary = english_summary
+        if dominant != "en":
+            print(f"[INFO] Translating summary back to {dominant}...")
+            final_summary = translator.translate(f">>{dominant}<< {english_summary}", direction="EnToX")
+            
+            if not final_summary or not final_summary.strip():
+                return _result("Back-translation failed.", STATUS_FAILED, dominant)
+        
+        print("[INFO] Processing completed successfully")
+        result = _result(final_summary, STATUS_SUCCESS, dominant, dominant)
+        result["segment_languages"] = segment_languages
+        return result
     
     except Exception as e:
-        error_msg = f"Error during text processing: {str(e)}"
+        error_msg = f"{PROCESSING_ERROR_PREFIX}: {str(e)}"
         print(f"[ERROR] {error_msg}")
-        return error_msg
+        return _result(error_msg, STATUS_ERROR, dominant)
+
+
+def _truncate_segments(
+    segments: List[Tuple[str, Optional[str]]],
+    max_chars: int
+) -> List[Tuple[str, Optional[str]]]:
+    """Keep the leading segments covering at most max_chars characters."""
+    kept = []
+    remaining = max_chars
+    for segment, lang in segments:
+        if remaining <= 0:
+            break
+        kept.append((segment[:remaining], lang))
+        remaining -= len(segment) + 1  # Segments are joined by newlines
+    return kept
 
 
 def validate_input_parameters(
@@ -171,7 +388,7 @@ def validate_input_parameters(
         sum_max_length (int): Maximum summary length parameter
         sum_min_length (int): Minimum summary length parameter
         num_beams (int): Number of beams parameter
-        
+    
     Returns:
         Union[str, None]: Error message if validation fails, None if valid
     """
@@ -205,7 +422,7 @@ def get_processing_stats(
         text (str): Original input text
         summary (str): Generated summary
         detected_language (str): Detected language code
-        
+    
     Returns:
         dict: Processing statistics
     """
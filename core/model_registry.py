@@ -0,0 +1,231 @@
+"""
+PDF Summarize - Model Registry Module
+
+This module provides a process-wide registry that owns the heavy model
+instances (BART summarizer and MarianMT translator). Each model is loaded
+exactly once per process and shared read-only between requests, and the
+registry records load state and load time so the web API can report readiness.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import os
+import sys
+import time
+import threading
+from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Load states reported by ModelRegistry.status()
+STATE_NOT_LOADED = "not_loaded"
+STATE_LOADING = "loading"
+STATE_LOADED = "loaded"
+STATE_FAILED = "failed"
+
+# Default location of the cached translation models
+TRANSLATION_MODEL_DIR = Path(__file__).parent.parent / "models" / "translation_models"
+
+
+class _ModelEntry:
+    """Bookkeeping for a single registered model."""
+
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.instance: Any = None
+        self.state = STATE_NOT_LOADED
+        self.load_time: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Thread-safe registry of lazily loaded, process-wide model instances.
+
+    Models are registered by name with a zero-argument loader. The first call
+    to get() runs the loader under a per-model lock; concurrent callers block
+    until loading completes and then receive the same shared instance.
+
+    Examples:
+        >>> registry = ModelRegistry()
+        >>> registry.register("translator", lambda: Translator("./models"))
+        >>> translator = registry.get("translator")
+        >>> registry.status()["translator"]["state"]
+        'loaded'
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """
+        Register a model loader under the given name.
+
+        Args:
+            name (str): Registry key for the model
+            loader (Callable[[], Any]): Function that builds the model instance
+        """
+        with self._lock:
+            self._entries[name] = _ModelEntry(loader)
+
+    def _entry(self, name: str) -> _ModelEntry:
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown model '{name}'")
+        return entry
+
+    def get(self, name: str) -> Any:
+        """
+        Return the shared instance for a model, loading it on first use.
+
+        Args:
+            name (str): Registry key for the model
+
+        Returns:
+            Any: The loaded model instance
+
+        Raises:
+            KeyError: If no loader is registered under the name
+            RuntimeError: If the loader fails
+        """
+        entry = self._entry(name)
+
+        # Fast path: already loaded, no locking required
+        if entry.state == STATE_LOADED:
+            return entry.instance
+
+        with entry.lock:
+            if entry.state == STATE_LOADED:
+                return entry.instance
+
+            entry.state = STATE_LOADING
+            start_time = time.perf_counter()
+            try:
+                instance = entry.loader()
+            except Exception as e:
+                entry.state = STATE_FAILED
+                entry.error = str(e)
+                raise RuntimeError(f"Failed to load model '{name}': {str(e)}") from e
+
+            entry.instance = instance
+            entry.load_time = time.perf_counter() - start_time
+            entry.loaded_at = time.time()
+            entry.error = None
+            entry.state = STATE_LOADED
+            print(f"[INFO] Model '{name}' loaded in {entry.load_time:.2f}s")
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        """Return True if the named model has been loaded."""
+        return self._entry(name).state == STATE_LOADED
+
+    def preload(self, *names: str) -> Dict[str, bool]:
+        """
+        Load the given models (all registered models if none are given).
+
+        Returns:
+            Dict[str, bool]: Load success per model name
+        """
+        if not names:
+            with self._lock:
+                names = tuple(self._entries)
+
+        results = {}
+        for name in names:
+            try:
+                self.get(name)
+                results[name] = True
+            except RuntimeError as e:
+                print(f"[WARNING] {e}")
+                results[name] = False
+        return results
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the load state of every registered model.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per-model state, load time and last error
+        """
+        with self._lock:
+            entries = dict(self._entries)
+
+        return {
+            name: {
+                "state": entry.state,
+                "load_time": round(entry.load_time, 3) if entry.load_time is not None else None,
+                "loaded_at": entry.loaded_at,
+                "error": entry.error,
+            }
+            for name, entry in entries.items()
+        }
+
+    def is_ready(self) -> bool:
+        """Return True when every registered model is loaded."""
+        return all(info["state"] == STATE_LOADED for info in self.status().values())
+
+
+def _env_float(name: str) -> Optional[float]:
+    """Read an optional float setting from the environment."""
+    value = os.environ.get(name)
+    return float(value) if value else None
+
+
+def _load_translator() -> Any:
+    """
+    Build the shared MarianMT translator.
+    
+    Translation directions are loaded lazily by the Translator itself; idle
+    eviction and the memory budget are configured through the
+    TRANSLATOR_IDLE_TIMEOUT (seconds) and TRANSLATOR_MAX_MEMORY_MB variables.
+    """
+    from src.translator_models import Translator
+    return Translator(
+        model_dir=str(TRANSLATION_MODEL_DIR),
+        idle_timeout=_env_float("TRANSLATOR_IDLE_TIMEOUT"),
+        max_memory_mb=_env_float("TRANSLATOR_MAX_MEMORY_MB")
+    )
+
+
+def _load_bart() -> Any:
+    """Build the shared BART model and tokenizer pair."""
+    from core.summarizer import _build_model
+    return _build_model()
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ModelRegistry:
+    """
+    Get the process-wide model registry, creating it on first use.
+
+    Returns:
+        ModelRegistry: Registry with the "bart" and "translator" models registered
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = ModelRegistry()
+                registry.register("bart", _load_bart)
+                registry.register("translator", _load_translator)
+                _registry = registry
+
+    return _registry
+
+
+def get_translator() -> Any:
+    """Get the shared Translator instance."""
+    return get_registry().get("translator")
@@ -14,56 +14,198 @@ License: MIT
 
 import os
 import sys
+import json
+import hashlib
 from pathlib import Path
+from typing import Any, Dict, List
 
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from transformers import AutoTokenizer, BartForConditionalGeneration
 
+from core.model_registry import get_registry
 
-# Global model and tokenizer instances for reuse
-_model = None
-_tokenizer = None
 
+# Local model snapshot and the manifest that marks it complete
+BART_MODEL_NAME = "facebook/bart-large-cnn"
+BART_LOCAL_DIR = Path(__file__).parent.parent / "models" / "Bart"
+MANIFEST_NAME = "manifest.json"
+# Records the size and mtime of files whose hashes have been verified
+VERIFIED_MARKER_NAME = ".verified.json"
 
-def _load_model() -> tuple[BartForConditionalGeneration, AutoTokenizer]:
+
+def _file_sha256(path: Path) -> str:
+    """Compute the SHA-256 digest of a file in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_manifest(local_dir: Path, model_name: str) -> None:
+    """
+    Record the size and SHA-256 of every file in a model snapshot.
+    
+    The manifest is written last, so its presence marks a complete snapshot.
+    """
+    files = {
+        str(path.relative_to(local_dir)): {
+            "size": path.stat().st_size,
+            "sha256": _file_sha256(path)
+        }
+        for path in sorted(local_dir.rglob("*"))
+        if path.is_file() and path.name not in (MANIFEST_NAME, VERIFIED_MARKER_NAME)
+    }
+    
+    manifest = {"model_name": model_name, "files": files}
+    tmp_path = local_dir / (MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, local_dir / MANIFEST_NAME)
+    _write_verified_marker(local_dir, files)
+
+
+def _file_stamps(local_dir: Path, relative_paths) -> Dict[str, List[int]]:
+    """Map each file to its [size, mtime_ns], used to detect changes since verification."""
+    stamps = {}
+    for relative_path in relative_paths:
+        stat = (local_dir / relative_path).stat()
+        stamps[relative_path] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def _write_verified_marker(local_dir: Path, files: Dict[str, Any]) -> None:
+    """Record that the given snapshot files matched their manifest hashes."""
+    tmp_path = local_dir / (VERIFIED_MARKER_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(_file_stamps(local_dir, files)))
+    os.replace(tmp_path, local_dir / VERIFIED_MARKER_NAME)
+
+
+def _verified_marker_matches(local_dir: Path, files: Dict[str, Any]) -> bool:
+    """Check whether no snapshot file changed since its hashes were last verified."""
+    try:
+        marker = json.loads((local_dir / VERIFIED_MARKER_NAME).read_text())
+        return marker == _file_stamps(local_dir, files)
+    except (OSError, ValueError):
+        return False
+
+
+def _snapshot_is_valid(local_dir: Path, model_name: str, verify_hashes: bool = True) -> bool:
+    """
+    Check a local model snapshot against its manifest.
+    
+    File presence and sizes are always checked. SHA-256 hashes are verified
+    too, but only once: after a successful check the size and mtime of every
+    file are recorded, and later starts skip hashing while they still match.
+    
+    Args:
+        local_dir (Path): Snapshot directory
+        model_name (str): Expected Hugging Face model identifier
+        verify_hashes (bool, optional): Also verify file hashes. Defaults to True.
+        
+    Returns:
+        bool: True if the snapshot is complete and matches the manifest
+    """
+    manifest_path = local_dir / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return False
+    
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return False
+    
+    if manifest.get("model_name") != model_name or not manifest.get("files"):
+        return False
+    
+    files = manifest["files"]
+    for relative_path, expected in files.items():
+        path = local_dir / relative_path
+        if not path.is_file() or path.stat().st_size != expected["size"]:
+            print(f"[WARNING] Local model file missing or incomplete: {path}")
+            return False
+    
+    if not verify_hashes or _verified_marker_matches(local_dir, files):
+        return True
+    
+    print(f"[INFO] Verifying local model file hashes: {local_dir}")
+    for relative_path, expected in files.items():
+        path = local_dir / relative_path
+        if _file_sha256(path) != expected["sha256"]:
+            print(f"[WARNING] Local model file hash mismatch: {path}")
+            return False
+    
+    _write_verified_marker(local_dir, files)
+    return True
+
+
+def _build_model() -> tuple[BartForConditionalGeneration, AutoTokenizer]:
     """
-    Load and cache the BART model and tokenizer.
+    Load the BART model and tokenizer, preferring the local snapshot.
+    
+    The model is loaded from models/Bart when a snapshot with a valid manifest
+    exists. Otherwise it is downloaded from Hugging Face once, saved locally
+    and a manifest is written. It is invoked once per process by the model
+    registry; use _load_model() to get the shared pair.
     
-    This function loads the Facebook BART-large-CNN model for summarization
-    and caches it locally to avoid repeated downloads.
+    Environment:
+        BART_OFFLINE / HF_HUB_OFFLINE: Set to 1 to never contact the hub
+        BART_VERIFY_HASHES: Set to 0 to skip verifying file hashes before loading
     
     Returns:
         tuple: (model, tokenizer) - The loaded BART model and its tokenizer
         
     Raises:
-        RuntimeError: If model loading fails
+        RuntimeError: If model loading fails, or no valid snapshot exists offline
     """
-    global _model, _tokenizer
+    offline = os.environ.get("BART_OFFLINE") == "1" or os.environ.get("HF_HUB_OFFLINE") == "1"
+    verify_hashes = os.environ.get("BART_VERIFY_HASHES") != "0"
+    local_dir = BART_LOCAL_DIR
     
-    if _model is None or _tokenizer is None:
-        try:
-            # Define local directory for model caching
-            local_dir = Path(__file__).parent.parent / "models" / "Bart"
-            local_dir.mkdir(parents=True, exist_ok=True)
-            
-            model_name = "facebook/bart-large-cnn"
-            
-            # Load model and tokenizer from Hugging Face
-            print(f"[INFO] Loading BART model: {model_name}")
-            _model = BartForConditionalGeneration.from_pretrained(model_name)
-            _tokenizer = AutoTokenizer.from_pretrained(model_name)
-            
-            # Cache models locally for future use
-            _model.save_pretrained(local_dir)
-            _tokenizer.save_pretrained(local_dir)
-            print(f"[INFO] Models cached to: {local_dir}")
-            
-        except Exception as e:
-            raise RuntimeError(f"Failed to load BART model: {str(e)}") from e
+    try:
+        if _snapshot_is_valid(local_dir, BART_MODEL_NAME, verify_hashes):
+            print(f"[INFO] Loading BART model from local snapshot: {local_dir}")
+            model = BartForConditionalGeneration.from_pretrained(local_dir, local_files_only=True)
+            tokenizer = AutoTokenizer.from_pretrained(local_dir, local_files_only=True)
+            return model, tokenizer
+        
+        if offline:
+            raise RuntimeError(f"No valid local snapshot in {local_dir} and offline mode is enabled")
+        
+        # Load model and tokenizer from Hugging Face
+        print(f"[INFO] Downloading BART model: {BART_MODEL_NAME}")
+        model = BartForConditionalGeneration.from_pretrained(BART_MODEL_NAME)
+        tokenizer = AutoTokenizer.from_pretrained(BART_MODEL_NAME)
+        
+        # Cache models locally for future use; the manifest is written last
+        local_dir.mkdir(parents=True, exist_ok=True)
+        (local_dir / MANIFEST_NAME).unlink(missing_ok=True)
+        (local_dir / VERIFIED_MARKER_NAME).unlink(missing_ok=True)
+        model.save_pretrained(local_dir)
+        tokenizer.save_pretrained(local_dir)
+        _write_manifest(local_dir, BART_MODEL_NAME)
+        print(f"[INFO] Models cached to: {local_dir}")
+        
+    except Exception as e:
+        raise RuntimeError(f"Failed to load BART model: {str(e)}") from e
+    
+    return model, tokenizer
+
+
+def _load_model() -> tuple[BartForConditionalGeneration, AutoTokenizer]:
+    """
+    Get the shared BART model and tokenizer from the model registry.
+    
+    The pair is loaded once per process and shared read-only between callers.
     
-    return _model, _tokenizer
+    Returns:
+        tuple: (model, tokenizer) - The loaded BART model and its tokenizer
+        
+    Raises:
+        RuntimeError: If model loading fails
+    """
+    return get_registry().get("bart")
 
 
 def summarize_model(
@@ -113,10 +255,11 @@ def summarize_model(
     model, tokenizer = _load_model()
     
     try:
-        # Tokenize input text with proper truncation
+        # Tokenize input text with proper truncation (never beyond the
+        # model's position embeddings, which would fail inside generate)
         input_tokens = tokenizer(
             [text],
-            max_length=input_max_length,
+            max_length=min(input_max_length, model.config.max_position_embeddings),
             return_tensors="pt",
             truncation=True,
             padding=True
@@ -150,6 +293,279 @@ def summarize_model(
         raise RuntimeError(f"Summarization failed: {str(e)}") from e
 
 
+def _generate_from_ids(
+    model: BartForConditionalGeneration,
+    tokenizer: AutoTokenizer,
+    batch_ids: List[List[int]],
+    sum_max_length: int,
+    sum_min_length: int,
+    num_beams: int
+) -> List[str]:
+    """
+    Run one batched generate call over pre-tokenized inputs.
+    
+    Args:
+        model (BartForConditionalGeneration): Loaded BART model
+        tokenizer (AutoTokenizer): Matching tokenizer
+        batch_ids (List[List[int]]): Token ids per input, special tokens included
+        sum_max_length (int): Maximum length of each generated summary
+        sum_min_length (int): Minimum length of each generated summary
+        num_beams (int): Number of beams for beam search decoding
+        
+    Returns:
+        List[str]: One summary per input, in input order
+    """
+    padded = tokenizer.pad({"input_ids": batch_ids}, return_tensors="pt")
+    
+    summary_ids = model.generate(
+        padded["input_ids"],
+        attention_mask=padded["attention_mask"],
+        max_length=sum_max_length,
+        min_length=sum_min_length,
+        num_beams=num_beams,
+        early_stopping=True,
+        no_repeat_ngram_size=3,
+        do_sample=False
+    )
+    
+    summaries = tokenizer.batch_decode(
+        summary_ids,
+        skip_special_tokens=True,
+        clean_up_tokenization_spaces=False
+    )
+    return [summary.strip() for summary in summaries]
+
+
+def summarize_batch(
+    texts: List[str],
+    input_max_length: int,
+    sum_max_length: int,
+    sum_min_length: int,
+    num_beams: int,
+    batch_size: int = 8
+) -> List[str]:
+    """
+    Generate summaries for many texts using batched BART generation.
+    
+    Inputs are tokenized once, sorted by token length and grouped into buckets
+    of similar length so that padding per bucket is minimal. Each bucket is
+    summarized with a single generate call and results are returned in the
+    original input order.
+    
+    Args:
+        texts (List[str]): The input texts to summarize
+        input_max_length (int): Maximum length for input tokenization
+        sum_max_length (int): Maximum length of each generated summary
+        sum_min_length (int): Minimum length of each generated summary
+        num_beams (int): Number of beams for beam search decoding
+        batch_size (int, optional): Maximum texts per generate call. Defaults to 8.
+        
+    Returns:
+        List[str]: One summary per input text, in input order
+        
+    Raises:
+        ValueError: If any input text is empty or invalid
+        RuntimeError: If summarization process fails
+        
+    Examples:
+        >>> summaries = summarize_batch(
+        ...     ["First article...", "Second article..."],
+        ...     input_max_length=1024,
+        ...     sum_max_length=150,
+        ...     sum_min_length=50,
+        ...     num_beams=2
+        ... )
+        >>> len(summaries)
+        2
+    """
+    # Input validation
+    for text in texts:
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("Input texts must be non-empty strings.")
+    
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1.")
+    
+    if not texts:
+        return []
+    
+    model, tokenizer = _load_model()
+    
+    try:
+        encoded = tokenizer(
+            list(texts),
+            max_length=min(input_max_length, model.config.max_position_embeddings),
+            truncation=True
+        )["input_ids"]
+        
+        # Length-bucketing: neighbours in sorted order need little padding
+        order = sorted(range(len(encoded)), key=lambda i: len(encoded[i]))
+        summaries: List[str] = [""] * len(encoded)
+        
+        for start in range(0, len(order), batch_size):
+            bucket = order[start:start + batch_size]
+            results = _generate_from_ids(
+                model,
+                tokenizer,
+                [encoded[i] for i in bucket],
+                sum_max_length,
+                sum_min_length,
+                num_beams
+            )
+            for index, summary in zip(bucket, results):
+                summaries[index] = summary
+        
+        print(f"[INFO] Generated {len(summaries)} summaries in "
+              f"{(len(order) + batch_size - 1) // batch_size} batches")
+        return summaries
+        
+    except Exception as e:
+        raise RuntimeError(f"Summarization failed: {str(e)}") from e
+
+
+def _split_windows(token_ids: List[int], window: int, overlap: int) -> List[List[int]]:
+    """Split a token stream into windows of at most `window` tokens sharing `overlap` tokens."""
+    if len(token_ids) <= window:
+        return [token_ids]
+    
+    stride = max(window - overlap, 1)
+    windows = []
+    for start in range(0, len(token_ids), stride):
+        windows.append(token_ids[start:start + window])
+        if start + window >= len(token_ids):
+            break
+    return windows
+
+
+def summarize_long_model(
+    text: str,
+    input_max_length: int,
+    sum_max_length: int,
+    sum_min_length: int,
+    num_beams: int,
+    window_overlap: int = 128,
+    batch_size: int = 4,
+    fan_in: int = 8,
+    max_depth: int = 3
+) -> str:
+    """
+    Summarize text of any length with hierarchical map-reduce summarization.
+    
+    The full token stream is split into overlapping windows that fit the BART
+    context (map), windows are summarized in batches, and the concatenated
+    partial summaries are summarized again in groups of `fan_in` until they fit
+    a single window or `max_depth` levels have been used (reduce). Documents
+    needing more than fan_in ** max_depth windows are covered by evenly spaced
+    windows, so the number of generate calls stays bounded; a warning reports
+    how much of the text was skipped.
+    
+    The signature extends summarize_model, so this function can be passed to
+    process_text wherever summarize_model is accepted.
+    
+    Args:
+        text (str): The input text to summarize
+        input_max_length (int): Maximum tokens per window (capped at the model limit)
+        sum_max_length (int): Maximum length of each generated summary
+        sum_min_length (int): Minimum length of each generated summary
+        num_beams (int): Number of beams for beam search decoding
+        window_overlap (int, optional): Tokens shared by consecutive windows. Defaults to 128.
+        batch_size (int, optional): Windows per generate call. Defaults to 4.
+        fan_in (int, optional): Partial summaries merged per reduce step. Defaults to 8.
+        max_depth (int, optional): Maximum number of reduce levels. Defaults to 3.
+        
+    Returns:
+        str: The generated summary text
+        
+    Raises:
+        ValueError: If input text is empty or parameters are invalid
+        RuntimeError: If summarization process fails
+        
+    Examples:
+        >>> summary = summarize_long_model(
+        ...     text=forty_page_report,
+        ...     input_max_length=1024,
+        ...     sum_max_length=200,
+        ...     sum_min_length=20,
+        ...     num_beams=2
+        ... )
+    """
+    # Input validation
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("Input text must be a non-empty string.")
+    
+    if fan_in < 2 or max_depth < 1 or batch_size < 1:
+        raise ValueError("fan_in must be >= 2, max_depth and batch_size must be >= 1.")
+    
+    model, tokenizer = _load_model()
+    
+    # Room for the special tokens added around every window
+    num_special = tokenizer.num_special_tokens_to_add()
+    window = min(input_max_length, model.config.max_position_embeddings) - num_special
+    overlap = min(window_overlap, window // 2)
+    
+    def summarize_windows(windows: List[List[int]]) -> List[str]:
+        summaries = []
+        for start in range(0, len(windows), batch_size):
+            batch = [
+                tokenizer.build_inputs_with_special_tokens(ids)
+                for ids in windows[start:start + batch_size]
+            ]
+            summaries.extend(_generate_from_ids(
+                model, tokenizer, batch, sum_max_length, sum_min_length, num_beams
+            ))
+        return summaries
+    
+    def encode(segment: str) -> List[int]:
+        return tokenizer(segment, add_special_tokens=False, truncation=False)["input_ids"]
+    
+    try:
+        token_ids = encode(text)
+        print(f"[INFO] Input tokenized to {len(token_ids)} tokens")
+        
+        if len(token_ids) <= window:
+            return summarize_windows([token_ids])[0]
+        
+        # Map: summarize overlapping windows of the full document
+        windows = _split_windows(token_ids, window, overlap)
+        max_windows = fan_in ** max_depth
+        if len(windows) > max_windows:
+            step = len(windows) / max_windows
+            print(
+                f"[WARNING] Document needs {len(windows)} windows but fan_in ** max_depth "
+                f"allows {max_windows}; {len(windows) - max_windows} windows "
+                f"({1 - max_windows / len(windows):.0%} of the text) will be skipped. "
+                f"Raise max_depth or fan_in to cover the whole document."
+            )
+            windows = [windows[int(i * step)] for i in range(max_windows)]
+        
+        print(f"[INFO] Summarizing {len(windows)} windows")
+        summaries = summarize_windows(windows)
+        
+        # Reduce: merge partial summaries in groups until they fit one window
+        for depth in range(1, max_depth + 1):
+            merged_ids = encode(" ".join(summaries))
+            if len(summaries) == 1 or len(merged_ids) <= window:
+                break
+            
+            groups = [
+                encode(" ".join(summaries[start:start + fan_in]))[:window]
+                for start in range(0, len(summaries), fan_in)
+            ]
+            print(f"[INFO] Reduce level {depth}: {len(summaries)} summaries -> {len(groups)}")
+            summaries = summarize_windows(groups)
+        
+        if len(summaries) == 1:
+            summary = summaries[0]
+        else:
+            summary = summarize_windows([encode(" ".join(summaries))[:window]])[0]
+        
+        print(f"[INFO] Summary generated: {len(summary)} characters")
+        return summary
+        
+    except Exception as e:
+        raise RuntimeError(f"Summarization failed: {str(e)}") from e
+
+
 def get_model_info() -> dict:
     """
     Get information about the loaded BART model.
@@ -160,13 +576,13 @@ def get_model_info() -> dict:
     model, tokenizer = _load_model()
     
     return {
-        "model_name": "facebook/bart-large-cnn",
+        "model_name": BART_MODEL_NAME,
         "model_type": "BartForConditionalGeneration",
         "tokenizer_type": "BartTokenizer",
         "vocab_size": tokenizer.vocab_size,
         "max_position_embeddings": model.config.max_position_embeddings,
         "num_parameters": sum(p.numel() for p in model.parameters()),
-        "is_loaded": _model is not None and _tokenizer is not None
+        "is_loaded": get_registry().is_loaded("bart")
     }
 
 
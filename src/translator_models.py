@@ -11,10 +11,13 @@ License: MIT
 """
 
 import os
+import re
 import sys
 from typing import Dict, Optional, List, Tuple, Union
 from pathlib import Path
 import logging
+import threading
+import time
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -34,14 +37,21 @@ class Translator:
     (Romanian, Spanish, French, Italian, Portuguese, Catalan) and English using
     pre-trained Helsinki-NLP MarianMT models with local caching support.
     
+    Each direction is loaded lazily on first use under its own lock, and can
+    optionally be unloaded after a period of inactivity or to respect a memory
+    budget. Idle directions are unloaded by a background thread, so they are
+    freed even when no further translation is requested.
+    
     Attributes:
         model_dir (str): Directory for saving/loading models locally
+        idle_timeout (float): Seconds before an unused direction is unloaded
+        max_memory_mb (float): Memory budget for loaded models in MB
         XToEn_model (MarianMTModel): Model for translating Romance languages to English
         XToEn_tokenizer (MarianTokenizer): Tokenizer for XToEn_model
         EnToX_model (MarianMTModel): Model for translating English to Romance languages
         EnToX_tokenizer (MarianTokenizer): Tokenizer for EnToX_model
         supported_languages (List[str]): List of supported language codes
-        
+    
     Examples:
         >>> translator = Translator("./models")
         >>> # Translate French to English
@@ -58,16 +68,29 @@ class Translator:
         >>> results = translator.translate(texts, direction="XToEN")
     """
     
-    def __init__(self, model_dir: str):
+    def __init__(
+        self,
+        model_dir: str,
+        idle_timeout: Optional[float] = None,
+        max_memory_mb: Optional[float] = None
+    ):
         """
         Initialize the Translator with model directory for local caching.
         
+        Models are not loaded here: each direction is loaded on first use, so
+        English-only traffic never pays for the MarianMT models.
+        
         Args:
             model_dir (str): Directory path for saving/loading translation models
-            
+            idle_timeout (float, optional): Seconds after which an unused direction
+                                            is unloaded. Defaults to None (never).
+            max_memory_mb (float, optional): Memory budget for loaded models in MB.
+                                             Least recently used directions are
+                                             unloaded to stay within it. Defaults
+                                             to None (unbounded).
+        
         Raises:
             OSError: If model directory cannot be created or accessed
-            RuntimeError: If model loading fails
         """
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
@@ -83,83 +106,284 @@ class Translator:
         self.x_to_en_path = self.model_dir / "XToEN"
         self.en_to_x_path = self.model_dir / "EnToX"
         
-        # Initialize models
-        self._load_models()
+        self.idle_timeout = idle_timeout
+        self.max_memory_mb = max_memory_mb
+        
+        # Per-direction state: (model_id, local_path), loaded pair, bookkeeping
+        self._sources = {
+            "XToEN": (self.XToEN_id, self.x_to_en_path),
+            "EnToX": (self.EnToX_id, self.en_to_x_path),
+        }
+        self._loaded: Dict[str, Tuple[MarianMTModel, MarianTokenizer]] = {}
+        self._last_used: Dict[str, float] = {}
+        self._memory_mb: Dict[str, float] = {}
+        self._known_mb: Dict[str, float] = {}  # Sizes of directions loaded before
+        self._in_use: Dict[str, int] = {}  # Translations running per direction
+        self._locks = {direction: threading.Lock() for direction in self._sources}
+        self._state_lock = threading.Lock()
+        
+        self._evictor_stop = threading.Event()
+        self._evictor: Optional[threading.Thread] = None
+        if idle_timeout is not None:
+            self._evictor = threading.Thread(
+                target=self._evict_idle_loop, name="translator-idle-evictor", daemon=True
+            )
+            self._evictor.start()
         
         logger.info("Translator initialized with model directory: %s", model_dir)
     
-    def _load_models(self) -> None:
+    def _load_direction(self, direction: str) -> Tuple[MarianMTModel, MarianTokenizer]:
         """
-        Load or download translation models for both directions.
+        Load or download the translation model for one direction.
         
         This method handles the downloading and caching of MarianMT models
         for efficient local usage and faster subsequent loads.
         
+        Args:
+            direction (str): Translation direction ("XToEN" or "EnToX")
+        
+        Returns:
+            Tuple[MarianMTModel, MarianTokenizer]: The loaded model and tokenizer
+        
         Raises:
             RuntimeError: If model loading fails
         """
+        model_id, local_path = self._sources[direction]
+        
         try:
-            # Load X -> EN model (Romance languages to English)
-            if not self.x_to_en_path.exists():
-                logger.info("Downloading Romance -> English translation model...")
-                self.XToEn_model = MarianMTModel.from_pretrained(self.XToEN_id)
-                self.XToEn_tokenizer = MarianTokenizer.from_pretrained(self.XToEN_id)
-                
-                # Save models locally
-                self.XToEn_model.save_pretrained(str(self.x_to_en_path))
-                self.XToEn_tokenizer.save_pretrained(str(self.x_to_en_path))
-                logger.info("Romance -> English model saved to: %s", self.x_to_en_path)
-            else:
-                logger.info("Loading cached Romance -> English model...")
-                self.XToEn_model = MarianMTModel.from_pretrained(str(self.x_to_en_path))
-                self.XToEn_tokenizer = MarianTokenizer.from_pretrained(str(self.x_to_en_path))
-            
-            # Load EN -> X model (English to Romance languages)
-            if not self.en_to_x_path.exists():
-                logger.info("Downloading English -> Romance translation model...")
-                self.EnToX_model = MarianMTModel.from_pretrained(self.EnToX_id)
-                self.EnToX_tokenizer = MarianTokenizer.from_pretrained(self.EnToX_id)
+            if not local_path.exists():
+                logger.info("Downloading %s translation model...", direction)
+                model = MarianMTModel.from_pretrained(model_id)
+                tokenizer = MarianTokenizer.from_pretrained(model_id)
                 
                 # Save models locally
-                self.EnToX_model.save_pretrained(str(self.en_to_x_path))
-                self.EnToX_tokenizer.save_pretrained(str(self.en_to_x_path))
-                logger.info("English -> Romance model saved to: %s", self.en_to_x_path)
+                model.save_pretrained(str(local_path))
+                tokenizer.save_pretrained(str(local_path))
+                logger.info("%s model saved to: %s", direction, local_path)
             else:
-                logger.info("Loading cached English -> Romance model...")
-                self.EnToX_model = MarianMTModel.from_pretrained(str(self.en_to_x_path))
-                self.EnToX_tokenizer = MarianTokenizer.from_pretrained(str(self.en_to_x_path))
-            
-            logger.info("All translation models loaded successfully")
+                logger.info("Loading cached %s model...", direction)
+                model = MarianMTModel.from_pretrained(str(local_path))
+                tokenizer = MarianTokenizer.from_pretrained(str(local_path))
             
+            return model, tokenizer
+        
         except Exception as e:
-            logger.error("Failed to load translation models: %s", str(e))
+            logger.error("Failed to load %s translation model: %s", direction, str(e))
             raise RuntimeError(f"Model loading failed: {str(e)}")
     
+    def _get_direction(
+        self,
+        direction: str,
+        acquire: bool = False
+    ) -> Tuple[MarianMTModel, MarianTokenizer]:
+        """
+        Get the model and tokenizer for a direction, loading it on first use.
+        
+        Args:
+            direction (str): Translation direction ("XToEN" or "EnToX")
+            acquire (bool, optional): Mark the direction as in use so it is not
+                                      unloaded; pair with _release(). Defaults
+                                      to False.
+        
+        Returns:
+            Tuple[MarianMTModel, MarianTokenizer]: The loaded model and tokenizer
+        """
+        self.evict_idle()
+        
+        with self._locks[direction]:
+            pair = self._loaded.get(direction)
+            if pair is None:
+                # Make room first so peak memory stays within the budget
+                self._enforce_memory_budget(direction, self._estimate_memory_mb(direction))
+                pair = self._load_direction(direction)
+                size_mb = _model_memory_mb(pair[0])
+                self._known_mb[direction] = size_mb
+                # No-op unless the estimate was too low (e.g. first download)
+                self._enforce_memory_budget(direction, size_mb)
+                with self._state_lock:
+                    self._loaded[direction] = pair
+                    self._memory_mb[direction] = size_mb
+                logger.info("%s model loaded (%.0f MB)", direction, size_mb)
+            
+            with self._state_lock:
+                self._last_used[direction] = time.monotonic()
+                if acquire:
+                    self._in_use[direction] = self._in_use.get(direction, 0) + 1
+        
+        return pair
+    
+    def _release(self, direction: str) -> None:
+        """Mark one use of a direction acquired through _get_direction() as finished."""
+        with self._state_lock:
+            self._in_use[direction] -= 1
+            self._last_used[direction] = time.monotonic()
+    
+    def _estimate_memory_mb(self, direction: str) -> float:
+        """
+        Estimate the memory a direction will take before loading it.
+        
+        Uses the measured size of an earlier load, else the size of the saved
+        weights in the local model directory, else 0 (not downloaded yet).
+        """
+        known = self._known_mb.get(direction)
+        if known is not None:
+            return known
+        
+        _, local_path = self._sources[direction]
+        if not local_path.is_dir():
+            return 0.0
+        weights = [p for p in local_path.iterdir() if p.suffix in (".bin", ".safetensors")]
+        return sum(p.stat().st_size for p in weights) / (1024 * 1024)
+    
+    def _enforce_memory_budget(self, incoming: str, incoming_mb: float) -> None:
+        """
+        Unload least recently used directions until incoming_mb fits the budget.
+        
+        Directions in use by a running translation cannot be freed, so they are
+        skipped and still count towards the memory in use.
+        """
+        if self.max_memory_mb is None:
+            return
+        
+        with self._state_lock:
+            candidates = sorted(
+                (d for d in self._loaded if d != incoming),
+                key=lambda d: self._last_used.get(d, 0.0)
+            )
+            used_mb = sum(self._memory_mb.get(d, 0.0) for d in self._loaded)
+        
+        for direction in candidates:
+            if used_mb + incoming_mb <= self.max_memory_mb:
+                break
+            size_mb = self._memory_mb.get(direction, 0.0)
+            if self.unload(direction):
+                used_mb -= size_mb
+        
+        if used_mb + incoming_mb > self.max_memory_mb:
+            logger.warning(
+                "%s model (%.0f MB) exceeds memory budget of %.0f MB",
+                incoming, incoming_mb, self.max_memory_mb
+            )
+    
+    def unload(self, direction: str) -> bool:
+        """
+        Release the model and tokenizer for a direction.
+        
+        A direction in use by a running translation is kept, since dropping
+        the reference would not free its memory.
+        
+        Args:
+            direction (str): Translation direction ("XToEN" or "EnToX")
+        
+        Returns:
+            bool: True if a loaded model was released
+        """
+        with self._state_lock:
+            if self._in_use.get(direction, 0) > 0:
+                return False
+            pair = self._loaded.pop(direction, None)
+            self._last_used.pop(direction, None)
+            self._memory_mb.pop(direction, None)
+        
+        if pair is not None:
+            logger.info("Unloaded %s translation model", direction)
+        return pair is not None
+    
+    def evict_idle(self) -> List[str]:
+        """
+        Unload directions that have not been used within idle_timeout seconds.
+        
+        Returns:
+            List[str]: Directions that were unloaded
+        """
+        if self.idle_timeout is None:
+            return []
+        
+        now = time.monotonic()
+        with self._state_lock:
+            idle = [
+                d for d, last_used in self._last_used.items()
+                if now - last_used > self.idle_timeout and not self._in_use.get(d)
+            ]
+        
+        # unload() re-checks under the lock, so a translation that started
+        # meanwhile keeps its model
+        return [direction for direction in idle if self.unload(direction)]
+    
+    def _evict_idle_loop(self) -> None:
+        """Background thread: periodically unload idle directions until close()."""
+        interval = min(max(self.idle_timeout / 2, 1.0), 60.0)
+        while not self._evictor_stop.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.error("Idle translator eviction failed: %s", str(e))
+    
+    def close(self) -> None:
+        """Stop the idle eviction thread; loaded models are kept."""
+        self._evictor_stop.set()
+        if self._evictor is not None:
+            self._evictor.join(timeout=5)
+    
+    def is_loaded(self, direction: str) -> bool:
+        """Return True if the model for a direction is currently loaded."""
+        with self._state_lock:
+            return direction in self._loaded
+    
+    @property
+    def XToEn_model(self) -> MarianMTModel:
+        """Romance -> English model, loaded on first access."""
+        return self._get_direction("XToEN")[0]
+    
+    @property
+    def XToEn_tokenizer(self) -> MarianTokenizer:
+        """Romance -> English tokenizer, loaded on first access."""
+        return self._get_direction("XToEN")[1]
+    
+    @property
+    def EnToX_model(self) -> MarianMTModel:
+        """English -> Romance model, loaded on first access."""
+        return self._get_direction("EnToX")[0]
+    
+    @property
+    def EnToX_tokenizer(self) -> MarianTokenizer:
+        """English -> Romance tokenizer, loaded on first access."""
+        return self._get_direction("EnToX")[1]
+    
     def translate(
         self, 
         text: Union[str, List[str]], 
         direction: str = "XToEN",
         max_length: int = 512,
-        num_beams: int = 4
+        num_beams: int = 4,
+        batch_size: int = 8
     ) -> Union[str, List[str]]:
         """
         Translate text in the specified direction.
         
+        Each text is split into sentence-aligned chunks that fit within
+        max_length tokens, so long documents are translated completely instead
+        of being truncated. Chunks from all inputs are sorted by length, run
+        through the model in batches and reassembled in their original order.
+        A leading target-language token such as ">>fr<<" is applied to every
+        chunk of its text.
+        
         Args:
             text (str or List[str]): Text or list of texts to translate
             direction (str): Translation direction ("XToEN" or "EnToX")
                 - "XToEN": Romance languages to English
                 - "EnToX": English to Romance languages
-            max_length (int, optional): Maximum length of output. Defaults to 512.
+            max_length (int, optional): Maximum tokens per chunk. Defaults to 512.
             num_beams (int, optional): Number of beams for beam search. Defaults to 4.
+            batch_size (int, optional): Chunks per generate call. Defaults to 8.
         
         Returns:
             str or List[str]: Translated text(s) in the same format as input
-            
+        
         Raises:
             ValueError: If direction is invalid or text is empty
             RuntimeError: If translation fails
-            
+        
         Examples:
             >>> translator = Translator("./models")
             >>> # Single text translation
@@ -183,13 +407,12 @@ class Translator:
         if direction not in ["XToEN", "EnToX"]:
             raise ValueError("Invalid direction. Use 'XToEN' or 'EnToX'")
         
-        # Select appropriate model and tokenizer
-        if direction == "XToEN":
-            model = self.XToEn_model
-            tokenizer = self.XToEn_tokenizer
-        else:  # EnToX
-            model = self.EnToX_model
-            tokenizer = self.EnToX_tokenizer
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        
+        # Select appropriate model and tokenizer (loaded on first use); the
+        # direction stays in use, and is not unloaded, until translation ends
+        model, tokenizer = self._get_direction(direction, acquire=True)
         
         # Handle single string input
         single_input = isinstance(text, str)
@@ -197,39 +420,134 @@ class Translator:
             text = [text]
         
         try:
-            # Tokenize input texts
-            tokenized = tokenizer(
-                text, 
-                return_tensors="pt", 
-                padding=True, 
-                truncation=True,
-                max_length=max_length
-            )
+            # Split every text into chunks, remembering which text they belong to
+            chunks: List[str] = []
+            owners: List[int] = []
+            for index, item in enumerate(text):
+                for chunk in self._chunk_text(item, tokenizer, max_length):
+                    chunks.append(chunk)
+                    owners.append(index)
             
-            # Generate translations
-            with logger_context("Translating texts"):
-                translated = model.generate(
-                    **tokenized,
-                    max_length=max_length,
-                    num_beams=num_beams,
-                    early_stopping=True
-                )
+            # Length-sorted buckets keep padding within each batch small
+            order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]))
+            translated_chunks: List[str] = [""] * len(chunks)
             
-            # Decode translations
-            translated_texts = [
-                tokenizer.decode(t, skip_special_tokens=True) 
-                for t in translated
-            ]
+            with logger_context(f"Translating {len(chunks)} chunks"):
+                for start in range(0, len(order), batch_size):
+                    bucket = order[start:start + batch_size]
+                    results = self._generate(
+                        model, tokenizer, [chunks[i] for i in bucket], max_length, num_beams
+                    )
+                    for i, result in zip(bucket, results):
+                        translated_chunks[i] = result
+            
+            # Reassemble chunks in their original order
+            parts: List[List[str]] = [[] for _ in text]
+            for owner, translated in zip(owners, translated_chunks):
+                parts[owner].append(translated)
+            translated_texts = [" ".join(p for p in part if p) for part in parts]
             
             # Return single string if input was single string
             if single_input:
                 return translated_texts[0]
             
             return translated_texts
-            
+        
         except Exception as e:
             logger.error("Translation failed: %s", str(e))
             raise RuntimeError(f"Translation failed: {str(e)}")
+        
+        finally:
+            self._release(direction)
+    
+    @staticmethod
+    def _generate(
+        model: MarianMTModel,
+        tokenizer: MarianTokenizer,
+        texts: List[str],
+        max_length: int,
+        num_beams: int
+    ) -> List[str]:
+        """Translate one batch of chunks with a single generate call."""
+        tokenized = tokenizer(
+            texts, 
+            return_tensors="pt", 
+            padding=True, 
+            truncation=True,
+            max_length=max_length
+        )
+        
+        translated = model.generate(
+            **tokenized,
+            max_length=max_length,
+            num_beams=num_beams,
+            early_stopping=True
+        )
+        
+        return [tokenizer.decode(t, skip_special_tokens=True) for t in translated]
+    
+    @staticmethod
+    def _chunk_text(text: str, tokenizer: MarianTokenizer, max_length: int) -> List[str]:
+        """
+        Split text into sentence-aligned chunks of at most max_length tokens.
+        
+        Sentences are packed greedily; a single sentence longer than the limit
+        is split on word boundaries. A leading ">>xx<<" target-language token
+        is stripped and re-applied to every chunk.
+        
+        Args:
+            text (str): Text to split
+            tokenizer (MarianTokenizer): Tokenizer used to measure chunk length
+            max_length (int): Maximum tokens per chunk, special tokens included
+        
+        Returns:
+            List[str]: Chunks in document order
+        """
+        prefix = ""
+        match = _TARGET_PREFIX.match(text)
+        if match:
+            prefix = match.group(0).strip() + " "
+            text = text[match.end():]
+        
+        sentences = _split_sentences(text)
+        if not sentences:
+            return [(prefix + text).strip()]
+        
+        # Leave room for the prefix token and the end-of-sequence token
+        budget = max(max_length - (2 if prefix else 1), 1)
+        lengths = [
+            len(ids) for ids in
+            tokenizer(sentences, add_special_tokens=False)["input_ids"]
+        ]
+        
+        chunks: List[str] = []
+        current: List[str] = []
+        current_length = 0
+        
+        for sentence, length in zip(sentences, lengths):
+            if length > budget:
+                # Flush, then split the oversized sentence on word boundaries
+                if current:
+                    chunks.append(" ".join(current))
+                    current, current_length = [], 0
+                words = sentence.split()
+                pieces = -(-length // budget)
+                step = max(-(-len(words) // pieces), 1)
+                for start in range(0, len(words), step):
+                    chunks.append(" ".join(words[start:start + step]))
+                continue
+            
+            if current and current_length + length > budget:
+                chunks.append(" ".join(current))
+                current, current_length = [], 0
+            
+            current.append(sentence)
+            current_length += length
+        
+        if current:
+            chunks.append(" ".join(current))
+        
+        return [prefix + chunk for chunk in chunks]
     
     def translate_to_english(self, text: Union[str, List[str]]) -> Union[str, List[str]]:
         """
@@ -237,7 +555,7 @@ class Translator:
         
         Args:
             text (str or List[str]): Text in Romance language(s) to translate
-            
+        
         Returns:
             str or List[str]: English translation(s)
         """
@@ -251,7 +569,7 @@ class Translator:
         
         Args:
             text (str or List[str]): English text to translate
-            
+        
         Returns:
             str or List[str]: Romance language translation(s)
         """
@@ -263,7 +581,7 @@ class Translator:
         
         Args:
             language_code (str): Language code to check (e.g., 'fr', 'es', 'en')
-            
+        
         Returns:
             bool: True if language is supported, False otherwise
         """
@@ -291,10 +609,31 @@ class Translator:
             "en_to_x_model": self.EnToX_id,
             "x_to_en_path": str(self.x_to_en_path),
             "en_to_x_path": str(self.en_to_x_path),
+            "x_to_en_loaded": str(self.is_loaded("XToEN")),
+            "en_to_x_loaded": str(self.is_loaded("EnToX")),
             "supported_languages": ", ".join(self.supported_languages)
         }
 
 
+# Leading target-language token understood by multilingual MarianMT models
+_TARGET_PREFIX = re.compile(r"^\s*>>[a-z_]{2,}<<\s*")
+
+# Sentence boundary: terminal punctuation (optionally closed by a quote or
+# bracket) followed by whitespace
+_SENTENCE_BOUNDARY = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"'»)\]]))\s+")
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into non-empty sentences on terminal punctuation."""
+    return [s.strip() for s in _SENTENCE_BOUNDARY.split(text) if s.strip()]
+
+
+def _model_memory_mb(model: MarianMTModel) -> float:
+    """Estimate the memory held by a model's parameters and buffers in MB."""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors) / (1024 * 1024)
+
+
 class logger_context:
     """Simple context manager for logging translation operations."""
     
@@ -347,6 +686,6 @@ if __name__ == "__main__":
         info = translator.get_model_info()
         for key, value in info.items():
             print(f"{key}: {value}")
-            
+    
     except Exception as e:
         print(f"Translator test failed: {e}")
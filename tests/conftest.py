@@ -0,0 +1,16 @@
+"""
+PDF Summarize - Test Configuration
+
+Makes the project importable from the tests and keeps test runs offline:
+importing core preloads BART, which must not download the model here.
+"""
+
+import os
+import sys
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("BART_OFFLINE", "1")
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+os.environ.pop("SUMMARY_CACHE_DIR", None)
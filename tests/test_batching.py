@@ -0,0 +1,116 @@
+"""Tests for the micro-batching scheduler."""
+
+import threading
+
+import pytest
+
+from core.batching import BatchScheduler
+
+
+KEY_A = dict(input_max_length=1024, sum_max_length=100, sum_min_length=10, num_beams=2)
+KEY_B = dict(input_max_length=1024, sum_max_length=200, sum_min_length=10, num_beams=2)
+
+
+class _RecordingBatchFn:
+    """Batched summarizer stub that records each call and can be told to fail."""
+    
+    def __init__(self):
+        self.calls = []
+        self.fail_on = set()
+        self.lock = threading.Lock()
+    
+    def __call__(self, texts, input_max_length, sum_max_length, sum_min_length, num_beams, batch_size):
+        with self.lock:
+            self.calls.append((sum_max_length, list(texts)))
+        if any(text in self.fail_on for text in texts):
+            raise RuntimeError("generate failed")
+        return [f"{text}:{sum_max_length}" for text in texts]
+
+
+@pytest.fixture
+def batch_fn():
+    return _RecordingBatchFn()
+
+
+@pytest.fixture
+def scheduler(batch_fn):
+    # A long window with a batch size of 4 makes the grouping deterministic
+    scheduler = BatchScheduler(batch_fn, max_batch_size=4, max_wait_ms=2000)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_requests_are_grouped_by_generation_parameters(scheduler, batch_fn):
+    futures = [
+        scheduler.submit("a1", **KEY_A),
+        scheduler.submit("b1", **KEY_B),
+        scheduler.submit("a2", **KEY_A),
+        scheduler.submit("b2", **KEY_B),
+    ]
+    
+    assert [future.result(timeout=10) for future in futures] == ["a1:100", "b1:200", "a2:100", "b2:200"]
+    assert sorted(batch_fn.calls) == [(100, ["a1", "a2"]), (200, ["b1", "b2"])]
+    
+    metrics = scheduler.metrics()
+    assert metrics["batches_run"] == 2
+    assert metrics["requests_processed"] == 4
+    assert metrics["batch_size_histogram"] == {2: 2}
+
+
+def test_failing_group_only_fails_its_own_callers(scheduler, batch_fn):
+    batch_fn.fail_on = {"b1"}
+    futures = [
+        scheduler.submit("a1", **KEY_A),
+        scheduler.submit("b1", **KEY_B),
+        scheduler.submit("a2", **KEY_A),
+        scheduler.submit("b2", **KEY_B),
+    ]
+    
+    assert futures[0].result(timeout=10) == "a1:100"
+    assert futures[2].result(timeout=10) == "a2:100"
+    for future in (futures[1], futures[3]):
+        with pytest.raises(RuntimeError, match="generate failed"):
+            future.result(timeout=10)
+    
+    assert scheduler.metrics()["requests_failed"] == 2
+    assert scheduler.summarize("later", **KEY_A) == "later:100"
+
+
+def test_worker_survives_unexpected_group_error(scheduler, monkeypatch):
+    run_group = scheduler._run_group
+    calls = []
+    
+    def flaky_run_group(key, requests):
+        calls.append(key)
+        if len(calls) == 1:
+            raise KeyError("scheduler bug")
+        run_group(key, requests)
+    
+    monkeypatch.setattr(scheduler, "_run_group", flaky_run_group)
+    scheduler.max_batch_size = 1
+    
+    with pytest.raises(KeyError):
+        scheduler.summarize("first", **KEY_A)
+    assert scheduler.summarize("second", **KEY_A) == "second:100"
+
+
+def test_wrong_result_count_fails_the_group():
+    scheduler = BatchScheduler(lambda texts, **kwargs: [], max_batch_size=1, max_wait_ms=0)
+    try:
+        with pytest.raises(RuntimeError, match="returned 0 summaries"):
+            scheduler.summarize("text", **KEY_A)
+    finally:
+        scheduler.shutdown()
+
+
+def test_submit_validation():
+    scheduler = BatchScheduler(lambda texts, **kwargs: texts)
+    with pytest.raises(ValueError):
+        scheduler.submit("  ", **KEY_A)
+    
+    scheduler.shutdown()
+    with pytest.raises(RuntimeError):
+        scheduler.submit("text", **KEY_A)
+    
+    with pytest.raises(ValueError):
+        BatchScheduler(lambda texts, **kwargs: texts, max_batch_size=0)
@@ -0,0 +1,88 @@
+"""Tests for summary cache keys and the memory and disk cache tiers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core import cache as cache_module
+from core.cache import SummaryCache, make_cache_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's wall clock with one that ticks once per call."""
+    ticks = iter(range(1, 1000000))
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+def test_cache_key_ignores_whitespace_only():
+    key = make_cache_key("Some text\n\nhere", sum_max_length=200, num_beams=2)
+    
+    assert key == make_cache_key("  Some   text here ", num_beams=2, sum_max_length=200)
+    assert key != make_cache_key("Some text there", sum_max_length=200, num_beams=2)
+    assert key != make_cache_key("Some text here", sum_max_length=100, num_beams=2)
+    assert key != make_cache_key("Some text here", sum_max_length=200)
+
+
+def test_cache_key_changes_with_version(monkeypatch):
+    key = make_cache_key("text", sum_max_length=200)
+    monkeypatch.setattr(cache_module, "CACHE_VERSION", cache_module.CACHE_VERSION + 1)
+    
+    assert make_cache_key("text", sum_max_length=200) != key
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = SummaryCache(memory_entries=2)
+    cache.put("a", {"text": "A"})
+    cache.put("b", {"text": "B"})
+    assert cache.get("a") == {"text": "A"}
+    
+    cache.put("c", {"text": "C"})
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "A"}
+    assert cache.get("c") == {"text": "C"}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+    assert stats["memory"] == {"entries": 2, "maxsize": 2}
+
+
+def test_cached_results_are_isolated_from_callers():
+    cache = SummaryCache(memory_entries=4)
+    result = {"text": "Summary", "segments": [{"lang": "fr", "chars": 120}]}
+    cache.put("key", result)
+    
+    result["segments"][0]["lang"] = "en"
+    cache.get("key")["segments"].append({"lang": "it"})
+    
+    assert cache.get("key") == {"text": "Summary", "segments": [{"lang": "fr", "chars": 120}]}
+
+
+def test_disk_tier_survives_restart_and_promotes_to_memory(tmp_path):
+    SummaryCache(memory_entries=4, cache_dir=str(tmp_path)).put("key", {"lang": "fr", "text": "Résumé"})
+    
+    cache = SummaryCache(memory_entries=4, cache_dir=str(tmp_path))
+    
+    assert cache.get("key") == {"lang": "fr", "text": "Résumé"}
+    assert cache.get("key") == {"lang": "fr", "text": "Résumé"}
+    stats = cache.stats()
+    assert stats["disk_hits"] == 1
+    assert stats["disk"]["entries"] == 1
+
+
+def test_disk_tier_evicts_least_recently_accessed(tmp_path, clock):
+    value = {"text": "x" * 100}
+    entry_bytes = len('{"text": "' + "x" * 100 + '"}')
+    # Room for two entries; the memory tier holds a single one
+    cache = SummaryCache(memory_entries=1, cache_dir=str(tmp_path), max_disk_mb=2.5 * entry_bytes / (1024 * 1024))
+    
+    cache.put("a", value)
+    cache.put("b", value)  # Pushes "a" out of the memory tier only
+    assert cache.get("a") == value  # Disk read refreshes the access time of "a"
+    cache.put("c", value)
+    
+    disk = SummaryCache(memory_entries=1, cache_dir=str(tmp_path), max_disk_mb=1)
+    assert disk.get("b") is None
+    assert disk.get("a") == value
+    assert disk.get("c") == value
+    assert disk.stats()["disk"]["entries"] == 2
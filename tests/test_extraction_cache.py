@@ -0,0 +1,84 @@
+"""Tests for the on-disk PDF extraction cache."""
+
+import os
+import time
+
+from utils.extraction_cache import ExtractionCache, file_cache_key
+
+
+def _entries(cache_dir):
+    return sorted(path.name for path in cache_dir.iterdir())
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    cache.put("key", {2: "Deuxième page", 1: "First page"}, total_pages=3)
+    
+    assert cache.get("key") == {"total_pages": 3, "pages": {1: "First page", 2: "Deuxième page"}}
+    assert cache.get("other") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_writer_publishes_only_on_commit(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    entry = cache.writer("key", total_pages=2)
+    entry.add(1, "First page")
+    
+    assert cache.get("key") is None
+    pending = _entries(tmp_path)
+    assert len(pending) == 1 and pending[0].endswith(".tmp")
+    
+    entry.add(2, "Second page")
+    entry.commit()
+    
+    assert cache.get("key")["pages"] == {1: "First page", 2: "Second page"}
+    assert _entries(tmp_path) == ["key.jsonl.gz"]
+
+
+def test_discarded_writer_leaves_nothing_behind(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    entry = cache.writer("key", total_pages=2)
+    entry.add(1, "First page")
+    entry.discard()
+    
+    assert _entries(tmp_path) == []
+    assert cache.get("key") is None
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    (tmp_path / "key.jsonl.gz").write_bytes(b"not gzip")
+    
+    assert cache.get("key") is None
+    assert _entries(tmp_path) == []
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    text = os.urandom(2048).hex()  # Incompressible page text
+    cache = ExtractionCache(str(tmp_path), max_bytes=10 ** 9)
+    cache.put("old", {1: text}, total_pages=1)
+    cache.put("used", {1: text}, total_pages=1)
+    entry_bytes = (tmp_path / "old.jsonl.gz").stat().st_size
+    
+    now = time.time()
+    os.utime(tmp_path / "old.jsonl.gz", (now - 200, now - 200))
+    os.utime(tmp_path / "used.jsonl.gz", (now - 100, now - 100))
+    assert cache.get("used") is not None  # Reads refresh the modification time
+    
+    cache.max_bytes = int(entry_bytes * 2.5)
+    cache.put("new", {1: text}, total_pages=1)
+    
+    assert _entries(tmp_path) == ["new.jsonl.gz", "used.jsonl.gz"]
+
+
+def test_file_cache_key_depends_on_content(tmp_path):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"%PDF-1.4 one")
+    second.write_bytes(b"%PDF-1.4 one")
+    
+    assert file_cache_key(str(first)) == file_cache_key(str(second))
+    
+    second.write_bytes(b"%PDF-1.4 two")
+    assert file_cache_key(str(first)) != file_cache_key(str(second))
@@ -0,0 +1,74 @@
+"""Tests for per-segment language detection."""
+
+import pytest
+
+from utils import languages_detect
+from utils.languages_detect import detect_segments
+
+
+FRENCH = (
+    "Le présent rapport décrit les résultats financiers de l'entreprise pour l'année écoulée. "
+    "Les ventes ont progressé dans toutes les régions, grâce à une forte demande en Europe et "
+    "à la croissance continue de nos activités de service auprès des clients professionnels."
+)
+ENGLISH = (
+    "This report describes the financial results of the company for the past year. Sales "
+    "grew in every region, driven by strong demand in Europe and the continued growth of our "
+    "service business with professional customers across all of our markets."
+)
+GERMAN = (
+    "Dieser Bericht beschreibt die finanziellen Ergebnisse des Unternehmens im vergangenen "
+    "Jahr. Der Umsatz ist in allen Regionen gewachsen, getragen von einer starken Nachfrage "
+    "in Europa und dem anhaltenden Wachstum unseres Dienstleistungsgeschäfts."
+)
+
+
+@pytest.fixture
+def fake_detector(monkeypatch):
+    """Detect languages from a "xx:" prefix on each paragraph; "??" means undetectable."""
+    def detect(segment, confidence_threshold=languages_detect.DETECTION_CONFIDENCE):
+        code = segment[:2]
+        return None if code == "??" else code
+    
+    monkeypatch.setattr(languages_detect, "detect_language_code", detect)
+
+
+def _paragraph(code, index):
+    return f"{code}: paragraph {index} " + " ".join(["words"] * 50)
+
+
+def test_detects_language_changes_between_paragraphs():
+    segments = detect_segments("\n\n".join([FRENCH, FRENCH, ENGLISH]), segment_chars=300, min_segment_chars=100)
+    
+    assert [lang for _, lang in segments] == ["fr", "en"]
+    assert segments[0][0] == f"{FRENCH}\n{FRENCH}"
+    assert segments[1][0] == ENGLISH
+
+
+def test_unsupported_languages_keep_their_code():
+    segments = detect_segments("\n\n".join([FRENCH, GERMAN, FRENCH]), segment_chars=300, min_segment_chars=100)
+    
+    assert [lang for _, lang in segments] == ["fr", "de", "fr"]
+
+
+def test_undetected_segments_follow_their_neighbours(fake_detector):
+    paragraphs = [_paragraph("??", 0), _paragraph("fr", 1), _paragraph("??", 2), _paragraph("en", 3)]
+    
+    segments = detect_segments("\n\n".join(paragraphs), segment_chars=300, min_segment_chars=100)
+    
+    assert [lang for _, lang in segments] == ["fr", "en"]
+    assert segments[0][0] == "\n".join(paragraphs[:3])
+
+
+def test_short_paragraphs_are_merged_before_detection(fake_detector):
+    text = "\n\n".join(["fr: titre", _paragraph("en", 1), "en: end"])
+    
+    segments = detect_segments(text, segment_chars=300, min_segment_chars=100)
+    
+    # The short title is packed with the next paragraph, the short tail with the last segment
+    assert segments == [(text.replace("\n\n", "\n"), "fr")]
+
+
+def test_blank_text_has_no_segments():
+    assert detect_segments("") == []
+    assert detect_segments("  \n\n ") == []
@@ -0,0 +1,105 @@
+"""Tests for page range parsing and header/footer stripping."""
+
+import pytest
+
+from utils.pdf_extractor import MAX_PAGE_NUMBER, iter_strip_boilerplate, parse_page_ranges, strip_boilerplate
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("1-3,7", [1, 2, 3, 7]),
+    ("7, 1-3", [1, 2, 3, 7]),
+    ("2-4,3-5,4", [2, 3, 4, 5]),
+    ("5", [5]),
+    ("5-5", [5]),
+    (" 1 , ,2 ", [1, 2]),
+])
+def test_parse_page_ranges(spec, expected):
+    assert parse_page_ranges(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["", " , ", "a", "1-", "-3", "0", "0-2", "3-1", "1-2-3", "1.5"])
+def test_parse_page_ranges_rejects_malformed(spec):
+    with pytest.raises(ValueError):
+        parse_page_ranges(spec)
+
+
+def test_parse_page_ranges_bounds():
+    assert parse_page_ranges("1-10", max_page=10) == list(range(1, 11))
+    
+    with pytest.raises(ValueError, match="past the last page"):
+        parse_page_ranges("9-11", max_page=10)
+    with pytest.raises(ValueError, match="past the last page"):
+        parse_page_ranges("11", max_page=10)
+    
+    # Without a page count, huge ranges are rejected before being expanded
+    assert len(parse_page_ranges(f"1-{MAX_PAGE_NUMBER}")) == MAX_PAGE_NUMBER
+    with pytest.raises(ValueError, match="past the last page"):
+        parse_page_ranges("1-1000000000")
+
+
+_TOPICS = ["revenue", "costs", "staffing", "outlook", "risks", "markets", "products", "research"]
+
+
+def _body(n):
+    """Body lines of page n; digits alone would not tell short lines apart."""
+    topic = _TOPICS[n % len(_TOPICS)]
+    return [f"Section {n} reviews {topic} for the {['first', 'second', 'third'][n % 3]} time.",
+            f"The {topic} figures changed by {n * 3} percent over the previous period.",
+            f"Further notes on {topic}: see table {n}."]
+
+
+def _report_pages(count):
+    return [
+        "\n".join(["ACME Annual Report", "Confidential"] + _body(n) + [f"Page {n} of {count}"])
+        for n in range(1, count + 1)
+    ]
+
+
+def test_strip_boilerplate_removes_repeated_edge_lines():
+    stripped = strip_boilerplate(_report_pages(6))
+    
+    assert stripped == ["\n".join(_body(n)) for n in range(1, 7)]
+
+
+def test_strip_boilerplate_keeps_body_lines_and_short_documents():
+    titles = ["Introduction", "Methods", "Results", "Discussion"]
+    # The repeated line sits inside the body, not at a page edge
+    pages = [f"{title}\nKey result: revenue grew\nDetails for {title}\nFooter {n}"
+             for n, title in enumerate(titles, 1)]
+    
+    stripped = strip_boilerplate(pages, edge_lines=1)
+    
+    assert stripped == [f"{title}\nKey result: revenue grew\nDetails for {title}" for title in titles]
+    
+    two_pages = _report_pages(2)
+    assert strip_boilerplate(two_pages) == two_pages
+
+
+def test_strip_boilerplate_requires_min_ratio():
+    pages = _report_pages(3) + ["\n".join(_body(n)) for n in range(10, 17)]
+    
+    # Headers on 3 of 10 pages stay below the default ratio of 0.5
+    assert strip_boilerplate(pages) == pages
+    assert strip_boilerplate(pages, min_ratio=0.3)[0] == "\n".join(_body(1))
+
+
+def test_iter_strip_boilerplate_matches_full_pass():
+    pages = _report_pages(40)
+    
+    assert list(iter_strip_boilerplate(iter(pages), sample_pages=8)) == strip_boilerplate(pages)
+    assert list(iter_strip_boilerplate(iter(pages[:2]))) == pages[:2]
+
+
+def test_iter_strip_boilerplate_is_lazy():
+    consumed = []
+    
+    def pages():
+        for page in _report_pages(100):
+            consumed.append(page)
+            yield page
+    
+    stream = iter_strip_boilerplate(pages(), sample_pages=5)
+    first = next(stream)
+    
+    assert first == "\n".join(_body(1))
+    assert len(consumed) == 5
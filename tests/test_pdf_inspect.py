@@ -0,0 +1,138 @@
+"""Tests for lightweight PDF inspection on small generated documents."""
+
+import PyPDF2
+import pytest
+
+from utils.pdf_inspect import InvalidPDFError, inspect_pdf
+
+
+_PAGE = "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"
+
+
+class _PDFBuilder:
+    """Writes PDF objects and classic xref sections, tracking byte offsets."""
+    
+    def __init__(self, version="1.4"):
+        self.data = bytearray(f"%PDF-{version}\n".encode("ascii"))
+    
+    def add(self, number, body):
+        offset = len(self.data)
+        self.data += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+        return offset
+    
+    def xref(self, offsets, trailer):
+        """Append an xref section with one subsection per object and its trailer."""
+        start = len(self.data)
+        lines = ["xref", "0 1", "0000000000 65535 f "]
+        for number in sorted(offsets):
+            lines += [f"{number} 1", f"{offsets[number]:010d} 00000 n "]
+        lines += ["trailer", trailer, "startxref", str(start), "%%EOF", ""]
+        self.data += "\n".join(lines).encode("latin-1")
+        return start
+
+
+def _base_document(builder):
+    offsets = {
+        1: builder.add(1, "<< /Type /Catalog /Pages 2 0 R >>"),
+        2: builder.add(2, "<< /Type /Pages /Kids [3 0 R] /Count 1 >>"),
+        3: builder.add(3, _PAGE),
+        4: builder.add(4, "<< /Title (Draft \\(v1\\)) /Author <FEFF00C9006D0069006C0065> >>"),
+    }
+    return builder.xref(offsets, "<< /Size 5 /Root 1 0 R /Info 4 0 R >>")
+
+
+@pytest.fixture
+def single_page_pdf(tmp_path):
+    builder = _PDFBuilder()
+    _base_document(builder)
+    path = tmp_path / "single.pdf"
+    path.write_bytes(builder.data)
+    return path
+
+
+@pytest.fixture
+def updated_pdf(tmp_path):
+    """A one-page document with an incremental update adding a page and a new title."""
+    builder = _PDFBuilder()
+    first_xref = _base_document(builder)
+    offsets = {
+        2: builder.add(2, "<< /Type /Pages /Kids [3 0 R 5 0 R] /Count 2 >>"),
+        4: builder.add(4, "<< /Title (Final) /Author (ACME) >>"),
+        5: builder.add(5, _PAGE),
+    }
+    builder.xref(offsets, f"<< /Size 6 /Root 1 0 R /Info 4 0 R /Prev {first_xref} >>")
+    path = tmp_path / "updated.pdf"
+    path.write_bytes(builder.data)
+    return path
+
+
+def test_inspects_classic_xref(single_page_pdf):
+    info = inspect_pdf(str(single_page_pdf))
+    
+    assert info["method"] == "xref"
+    assert info["pdf_version"] == "1.4"
+    assert info["page_count"] == 1
+    assert info["is_encrypted"] is False
+    assert info["file_size"] == single_page_pdf.stat().st_size
+    assert info["metadata"] == {"/Title": "Draft (v1)", "/Author": "Émile"}
+
+
+def test_follows_prev_chain_with_newest_objects_first(updated_pdf):
+    info = inspect_pdf(str(updated_pdf))
+    
+    assert info["method"] == "xref"
+    assert info["page_count"] == 2
+    assert info["metadata"] == {"/Title": "Final", "/Author": "ACME"}
+    
+    # PyPDF2 resolves the same revision
+    reader = PyPDF2.PdfReader(str(updated_pdf))
+    assert len(reader.pages) == info["page_count"]
+    assert reader.metadata["/Title"] == "Final"
+
+
+def test_falls_back_to_pypdf2_for_xref_streams(tmp_path):
+    builder = _PDFBuilder(version="1.5")
+    offsets = {
+        1: builder.add(1, "<< /Type /Catalog /Pages 2 0 R >>"),
+        2: builder.add(2, "<< /Type /Pages /Kids [3 0 R] /Count 1 >>"),
+        3: builder.add(3, _PAGE),
+    }
+    offsets[4] = len(builder.data)
+    # Uncompressed cross-reference stream: (type, offset, generation) as 1, 4, 1 bytes
+    entries = bytes([0, 0, 0, 0, 0, 255]) + b"".join(
+        bytes([1]) + offsets[number].to_bytes(4, "big") + bytes([0]) for number in range(1, 5)
+    )
+    builder.data += (
+        f"4 0 obj\n<< /Type /XRef /Size 5 /W [1 4 1] /Root 1 0 R /Length {len(entries)} >>\nstream\n"
+    ).encode("ascii") + entries + f"\nendstream\nendobj\nstartxref\n{offsets[4]}\n%%EOF\n".encode("ascii")
+    path = tmp_path / "xref_stream.pdf"
+    path.write_bytes(builder.data)
+    
+    info = inspect_pdf(str(path))
+    
+    assert info["method"] == "pypdf2"
+    assert info["pdf_version"] == "1.5"
+    assert info["page_count"] == 1
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"", "empty"),
+    (b"hello world\n%%EOF\n", "header"),
+    (b"%PDF-1.4\n1 0 obj\n<< >>\nendobj\n", "EOF"),
+    (b"%PDF-1.4\n%%EOF\n", "startxref"),
+    (b"%PDF-1.4\nstartxref\n999999\n%%EOF\n", "past the end"),
+])
+def test_rejects_broken_files(tmp_path, data, message):
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(data)
+    
+    with pytest.raises(InvalidPDFError, match=message):
+        inspect_pdf(str(path))
+
+
+def test_unreadable_fallback_is_invalid_pdf(tmp_path):
+    path = tmp_path / "garbage.pdf"
+    path.write_bytes(b"%PDF-1.4\n" + b"\x00garbage" * 50 + b"\nstartxref\n12\n%%EOF\n")
+    
+    with pytest.raises(InvalidPDFError):
+        inspect_pdf(str(path))
@@ -0,0 +1,112 @@
+"""Tests for streamed and parallel preprocessing against preprocess()."""
+
+import re
+import string
+import itertools
+
+import pytest
+
+from utils.preprocessing import normalize_text, preprocess, preprocess_many, preprocess_stream
+
+
+DOCUMENT = " ".join(
+    f"Section {n}: the committee's {word} reports were reviewed on 12/0{n % 9 + 1}/2024, "
+    f"and the {word} results\tchanged by {n * 7}% (see Table {n}).\n"
+    for n, word in enumerate(["budget", "hiring", "running", "studies", "policies", "mice"] * 15)
+)
+
+
+def _slices(text, size):
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 64, 500, 65536])
+def test_stream_matches_preprocess_on_arbitrary_slices(chunk_chars):
+    expected = preprocess(DOCUMENT)
+    
+    for size in (7, 100, 1000):
+        pieces = list(preprocess_stream(_slices(DOCUMENT, size), chunk_chars=chunk_chars))
+        assert " ".join(pieces) == expected
+
+
+@pytest.mark.parametrize("options", [
+    {"remove_stopwords": False},
+    {"apply_lemmatization": False},
+    {"remove_digits": False},
+    {"to_lowercase": False},
+])
+def test_stream_matches_preprocess_with_options(options):
+    pieces = preprocess_stream(_slices(DOCUMENT, 100), chunk_chars=300, **options)
+    
+    assert " ".join(pieces) == preprocess(DOCUMENT, **options)
+
+
+def test_stream_matches_preprocess_with_separator():
+    pages = DOCUMENT.split("\n")
+    
+    pieces = preprocess_stream(pages, separator="\n", chunk_chars=300, apply_lemmatization=False)
+    
+    assert " ".join(pieces) == preprocess("\n".join(pages), apply_lemmatization=False)
+
+
+def test_stream_flushes_whitespace_free_runs():
+    run = "x" * 70000
+    
+    pieces = list(preprocess_stream(_slices(run + " tail", 1000), chunk_chars=100))
+    
+    # Too long to be a word: the run is cut instead of carried, but nothing is lost
+    assert len(pieces) > 1
+    assert "".join(pieces).replace(" ", "") == run + "tail"
+
+
+def test_stream_validation():
+    with pytest.raises(ValueError):
+        list(preprocess_stream(["text"], chunk_chars=0))
+    with pytest.raises(ValueError):
+        list(preprocess_stream(["text", 3]))
+    assert list(preprocess_stream(["", "   "])) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_many_matches_preprocess(workers):
+    texts = [DOCUMENT, "", "Short note about 3 studies.", DOCUMENT[:5000]]
+    
+    results = preprocess_many(texts, workers=workers, chunk_chars=700)
+    
+    assert results == [preprocess(text) for text in texts]
+
+
+def test_many_validation():
+    with pytest.raises(ValueError):
+        preprocess_many(["text", None], workers=1)
+    with pytest.raises(ValueError):
+        preprocess_many(["text"], workers=1, chunk_chars=0)
+    assert preprocess_many([], workers=2) == []
+
+
+def _step_by_step_normalize(text, to_lowercase, remove_punctuation, remove_digits):
+    """Steps 1-5 of preprocess() as separate passes, before they were fused."""
+    for char in ('\xa0', '\u00a0', '\n', '\t', '\r'):
+        text = text.replace(char, ' ')
+    text = re.sub(r'\s+', ' ', text).strip()
+    if to_lowercase:
+        text = text.lower()
+    if remove_punctuation:
+        text = text.translate(str.maketrans('', '', string.punctuation))
+    if remove_digits:
+        text = re.sub(r'\d+', '', text)
+    return text
+
+
+@pytest.mark.parametrize("flags", list(itertools.product([True, False], repeat=3)))
+@pytest.mark.parametrize("text", [
+    "Hello, World!\n\tRoom 101 ",
+    "  Caf\u00e9\u00a0d\u00e9j\u00e0\r\nvu \u2013 \u0663\u0664 items\u2009(50%)  ",
+    "\n\t\r",
+])
+def test_normalize_text_matches_step_by_step_passes(text, flags):
+    to_lowercase, remove_punctuation, remove_digits = flags
+    
+    assert normalize_text(
+        text, to_lowercase=to_lowercase, remove_punctuation=remove_punctuation, remove_digits=remove_digits
+    ) == _step_by_step_normalize(text, to_lowercase, remove_punctuation, remove_digits)
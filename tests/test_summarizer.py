@@ -0,0 +1,83 @@
+"""Tests for batched and windowed summarization, with generate stubbed out."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core import summarizer
+
+
+class _FakeTokenizer:
+    """Tokenizes into one id per word, honouring max_length truncation."""
+    
+    def __call__(self, texts, max_length=None, truncation=False, **kwargs):
+        ids = [list(range(len(text.split()))) for text in texts]
+        if truncation and max_length is not None:
+            ids = [token_ids[:max_length] for token_ids in ids]
+        return {"input_ids": ids}
+
+
+@pytest.fixture
+def generate_calls(monkeypatch):
+    """Stub the model and record the token lengths of every generate batch."""
+    calls = []
+    model = SimpleNamespace(config=SimpleNamespace(max_position_embeddings=1024))
+    
+    def fake_generate(model, tokenizer, batch_ids, sum_max_length, sum_min_length, num_beams):
+        calls.append([len(ids) for ids in batch_ids])
+        return [f"summary of {len(ids)}" for ids in batch_ids]
+    
+    monkeypatch.setattr(summarizer, "_load_model", lambda: (model, _FakeTokenizer()))
+    monkeypatch.setattr(summarizer, "_generate_from_ids", fake_generate)
+    return calls
+
+
+def _summarize(texts, batch_size, input_max_length=1024):
+    return summarizer.summarize_batch(
+        texts,
+        input_max_length=input_max_length,
+        sum_max_length=50,
+        sum_min_length=5,
+        num_beams=1,
+        batch_size=batch_size
+    )
+
+
+def test_summarize_batch_buckets_by_length_and_restores_order(generate_calls):
+    lengths = [7, 1, 5, 3, 9, 2]
+    texts = [" ".join(["word"] * n) for n in lengths]
+    
+    summaries = _summarize(texts, batch_size=2)
+    
+    assert summaries == [f"summary of {n}" for n in lengths]
+    assert generate_calls == [[1, 2], [3, 5], [7, 9]]
+
+
+def test_summarize_batch_truncates_to_model_limit(generate_calls):
+    summaries = _summarize(["word " * 2000, "short text"], batch_size=8, input_max_length=4096)
+    
+    assert summaries == ["summary of 1024", "summary of 2"]
+    assert generate_calls == [[2, 1024]]
+
+
+def test_summarize_batch_empty_and_invalid_input(generate_calls):
+    assert _summarize([], batch_size=4) == []
+    assert generate_calls == []
+    
+    with pytest.raises(ValueError):
+        _summarize(["fine", "   "], batch_size=4)
+    with pytest.raises(ValueError):
+        _summarize(["fine"], batch_size=0)
+
+
+def test_split_windows_overlap_covers_every_token():
+    tokens = list(range(25))
+    
+    windows = summarizer._split_windows(tokens, window=10, overlap=3)
+    
+    assert all(len(window) <= 10 for window in windows)
+    assert windows[0][:3] == [0, 1, 2]
+    assert windows[-1][-1] == 24
+    for previous, current in zip(windows, windows[1:]):
+        assert previous[-3:] == current[:3]
+    assert summarizer._split_windows(tokens[:5], window=10, overlap=3) == [tokens[:5]]
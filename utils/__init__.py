@@ -6,12 +6,24 @@ text preprocessing, and other helper functions.
 """
 
 from .languages_detect import detect_languages, support_languages
-from .pdf_extractor import extract_text_from_pdf
-from .preprocessing import preprocess
+from .pdf_extractor import (
+    extract_text_from_pdf, iter_pdf_pages, parse_page_ranges, strip_boilerplate, iter_strip_boilerplate
+)
+from .pdf_inspect import inspect_pdf
+from .preprocessing import preprocess, preprocess_stream, preprocess_many, PreprocessingEngine, get_preprocessing_engine
 
 __all__ = [
     "detect_languages",
     "support_languages", 
     "extract_text_from_pdf",
+    "iter_pdf_pages",
+    "parse_page_ranges",
+    "strip_boilerplate",
+    "iter_strip_boilerplate",
+    "inspect_pdf",
     "preprocess",
+    "preprocess_stream",
+    "preprocess_many",
+    "PreprocessingEngine",
+    "get_preprocessing_engine",
 ]
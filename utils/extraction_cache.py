@@ -0,0 +1,278 @@
+"""
+PDF Summarize - PDF Extraction Cache Module
+
+This module provides a persistent on-disk cache of extracted PDF text.
+Entries are keyed by the SHA-256 of the file bytes plus the extractor
+version and store per-page text as gzip-compressed JSON lines written while
+pages are extracted, so repeated runs over the same document skip PDF
+parsing entirely. The cache directory is kept under a size budget by
+evicting least recently used entries.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import os
+import sys
+import gzip
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PyPDF2
+
+
+# Bump when extraction output changes so stale entries are not reused
+EXTRACTOR_VERSION = f"PyPDF2-{PyPDF2.__version__}/1"
+
+# Default cache location and size budget
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "models" / "extraction_cache"
+DEFAULT_MAX_MB = 256
+
+_ENTRY_SUFFIX = ".jsonl.gz"
+
+
+def file_cache_key(pdf_path: str) -> str:
+    """
+    Compute the cache key of a PDF file.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+    
+    Returns:
+        str: Hex SHA-256 of the file bytes and EXTRACTOR_VERSION
+    """
+    digest = hashlib.sha256(EXTRACTOR_VERSION.encode("utf-8"))
+    with open(pdf_path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Directory of compressed per-page extraction results with LRU eviction.
+    
+    Each entry is one file named after its key. Reads refresh the file's
+    modification time, and writes evict the least recently used files until
+    the directory fits within `max_bytes`.
+    
+    Examples:
+        >>> cache = ExtractionCache("./models/extraction_cache")
+        >>> key = file_cache_key("report.pdf")
+        >>> cache.put(key, {1: "First page", 2: "Second page"}, total_pages=2)
+        >>> cache.get(key)["pages"][1]
+        'First page'
+    """
+    
+    def __init__(self, cache_dir: str = str(DEFAULT_CACHE_DIR), max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir (str, optional): Cache directory, created if missing.
+                                       Defaults to models/extraction_cache.
+            max_bytes (int, optional): Size budget of the directory. Defaults to 256 MB.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / (key + _ENTRY_SUFFIX)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached extraction result.
+        
+        Args:
+            key (str): Key from file_cache_key()
+        
+        Returns:
+            Optional[Dict[str, Any]]: {"total_pages": int, "pages": {page_number: text}}
+                                      or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                header = json.loads(file.readline())
+                pages = {}
+                for line in file:
+                    record = json.loads(line)
+                    pages[record["page"]] = record["text"]
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARNING] Discarding unreadable extraction cache entry: {str(e)}")
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        
+        return {"total_pages": header["total_pages"], "pages": pages}
+    
+    def writer(self, key: str, total_pages: int) -> "_EntryWriter":
+        """
+        Start writing an entry page by page.
+        
+        The entry only becomes visible once commit() is called, so an
+        interrupted extraction never leaves a partial entry behind.
+        
+        Args:
+            key (str): Key from file_cache_key()
+            total_pages (int): Number of pages in the document
+        
+        Returns:
+            _EntryWriter: Writer accepting pages in order
+        """
+        return _EntryWriter(self, key, total_pages)
+    
+    def put(self, key: str, pages: Dict[int, str], total_pages: int) -> None:
+        """
+        Store the extracted text of a document in one call.
+        
+        Args:
+            key (str): Key from file_cache_key()
+            pages (Dict[int, str]): Text per 1-based page number (pages with text only)
+            total_pages (int): Number of pages in the document
+        """
+        entry = self.writer(key, total_pages)
+        for number in sorted(pages):
+            entry.add(number, pages[number])
+        entry.commit()
+    
+    def _evict(self) -> None:
+        """Delete least recently used entries until the directory fits max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*" + _ENTRY_SUFFIX):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Hits, misses, entry count and directory size
+        """
+        sizes = [path.stat().st_size for path in self.cache_dir.glob("*" + _ENTRY_SUFFIX)]
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.cache_dir),
+                "entries": len(sizes),
+                "size_bytes": sum(sizes),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+class _EntryWriter:
+    """Incremental writer for one cache entry, committed atomically."""
+    
+    def __init__(self, cache: ExtractionCache, key: str, total_pages: int):
+        self._cache = cache
+        self._path = cache._path(key)
+        self._tmp_path = self._path.with_name(
+            f"{self._path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        self._file = None
+        try:
+            self._file = gzip.open(self._tmp_path, "wt", encoding="utf-8", compresslevel=6)
+            self._write({"version": EXTRACTOR_VERSION, "total_pages": total_pages})
+        except OSError as e:
+            print(f"[WARNING] Failed to write extraction cache entry: {str(e)}")
+            self.discard()
+    
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+    
+    def add(self, page_number: int, text: str) -> None:
+        """Append the text of one page."""
+        if self._file is None:
+            return
+        try:
+            self._write({"page": page_number, "text": text})
+        except OSError as e:
+            print(f"[WARNING] Failed to write extraction cache entry: {str(e)}")
+            self.discard()
+    
+    def commit(self) -> None:
+        """Publish the entry and enforce the cache size budget."""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            self._file = None
+            os.replace(self._tmp_path, self._path)
+        except OSError as e:
+            print(f"[WARNING] Failed to write extraction cache entry: {str(e)}")
+            self.discard()
+            return
+        self._cache._evict()
+    
+    def discard(self) -> None:
+        """Drop the partially written entry."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+        self._tmp_path.unlink(missing_ok=True)
+
+
+_extraction_cache: Optional[ExtractionCache] = None
+_extraction_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Get the process-wide extraction cache, creating it on first use.
+    
+    Configured through PDF_CACHE_DIR (default models/extraction_cache) and
+    PDF_CACHE_MAX_MB (default 256).
+    
+    Returns:
+        ExtractionCache: The shared cache
+    """
+    global _extraction_cache
+    
+    if _extraction_cache is None:
+        with _extraction_cache_lock:
+            if _extraction_cache is None:
+                _extraction_cache = ExtractionCache(
+                    cache_dir=os.environ.get("PDF_CACHE_DIR") or str(DEFAULT_CACHE_DIR),
+                    max_bytes=int(float(os.environ.get("PDF_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+                )
+    
+    return _extraction_cache
@@ -11,13 +11,19 @@ License: MIT
 """
 
 import os
+import re
 import sys
-from typing import Optional, List
+import hashlib
+import threading
+from typing import Any, Dict, Optional, List, Tuple
 
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from langdetect import detect, DetectorFactory, LangDetectException
+from langdetect import detect_langs, DetectorFactory, LangDetectException
+from langdetect import detector_factory
+
+from utils.lru_cache import LRUCache
 
 
 # List of supported language codes
@@ -27,24 +33,163 @@ SUPPORT_LANGUAGES: List[str] = ['en', 'ca', 'es', 'fr', 'it', 'pt', 'ro']
 # Set random seed for reproducible language detection results
 DetectorFactory.seed = 0
 
+# Sampling rounds for long texts as (snippet count, snippet length). Each
+# round spreads its snippets evenly from the start to the end of the text;
+# later rounds only run when the previous one was below the confidence
+# threshold. The last round stays within langdetect's own 10000 character
+# limit, so detection cost does not grow with document size.
+SAMPLE_ROUNDS: List[Tuple[int, int]] = [(3, 400), (8, 500), (20, 500)]
+
+# Probability of the top language required to stop escalating
+DETECTION_CONFIDENCE = 0.9
+
+# Target length of segments for per-segment detection; shorter paragraphs are
+# merged with their neighbours because langdetect is unreliable on them
+SEGMENT_CHARS = 1000
+MIN_SEGMENT_CHARS = 200
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# Detection results memoized by text hash, bounded by LANG_DETECT_CACHE_SIZE
+_detection_cache = LRUCache(maxsize=int(os.environ.get("LANG_DETECT_CACHE_SIZE", 1024)))
+
+# Marks a cache miss, since None is a valid cached result
+_MISSING = object()
+
+_profiles_lock = threading.Lock()
+_profiles_loaded = False
+
 
-def detect_languages(text: str) -> Optional[str]:
+def preload_language_profiles() -> None:
+    """
+    Load the langdetect language profiles once for the whole process.
+    
+    langdetect otherwise loads its profiles lazily on the first detection,
+    and concurrent first calls can observe a half-initialized factory. Call
+    this at startup to take the load off the first request.
+    """
+    global _profiles_loaded
+    
+    if _profiles_loaded:
+        return
+    
+    with _profiles_lock:
+        if not _profiles_loaded:
+            detector_factory.init_factory()
+            _profiles_loaded = True
+
+
+def get_detection_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics of the language detection cache.
+    
+    Returns:
+        Dict[str, Any]: Entry count, capacity, hits, misses and hit rate
+    """
+    return _detection_cache.stats()
+
+
+def sample_text(text: str, snippets: int, snippet_chars: int) -> str:
+    """
+    Take evenly spaced snippets covering the start, middle and end of a text.
+    
+    Snippet boundaries are moved to the nearest whitespace so words are not
+    cut in half. Texts shorter than the sample are returned unchanged.
+    
+    Args:
+        text (str): Text to sample
+        snippets (int): Number of snippets (at least 1)
+        snippet_chars (int): Approximate length of each snippet
+    
+    Returns:
+        str: Snippets joined by newlines
+    
+    Examples:
+        >>> sample = sample_text(long_text, snippets=3, snippet_chars=400)
+        >>> len(sample) <= 3 * 400 + 2
+        True
+    """
+    if len(text) <= snippets * snippet_chars:
+        return text
+    
+    last_start = len(text) - snippet_chars
+    parts = []
+    for index in range(snippets):
+        start = last_start * index // max(snippets - 1, 1)
+        if start:
+            # Skip the partial word at the snippet start
+            space = text.find(" ", start, start + 50)
+            start = space + 1 if space != -1 else start
+        end = start + snippet_chars
+        if end < len(text):
+            space = text.rfind(" ", end - 50, end)
+            end = space if space != -1 else end
+        parts.append(text[start:end])
+    
+    return "\n".join(parts)
+
+
+def _detect_sampled(text: str, confidence_threshold: float) -> Tuple[str, float]:
+    """
+    Detect the most probable language from stratified samples of the text.
+    
+    Returns:
+        Tuple[str, float]: (language code, probability) of the last round run
+    
+    Raises:
+        LangDetectException: If no round yields any language
+    """
+    best = None
+    
+    for snippets, snippet_chars in SAMPLE_ROUNDS:
+        sample = sample_text(text, snippets, snippet_chars)
+        
+        try:
+            candidates = detect_langs(sample)
+        except LangDetectException:
+            candidates = []
+        
+        if candidates:
+            best = (candidates[0].lang, candidates[0].prob)
+            if best[1] >= confidence_threshold:
+                break
+        
+        if sample is text:
+            # The whole text was already examined
+            break
+    
+    if best is None:
+        raise LangDetectException(0, "No features in text.")
+    
+    return best
+
+
+def detect_languages(text: str, confidence_threshold: float = DETECTION_CONFIDENCE) -> Optional[str]:
     """
     Detect the language of the given text and validate against supported languages.
     
     This function uses the langdetect library to identify the language of input text
     and checks if it's in the list of supported languages for the summarization system.
     
+    Long texts are not analyzed in full: detection runs on a few snippets taken
+    from the start, middle and end, and only escalates to larger samples (see
+    SAMPLE_ROUNDS) while the top language is less probable than
+    `confidence_threshold`. The cost is therefore bounded regardless of length.
+    Results are memoized in an LRU cache keyed by a hash of the text, so
+    resubmitted documents are not detected again.
+    
     Args:
         text (str): The input text to analyze for language detection
-        
+        confidence_threshold (float, optional): Probability at which sampling
+                                                stops escalating. Defaults to 0.9.
+    
     Returns:
         Optional[str]: The detected language code if supported, None otherwise
                         Examples: 'en', 'fr', 'es', 'it', 'pt', 'ro', 'ca'
-                    
+    
     Raises:
         None: Function handles all exceptions internally and returns None on failure
-        
+    
     Examples:
         >>> detect_languages("Hello, how are you?")
         'en'
@@ -60,39 +205,189 @@ def detect_languages(text: str) -> Optional[str]:
         
         >>> detect_languages("Text in unsupported language")
         None
-        
+    
     Note:
         - Requires sufficient text length for accurate detection
         - Short texts may result in detection failure
         - Only returns languages supported by the translation models
         - Results are deterministic due to fixed random seed
+        - Long texts are sampled, so detection time does not grow with length
     """
+    # Validate input
+    if not isinstance(text, str) or not text.strip():
+        print("[WARNING] Empty or invalid text provided for language detection.")
+        return None
+    
+    detected_lang = detect_language_code(text, confidence_threshold)
+    if detected_lang is None:
+        return None
+    
+    # Check if detected language is supported
+    if detected_lang not in SUPPORT_LANGUAGES:
+        print(f"[WARNING] Detected language '{detected_lang}' is not supported.")
+        print(f"[INFO] Supported languages: {', '.join(SUPPORT_LANGUAGES)}")
+        return None
+    
+    print(f"[INFO] Language detected: {detected_lang}")
+    return detected_lang
+
+
+def detect_language_code(text: str, confidence_threshold: float = DETECTION_CONFIDENCE) -> Optional[str]:
+    """
+    Detect the language of a text without checking it against SUPPORT_LANGUAGES.
+    
+    Uses the same sampling and memoization as detect_languages(), but returns
+    the langdetect code of unsupported languages too, so callers can tell an
+    unsupported language apart from a failed detection.
+    
+    Args:
+        text (str): The input text to analyze
+        confidence_threshold (float, optional): Probability at which sampling
+                                                stops escalating. Defaults to 0.9.
+    
+    Returns:
+        Optional[str]: The langdetect language code (e.g. 'en', 'de', 'zh-cn'),
+                       or None if no language could be detected
+    
+    Examples:
+        >>> detect_language_code("Guten Morgen, wie geht es Ihnen heute?")
+        'de'
+    """
+    if not isinstance(text, str) or not text.strip():
+        return None
+    
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    cache_key = (digest, confidence_threshold)
+    
+    cached = _detection_cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
+        if cached is None:
+            print("[WARNING] Language not detected (cached result).")
+        return cached
+    
     try:
-        # Validate input
-        if not isinstance(text, str) or not text.strip():
-            print("[WARNING] Empty or invalid text provided for language detection.")
-            return None
-        
-        # Perform language detection
-        detected_lang = detect(text)
+        detected_lang = _detect_language(text, confidence_threshold)
+    except Exception as e:
+        # Not cached: the failure may be transient
+        print(f"[ERROR] Unexpected error during language detection: {str(e)}")
+        return None
+    
+    _detection_cache.put(cache_key, detected_lang)
+    return detected_lang
+
+
+def _detect_language(text: str, confidence_threshold: float) -> Optional[str]:
+    """
+    Run sampled detection on a text.
+    
+    Returns:
+        Optional[str]: Detected language code, supported or not, or None if
+                       detection failed
+    """
+    preload_language_profiles()
+    
+    try:
+        # Perform language detection on a bounded sample
+        detected_lang, probability = _detect_sampled(text, confidence_threshold)
         
-        # Check if detected language is supported
-        if detected_lang not in SUPPORT_LANGUAGES:
-            print(f"[WARNING] Detected language '{detected_lang}' is not supported.")
-            print(f"[INFO] Supported languages: {', '.join(SUPPORT_LANGUAGES)}")
-            return None
+        if probability < confidence_threshold:
+            print(f"[WARNING] Low language detection confidence: {detected_lang} ({probability:.2f})")
         
-        print(f"[INFO] Language detected: {detected_lang}")
         return detected_lang
-        
+    
     except LangDetectException as e:
         print(f"[ERROR] Unable to detect text language: {str(e)}")
         print("[INFO] This may occur with very short or mixed-language text.")
         return None
+
+
+def _split_paragraphs(text: str, segment_chars: int) -> List[str]:
+    """Split text into paragraphs, cutting overlong ones on whitespace."""
+    paragraphs = [p.strip() for p in _PARAGRAPH_BREAK.split(text) if p.strip()]
+    if len(paragraphs) == 1:
+        # No blank lines (e.g. extracted PDF text): fall back to line breaks
+        paragraphs = [p.strip() for p in paragraphs[0].splitlines() if p.strip()]
     
-    except Exception as e:
-        print(f"[ERROR] Unexpected error during language detection: {str(e)}")
-        return None
+    pieces = []
+    for paragraph in paragraphs:
+        while len(paragraph) > 2 * segment_chars:
+            cut = paragraph.rfind(" ", 0, segment_chars)
+            cut = cut if cut > 0 else segment_chars
+            pieces.append(paragraph[:cut])
+            paragraph = paragraph[cut:].lstrip()
+        pieces.append(paragraph)
+    
+    return pieces
+
+
+def detect_segments(
+    text: str,
+    segment_chars: int = SEGMENT_CHARS,
+    min_segment_chars: int = MIN_SEGMENT_CHARS
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split text into paragraph segments and detect the language of each one.
+    
+    Paragraphs are packed into segments of roughly `segment_chars`
+    characters, and those shorter than `min_segment_chars` are joined to
+    their neighbours. Segments are labelled with the raw langdetect code, so
+    segments in an unsupported language keep that code for the caller to
+    reject or skip. Only segments whose language cannot be detected at all
+    take the language of the preceding segment (or the following one at the
+    start), and adjacent segments in the same language are merged.
+    
+    Args:
+        text (str): Text to segment
+        segment_chars (int, optional): Approximate segment length. Defaults to 1000.
+        min_segment_chars (int, optional): Minimum segment length for detection.
+                                           Defaults to 200.
+    
+    Returns:
+        List[Tuple[str, Optional[str]]]: (segment text, language code) in
+                                         document order; codes may be outside
+                                         SUPPORT_LANGUAGES, and are None only
+                                         if no segment could be detected
+    
+    Examples:
+        >>> detect_segments(french_body + "\\n\\n" + english_abstract)
+        [('Le présent rapport ...', 'fr'), ('This report ...', 'en')]
+    """
+    if not isinstance(text, str) or not text.strip():
+        return []
+    
+    # Pack paragraphs into segments of a detectable size
+    segments: List[str] = []
+    current = ""
+    for paragraph in _split_paragraphs(text, segment_chars):
+        if current and len(current) >= min_segment_chars and len(current) + len(paragraph) > segment_chars:
+            segments.append(current)
+            current = ""
+        current = f"{current}\n{paragraph}" if current else paragraph
+    if current:
+        if segments and len(current) < min_segment_chars:
+            segments[-1] = f"{segments[-1]}\n{current}"
+        else:
+            segments.append(current)
+    
+    languages = [detect_language_code(segment) for segment in segments]
+    
+    # Undetected segments follow their neighbours
+    for index in range(1, len(languages)):
+        if languages[index] is None:
+            languages[index] = languages[index - 1]
+    for index in range(len(languages) - 2, -1, -1):
+        if languages[index] is None:
+            languages[index] = languages[index + 1]
+    
+    # Merge runs of the same language
+    merged: List[Tuple[str, Optional[str]]] = []
+    for segment, lang in zip(segments, languages):
+        if merged and merged[-1][1] == lang:
+            merged[-1] = (f"{merged[-1][0]}\n{segment}", lang)
+        else:
+            merged.append((segment, lang))
+    
+    return merged
 
 
 def is_language_supported(lang_code: str) -> bool:
@@ -101,10 +396,10 @@ def is_language_supported(lang_code: str) -> bool:
     
     Args:
         lang_code (str): Language code to check (e.g., 'en', 'fr', 'es')
-        
+    
     Returns:
         bool: True if language is supported, False otherwise
-        
+    
     Examples:
         >>> is_language_supported('en')
         True
@@ -121,7 +416,7 @@ def get_supported_languages() -> List[str]:
     
     Returns:
         List[str]: List of supported language codes
-        
+    
     Examples:
         >>> get_supported_languages()
         ['en', 'ca', 'es', 'fr', 'it', 'pt', 'ro']
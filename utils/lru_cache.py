@@ -0,0 +1,122 @@
+"""
+PDF Summarize - LRU Cache Module
+
+This module provides a small thread-safe least-recently-used cache with
+hit/miss accounting, shared by the caching layers of the pipeline.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe bounded mapping that evicts the least recently used entry.
+    
+    Attributes:
+        maxsize (int): Maximum number of entries kept
+        hits (int): Number of successful lookups
+        misses (int): Number of failed lookups
+    
+    Examples:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.put("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.get("b") is None
+        True
+        >>> cache.stats()["hit_rate"]
+        0.5
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 128.
+        
+        Raises:
+            ValueError: If maxsize is negative
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+        
+        Args:
+            key (Hashable): Cache key
+            default (Any, optional): Value returned on a miss. Defaults to None.
+        
+        Returns:
+            Any: Cached value, or default if the key is absent
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to store
+        """
+        if self.maxsize == 0:
+            return
+        
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Entry count, capacity, hits, misses and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
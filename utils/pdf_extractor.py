@@ -11,8 +11,12 @@ License: MIT
 """
 
 import os
+import re
 import sys
-from typing import Optional
+from collections import Counter
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from pathlib import Path
 
 # Add project root to Python path
@@ -20,57 +24,253 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import PyPDF2
 
+from utils.extraction_cache import file_cache_key, get_extraction_cache
+from utils.pdf_inspect import InvalidPDFError, inspect_pdf
 
-def extract_text_from_pdf(pdf_path: str) -> str:
+
+# Documents with fewer pages are always extracted serially; below this size
+# process start-up costs more than parallel parsing saves
+PARALLEL_MIN_PAGES = 32
+
+# Page ranges handed to each worker process per scheduling round
+SHARDS_PER_WORKER = 4
+
+# Lines at the top and bottom of each page considered as running headers
+# and footers by strip_boilerplate()
+BOILERPLATE_EDGE_LINES = 3
+
+# Fraction of pages a header/footer line must appear on to be dropped
+BOILERPLATE_MIN_RATIO = 0.5
+
+# Leading pages examined by iter_strip_boilerplate() before it starts
+# yielding; repeated lines are learned from this sample only
+BOILERPLATE_SAMPLE_PAGES = 16
+
+# Lines up to this length are compared with digits masked, so page labels
+# such as "Page 3 of 40" match across pages; longer lines must match exactly
+_PAGE_LABEL_MAX_CHARS = 40
+
+# Highest page number parse_page_ranges() accepts when the page count is
+# unknown, so a range like "1-1000000000" is rejected before it is expanded
+MAX_PAGE_NUMBER = 100000
+
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+
+# (page_number, text, error) for one page
+PageResult = Tuple[int, Optional[str], Optional[str]]
+
+
+def _default_workers() -> int:
+    """Worker count from PDF_EXTRACT_WORKERS, defaulting to the CPU count."""
+    return int(os.environ.get("PDF_EXTRACT_WORKERS", 0)) or os.cpu_count() or 1
+
+
+def parse_page_ranges(spec: str, max_page: Optional[int] = None) -> List[int]:
     """
-    Extract text content from a PDF file.
+    Parse a page range specification such as "1-3,7,10-12".
     
-    This function reads a PDF file and extracts all text content from each page,
-    combining them into a single string. It handles various PDF formats and
-    provides appropriate error messages for different failure cases.
+    Every range is checked against the last page before it is expanded, so
+    the size of the result is bounded by the document rather than the spec.
     
     Args:
-        pdf_path (str): Path to the PDF file to process
-        
+        spec (str): Comma-separated page numbers and inclusive ranges, 1-based
+        max_page (int, optional): Last page of the document. Defaults to
+                                  MAX_PAGE_NUMBER when the page count is unknown.
+    
     Returns:
-        str: Extracted text content from the PDF, or empty string if extraction fails
-        
+        List[int]: Sorted, de-duplicated page numbers
+    
     Raises:
-        None: Function handles all exceptions internally and returns empty string on failure
-        
+        ValueError: If the specification is malformed or contains pages < 1
+                    or past the last page
+    
     Examples:
-        >>> text = extract_text_from_pdf("document.pdf")
-        >>> if text:
-        ...     print(f"Extracted {len(text)} characters")
-        ... else:
-        ...     print("No text could be extracted")
+        >>> parse_page_ranges("1-3,7")
+        [1, 2, 3, 7]
+    """
+    pages = set()
+    
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
         
-        >>> # With full path
-        >>> text = extract_text_from_pdf("/home/user/documents/report.pdf")
+        first, sep, last = part.partition("-")
+        try:
+            start = int(first)
+            end = int(last) if sep else start
+        except ValueError:
+            raise ValueError(f"Invalid page range: '{part}'") from None
         
-    Note:
-        - Works best with text-based PDFs
-        - Image-based PDFs (scanned documents) may not extract readable text
-        - Encrypted PDFs may require additional handling
-        - Large PDFs may take longer to process
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page range: '{part}'")
+        
+        last_page = max_page if max_page is not None else MAX_PAGE_NUMBER
+        if end > last_page:
+            raise ValueError(f"Page range '{part}' is past the last page ({last_page})")
+        
+        pages.update(range(start, end + 1))
+    
+    if not pages:
+        raise ValueError("Page range specification is empty")
+    
+    return sorted(pages)
+
+
+def _extract_pages(pdf_path: str, indices: Sequence[int]) -> List[PageResult]:
+    """
+    Extract text from the given pages of a PDF.
+    
+    Runs in a worker process, so it opens its own PdfReader.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        indices (Sequence[int]): Page indices to extract (0-based)
+    
+    Returns:
+        List[PageResult]: (page_number, text, error) per page, 1-based page numbers
+    """
+    results = []
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        if reader.is_encrypted:
+            reader.decrypt("")
+        
+        for index in indices:
+            try:
+                results.append((index + 1, reader.pages[index].extract_text(), None))
+            except Exception as e:
+                results.append((index + 1, None, str(e)))
+    
+    return results
+
+
+def _iter_pages_parallel(pdf_path: str, indices: Sequence[int], workers: int) -> Iterator[PageResult]:
+    """
+    Extract pages by sharding them across a process pool.
+    
+    Shards are yielded in page order as soon as each one is ready, while
+    later shards are still being parsed. Closing the generator early cancels
+    shards that have not started.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        indices (Sequence[int]): Page indices to extract (0-based, ascending)
+        workers (int): Number of worker processes
+    
+    Yields:
+        PageResult: Results for every requested page, in page order
+    """
+    shard_size = max(1, -(-len(indices) // (workers * SHARDS_PER_WORKER)))
+    shards = [indices[start:start + shard_size] for start in range(0, len(indices), shard_size)]
+    
+    print(f"[INFO] Extracting {len(indices)} pages with {workers} worker processes")
+    
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # map() yields shards in submission order, so pages stay ordered
+        for shard in executor.map(_extract_pages, [pdf_path] * len(shards), shards):
+            yield from shard
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_pdf_pages(
+    pdf_path: str,
+    workers: Optional[int] = None,
+    parallel_min_pages: int = PARALLEL_MIN_PAGES,
+    use_cache: bool = True,
+    pages: Optional[Iterable[int]] = None,
+    max_chars: Optional[int] = None
+) -> Iterator[Tuple[int, str]]:
+    """
+    Lazily extract text from a PDF, one page at a time.
+    
+    Pages are yielded as soon as they are parsed, so downstream stages can
+    start on the first page while later pages are still being extracted.
+    Pages without text are skipped with a warning. Large documents are parsed
+    in parallel: page ranges are sharded across a process pool whose workers
+    each open their own reader, and pages are still yielded in order.
+    
+    Completed extractions are stored in the persistent extraction cache keyed
+    by the file's content hash, so later runs over the same bytes are served
+    from disk without parsing the PDF.
+    
+    `pages` restricts extraction to selected pages, and `max_chars` stops it
+    once the yielded text reaches the budget, so callers that only use the
+    start of a document do not pay for parsing the rest of it. Pages are
+    parsed serially when a budget is set, since a process pool would parse
+    pages past the cut-off. Only complete passes over the whole document are
+    written to the cache, but restricted passes are served from it.
+    
+    Args:
+        pdf_path (str): Path to the PDF file to process
+        workers (int, optional): Worker processes for parallel extraction.
+                                 Defaults to PDF_EXTRACT_WORKERS or the CPU
+                                 count; 1 forces serial extraction.
+        parallel_min_pages (int, optional): Minimum page count for parallel
+                                            extraction. Defaults to 32.
+        use_cache (bool, optional): Read and populate the extraction cache.
+                                    Defaults to True.
+        pages (Iterable[int], optional): 1-based page numbers to extract; pages
+                                         past the end are ignored. Defaults to
+                                         all pages.
+        max_chars (int, optional): Stop once the yielded text reaches this many
+                                   characters. Defaults to no budget.
+    
+    Yields:
+        Tuple[int, str]: (page_number, text) for each page with text, 1-based
+    
+    Raises:
+        None: Errors are reported and end the iteration early
+    
+    Examples:
+        >>> for page_number, text in iter_pdf_pages("report.pdf"):
+        ...     print(page_number, len(text))
     """
+    cache_entry = None
+    selected = set(pages) if pages is not None else None
+    
     try:
         # Validate input path
         pdf_file = Path(pdf_path)
         
         if not pdf_file.exists():
             print(f"[ERROR] PDF file not found: {pdf_path}")
-            return ""
+            return
         
         if not pdf_file.is_file():
             print(f"[ERROR] Path is not a file: {pdf_path}")
-            return ""
+            return
         
         if pdf_file.suffix.lower() != '.pdf':
             print(f"[WARNING] File may not be a PDF: {pdf_path}")
         
         print(f"[INFO] Processing PDF: {pdf_file.name}")
         
+        if use_cache:
+            cache = get_extraction_cache()
+            cache_key = file_cache_key(pdf_path)
+            cached = cache.get(cache_key)
+            
+            if cached is not None:
+                cached_pages = cached["pages"]
+                print(f"[INFO] Using cached extraction of {cached['total_pages']} pages")
+                
+                page_nums = sorted(cached_pages)
+                if selected is not None:
+                    page_nums = [page_num for page_num in page_nums if page_num in selected]
+                
+                total_chars = 0
+                for page_num in page_nums:
+                    yield page_num, cached_pages[page_num]
+                    total_chars += len(cached_pages[page_num])
+                    if max_chars is not None and total_chars >= max_chars:
+                        print(f"[INFO] Character budget of {max_chars} reached at page {page_num}")
+                        break
+                return
+        
         # Open and read the PDF file
         with open(pdf_path, "rb") as file:
             try:
@@ -83,75 +283,339 @@ def extract_text_from_pdf(pdf_path: str) -> str:
                         reader.decrypt("")  # Try empty password
                     except Exception as e:
                         print(f"[ERROR] Cannot decrypt PDF: {str(e)}")
-                        return ""
+                        return
                 
                 total_pages = len(reader.pages)
                 print(f"[INFO] PDF contains {total_pages} pages")
                 
                 if total_pages == 0:
                     print("[WARNING] PDF contains no pages")
-                    return ""
+                    return
                 
-                # Extract text from all pages
-                extracted_text = ""
-                successful_pages = 0
+                if selected is None:
+                    indices = list(range(total_pages))
+                else:
+                    indices = [page_num - 1 for page_num in sorted(selected) if 1 <= page_num <= total_pages]
+                    print(f"[INFO] Extracting {len(indices)} selected pages")
                 
-                for page_num, page in enumerate(reader.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            extracted_text += page_text + "\n"
-                            successful_pages += 1
-                        else:
-                            print(f"[WARNING] No text found on page {page_num}")
-                    
-                    except Exception as e:
-                        print(f"[WARNING] Failed to extract text from page {page_num}: {str(e)}")
-                        continue
+                if workers is None:
+                    workers = _default_workers()
+                workers = min(workers, len(indices))
                 
-                # Final processing
-                extracted_text = extracted_text.strip()
+                if workers > 1 and len(indices) >= parallel_min_pages and max_chars is None:
+                    page_results = _iter_pages_parallel(pdf_path, indices, workers)
+                else:
+                    page_results = _iter_pages_serial(reader, indices)
                 
-                if extracted_text:
-                    print(f"[SUCCESS] Extracted text from {successful_pages}/{total_pages} pages")
-                    print(f"[INFO] Total characters extracted: {len(extracted_text)}")
-                    return extracted_text
+                # Only a full pass over the document can populate the cache
+                if use_cache and selected is None:
+                    cache_entry = cache.writer(cache_key, total_pages)
+                
+                successful_pages = 0
+                total_chars = 0
+                
+                for page_num, page_text, error in page_results:
+                    if error is not None:
+                        print(f"[WARNING] Failed to extract text from page {page_num}: {error}")
+                    elif page_text and page_text.strip():
+                        successful_pages += 1
+                        if cache_entry is not None:
+                            cache_entry.add(page_num, page_text)
+                        yield page_num, page_text
+                        
+                        total_chars += len(page_text)
+                        if max_chars is not None and total_chars >= max_chars:
+                            print(f"[INFO] Character budget of {max_chars} reached at page {page_num}")
+                            break
+                    else:
+                        print(f"[WARNING] No text found on page {page_num}")
                 else:
-                    print("[WARNING] No text could be extracted from any page")
-                    print("[INFO] This may be an image-based PDF requiring OCR")
-                    return ""
-                    
+                    # Completed without hitting the budget; an interrupted
+                    # pass is discarded below
+                    if cache_entry is not None:
+                        cache_entry.commit()
+                        cache_entry = None
+                
+                if successful_pages:
+                    print(f"[SUCCESS] Extracted text from {successful_pages}/{total_pages} pages")
+            
             except PyPDF2.errors.PdfReadError as e:
                 print(f"[ERROR] Cannot read PDF file - corrupted or invalid format: {str(e)}")
-                return ""
-                
+            
             except Exception as e:
                 print(f"[ERROR] Unexpected error while reading PDF: {str(e)}")
-                return ""
-                
+    
     except PermissionError:
         print(f"[ERROR] Permission denied accessing file: {pdf_path}")
-        return ""
-        
+    
     except FileNotFoundError:
         print(f"[ERROR] File not found: {pdf_path}")
-        return ""
-        
+    
     except Exception as e:
         print(f"[ERROR] Unexpected error during PDF processing: {str(e)}")
-        return ""
+    
+    finally:
+        if cache_entry is not None:
+            cache_entry.discard()
+
+
+def _iter_pages_serial(reader: PyPDF2.PdfReader, indices: Sequence[int]) -> Iterator[PageResult]:
+    """Extract the given pages (0-based indices) one by one in the calling process."""
+    for index in indices:
+        try:
+            yield index + 1, reader.pages[index].extract_text(), None
+        except Exception as e:
+            yield index + 1, None, str(e)
+
+
+def _boilerplate_key(line: str) -> int:
+    """Hash of a line normalized for header/footer comparison."""
+    normalized = _SPACES.sub(" ", line.strip().lower())
+    if len(normalized) <= _PAGE_LABEL_MAX_CHARS:
+        normalized = _DIGITS.sub("#", normalized)
+    return hash(normalized)
+
+
+def _edge_lines(lines: List[str], edge_lines: int) -> List[int]:
+    """Indices of the first and last `edge_lines` non-blank lines of a page."""
+    content = [index for index, line in enumerate(lines) if line.strip()]
+    if len(content) <= 2 * edge_lines:
+        return content
+    return content[:edge_lines] + content[-edge_lines:]
+
+
+def strip_boilerplate(
+    pages: List[str],
+    edge_lines: int = BOILERPLATE_EDGE_LINES,
+    min_ratio: float = BOILERPLATE_MIN_RATIO,
+    min_pages: int = 3
+) -> List[str]:
+    """
+    Remove running headers, footers and page numbers repeated across pages.
+    
+    The top and bottom lines of every page are normalized (case, whitespace
+    and, for short lines, digits) and hashed; lines whose hash appears on at
+    least `min_ratio` of the pages are dropped. Only hashes are counted, so
+    memory stays small for long documents.
+    
+    Args:
+        pages (List[str]): Text of each page, in order
+        edge_lines (int, optional): Lines at each page edge considered.
+                                    Defaults to 3.
+        min_ratio (float, optional): Fraction of pages a line must appear on.
+                                     Defaults to 0.5.
+        min_pages (int, optional): Minimum document length and number of
+                                   occurrences for stripping. Defaults to 3.
+    
+    Returns:
+        List[str]: Page texts without the repeated lines
+    
+    Examples:
+        >>> bodies = ["Revenue grew.", "Costs fell.", "Outlook is stable."]
+        >>> pages = [f"ACME Report\\n{body}\\nPage {n} of 3" for n, body in enumerate(bodies, 1)]
+        >>> strip_boilerplate(pages)
+        ['Revenue grew.', 'Costs fell.', 'Outlook is stable.']
+    """
+    if len(pages) < min_pages:
+        return pages
+    
+    split_pages = [page.splitlines() for page in pages]
+    edges = [_edge_lines(lines, edge_lines) for lines in split_pages]
+    repeated = _repeated_edge_keys(split_pages, edges, min_ratio, min_pages)
+    if not repeated:
+        return pages
+    
+    stripped_pages = []
+    removed_lines = 0
+    for lines, indices in zip(split_pages, edges):
+        text, dropped = _drop_edge_lines(lines, indices, repeated)
+        removed_lines += dropped
+        stripped_pages.append(text)
+    
+    print(f"[INFO] Removed {removed_lines} repeated header/footer lines")
+    return stripped_pages
+
+
+def iter_strip_boilerplate(
+    pages: Iterable[str],
+    sample_pages: int = BOILERPLATE_SAMPLE_PAGES,
+    edge_lines: int = BOILERPLATE_EDGE_LINES,
+    min_ratio: float = BOILERPLATE_MIN_RATIO,
+    min_pages: int = 3
+) -> Iterator[str]:
+    """
+    Lazily remove running headers, footers and page numbers from a page stream.
+    
+    Works like strip_boilerplate(), but repeated lines are learned from the
+    first `sample_pages` pages only. Those pages are buffered; every page is
+    then stripped and yielded as it arrives, so memory is bounded by the
+    sample instead of the document. Headers that only start after the sample
+    (e.g. per-chapter titles) are not detected.
+    
+    Args:
+        pages (Iterable[str]): Text of each page, in order
+        sample_pages (int, optional): Leading pages used to find repeated
+                                      lines. Defaults to 16.
+        edge_lines, min_ratio, min_pages: Same as strip_boilerplate(),
+                                          applied to the sample
+    
+    Yields:
+        str: Page texts without the repeated lines
+    
+    Examples:
+        >>> pages = (text for _, text in iter_pdf_pages("report.pdf"))
+        >>> for text in iter_strip_boilerplate(pages):
+        ...     print(len(text))
+    """
+    page_iter = iter(pages)
+    sample = list(islice(page_iter, sample_pages))
+    
+    repeated = set()
+    if len(sample) >= min_pages:
+        split_sample = [page.splitlines() for page in sample]
+        edges = [_edge_lines(lines, edge_lines) for lines in split_sample]
+        repeated = _repeated_edge_keys(split_sample, edges, min_ratio, min_pages)
+    
+    if not repeated:
+        yield from sample
+        yield from page_iter
+        return
+    
+    removed_lines = 0
+    for page in chain(sample, page_iter):
+        lines = page.splitlines()
+        text, dropped = _drop_edge_lines(lines, _edge_lines(lines, edge_lines), repeated)
+        removed_lines += dropped
+        yield text
+    
+    print(f"[INFO] Removed {removed_lines} repeated header/footer lines")
+
+
+def _repeated_edge_keys(
+    split_pages: List[List[str]],
+    edges: List[List[int]],
+    min_ratio: float,
+    min_pages: int
+) -> Set[int]:
+    """Keys of edge lines found on at least max(min_pages, min_ratio * pages) pages."""
+    # Count each key once per page
+    counts: Counter = Counter()
+    for lines, indices in zip(split_pages, edges):
+        counts.update({_boilerplate_key(lines[index]) for index in indices})
+    
+    threshold = max(min_pages, min_ratio * len(split_pages))
+    return {key for key, count in counts.items() if count >= threshold}
+
+
+def _drop_edge_lines(lines: List[str], indices: List[int], repeated: Set[int]) -> Tuple[str, int]:
+    """Join a page's lines without the repeated edge lines; returns (text, dropped count)."""
+    drop = {index for index in indices if _boilerplate_key(lines[index]) in repeated}
+    return "\n".join(line for index, line in enumerate(lines) if index not in drop), len(drop)
+
+
+def extract_text_from_pdf(
+    pdf_path: str,
+    workers: Optional[int] = None,
+    parallel_min_pages: int = PARALLEL_MIN_PAGES,
+    use_cache: bool = True,
+    pages: Optional[Iterable[int]] = None,
+    max_chars: Optional[int] = None,
+    remove_boilerplate: bool = False
+) -> str:
+    """
+    Extract text content from a PDF file.
+    
+    This function reads a PDF file and extracts all text content from each page,
+    combining them into a single string. It handles various PDF formats and
+    provides appropriate error messages for different failure cases. Use
+    iter_pdf_pages() to process pages as they are extracted instead.
+    
+    Large documents are parsed in parallel: page ranges are sharded across a
+    process pool whose workers each open their own reader, and the text is
+    merged in page order. Small documents are extracted serially. Results
+    are cached on disk by file content hash (see iter_pdf_pages()).
+    
+    Pass `pages` and/or `max_chars` when only part of the document will be
+    used, so that extraction stops as soon as enough text is available.
+    With `remove_boilerplate`, running headers, footers and page numbers are
+    removed with strip_boilerplate() before the pages are joined.
+    
+    Args:
+        pdf_path (str): Path to the PDF file to process
+        workers (int, optional): Worker processes for parallel extraction.
+                                 Defaults to PDF_EXTRACT_WORKERS or the CPU
+                                 count; 1 forces serial extraction.
+        parallel_min_pages (int, optional): Minimum page count for parallel
+                                            extraction. Defaults to 32.
+        use_cache (bool, optional): Read and populate the extraction cache.
+                                    Defaults to True.
+        pages (Iterable[int], optional): 1-based page numbers to extract; pages
+                                         past the end are ignored. Defaults to
+                                         all pages.
+        max_chars (int, optional): Stop once the extracted text reaches this
+                                   many characters. Defaults to no budget.
+        remove_boilerplate (bool, optional): Strip lines repeated at the top or
+                                             bottom of many pages. Defaults to False.
+    
+    Returns:
+        str: Extracted text content from the PDF, or empty string if extraction fails
+    
+    Raises:
+        None: Function handles all exceptions internally and returns empty string on failure
+    
+    Examples:
+        >>> text = extract_text_from_pdf("document.pdf")
+        >>> if text:
+        ...     print(f"Extracted {len(text)} characters")
+        ... else:
+        ...     print("No text could be extracted")
+        
+        >>> # With full path
+        >>> text = extract_text_from_pdf("/home/user/documents/report.pdf")
+        
+        >>> # First five pages, at most 4000 characters
+        >>> text = extract_text_from_pdf("report.pdf", pages=range(1, 6), max_chars=4000)
+    
+    Note:
+        - Works best with text-based PDFs
+        - Image-based PDFs (scanned documents) may not extract readable text
+        - Encrypted PDFs may require additional handling
+        - Large PDFs may take longer to process
+    """
+    page_texts = [
+        page_text for _, page_text in iter_pdf_pages(
+            pdf_path, workers, parallel_min_pages, use_cache, pages, max_chars
+        )
+    ]
+    
+    if remove_boilerplate:
+        page_texts = strip_boilerplate(page_texts)
+    
+    # Join pages once instead of growing a string page by page
+    extracted_text = "\n".join(page_texts).strip()
+    
+    if extracted_text:
+        print(f"[INFO] Total characters extracted: {len(extracted_text)}")
+        return extracted_text
+    
+    print("[WARNING] No text could be extracted from any page")
+    print("[INFO] This may be an image-based PDF requiring OCR")
+    return ""
 
 
 def validate_pdf_file(pdf_path: str) -> tuple[bool, str]:
     """
     Validate if a file is a readable PDF.
     
+    Uses inspect_pdf(), which checks the header, trailer and cross-reference
+    table without parsing pages, so validating a large file is cheap.
+    
     Args:
         pdf_path (str): Path to the PDF file to validate
-        
+    
     Returns:
         tuple[bool, str]: (is_valid, message) - validation result and message
-        
+    
     Examples:
         >>> is_valid, message = validate_pdf_file("document.pdf")
         >>> if is_valid:
@@ -171,20 +635,17 @@ def validate_pdf_file(pdf_path: str) -> tuple[bool, str]:
         if pdf_file.suffix.lower() != '.pdf':
             return False, "File does not have .pdf extension"
         
-        # Try to open and read basic PDF structure
-        with open(pdf_path, "rb") as file:
-            try:
-                reader = PyPDF2.PdfReader(file)
-                page_count = len(reader.pages)
-                
-                if page_count == 0:
-                    return False, "PDF contains no pages"
-                
-                return True, f"Valid PDF with {page_count} pages"
-                
-            except PyPDF2.errors.PdfReadError:
-                return False, "Corrupted or invalid PDF format"
-                
+        # Read the document structure without resolving the page tree
+        try:
+            page_count = inspect_pdf(pdf_path)["page_count"]
+        except InvalidPDFError as e:
+            return False, f"Corrupted or invalid PDF format: {str(e)}"
+        
+        if page_count == 0:
+            return False, "PDF contains no pages"
+        
+        return True, f"Valid PDF with {page_count} pages"
+    
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
@@ -193,36 +654,31 @@ def get_pdf_info(pdf_path: str) -> dict:
     """
     Get detailed information about a PDF file.
     
+    Reads the trailer and cross-reference table through inspect_pdf()
+    instead of loading every page.
+    
     Args:
         pdf_path (str): Path to the PDF file
-        
+    
     Returns:
         dict: PDF information including metadata and page count
     """
     try:
-        with open(pdf_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-            
-            info = {
-                "file_path": pdf_path,
-                "file_size_mb": round(Path(pdf_path).stat().st_size / (1024 * 1024), 2),
-                "page_count": len(reader.pages),
-                "is_encrypted": reader.is_encrypted,
-                "metadata": {},
-                "readable": True
-            }
-            
-            # Extract metadata if available
-            if reader.metadata:
-                for key, value in reader.metadata.items():
-                    if isinstance(value, str):
-                        info["metadata"][key] = value
-            
-            return info
-            
+        inspection = inspect_pdf(pdf_path)
+        
+        return {
+            "file_path": pdf_path,
+            "file_size_mb": round(inspection["file_size"] / (1024 * 1024), 2),
+            "pdf_version": inspection["pdf_version"],
+            "page_count": inspection["page_count"],
+            "is_encrypted": inspection["is_encrypted"],
+            "metadata": inspection["metadata"],
+            "readable": True
+        }
+    
     except Exception as e:
         return {
             "file_path": pdf_path,
             "error": str(e),
             "readable": False
-        }
\ No newline at end of file
+        }
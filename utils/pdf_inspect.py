@@ -0,0 +1,322 @@
+"""
+PDF Summarize - Lightweight PDF Inspection Module
+
+This module reports the page count, encryption flag and document metadata
+of a PDF without building a full PdfReader page tree. The file is
+memory-mapped and only the header, the trailer, the cross-reference table
+and the few objects they point to (catalog, page tree root, info
+dictionary) are read, so inspecting a huge file costs about as much as a
+small one. Files the fast path cannot handle, such as those using
+cross-reference streams, fall back to PyPDF2 without touching its page list.
+
+Author: Caleb Laurent
+Date: 2025
+License: MIT
+"""
+
+import os
+import re
+import sys
+import mmap
+import codecs
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Add project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PyPDF2
+
+
+# Bytes scanned at the start for the header and at the end for startxref
+_HEADER_WINDOW = 1024
+_TAIL_WINDOW = 4096
+
+# Upper bound on the size of a single object body read by the fast path
+_MAX_OBJECT_BYTES = 64 * 1024
+
+# Information dictionary keys reported as metadata
+_INFO_KEYS = ("Title", "Author", "Subject", "Keywords", "Creator", "Producer", "CreationDate", "ModDate")
+
+_HEADER = re.compile(rb"%PDF-(\d\.\d)")
+_STARTXREF = re.compile(rb"startxref\s+(\d+)")
+_XREF_SUBSECTION = re.compile(rb"\s*(\d+)[ \t]+(\d+)[ \t]*[\r\n]")
+_XREF_ENTRY = re.compile(rb"(\d{10})\s(\d{5})\s([nf])")
+_OBJECT_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+_LITERAL_ESCAPES = {
+    b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f",
+    b"(": b"(", b")": b")", b"\\": b"\\",
+}
+
+
+class InvalidPDFError(ValueError):
+    """Raised when a file is not a structurally valid PDF document."""
+
+
+def _ref(dictionary: bytes, key: bytes) -> Optional[Tuple[int, int]]:
+    """Return the (object, generation) reference stored under a key, if any."""
+    match = re.search(rb"/" + key + rb"\s+(\d+)\s+(\d+)\s+R", dictionary)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _parse_xref_table(mm: mmap.mmap, offset: int) -> Tuple[Dict[int, int], bytes, Optional[int]]:
+    """
+    Parse one classic cross-reference section and the trailer following it.
+    
+    Returns:
+        Tuple: (object offsets, trailer dictionary bytes, /Prev offset or None)
+    
+    Raises:
+        ValueError: If the section is not a classic xref table
+    """
+    if mm[offset:offset + 4] != b"xref":
+        raise ValueError("Not a classic xref table")
+    
+    offsets: Dict[int, int] = {}
+    position = offset + 4
+    trailer_at = mm.find(b"trailer", position)
+    if trailer_at == -1:
+        raise ValueError("Missing trailer")
+    
+    table = mm[position:trailer_at]
+    cursor = 0
+    while True:
+        header = _XREF_SUBSECTION.match(table, cursor)
+        if header is None:
+            break
+        first, count = int(header.group(1)), int(header.group(2))
+        cursor = header.end()
+        for number in range(first, first + count):
+            entry = _XREF_ENTRY.search(table, cursor)
+            if entry is None:
+                raise ValueError("Truncated xref table")
+            cursor = entry.end()
+            if entry.group(3) == b"n":
+                offsets[number] = int(entry.group(1))
+        while cursor < len(table) and table[cursor:cursor + 1].isspace():
+            cursor += 1
+    
+    trailer_end = mm.find(b"startxref", trailer_at)
+    trailer = mm[trailer_at:trailer_end if trailer_end != -1 else trailer_at + _MAX_OBJECT_BYTES]
+    
+    prev = re.search(rb"/Prev\s+(\d+)", trailer)
+    return offsets, trailer, int(prev.group(1)) if prev else None
+
+
+def _read_object(mm: mmap.mmap, offsets: Dict[int, int], ref: Tuple[int, int]) -> bytes:
+    """
+    Read the body of an indirect object through the xref offsets.
+    
+    Raises:
+        ValueError: If the object is missing or its header does not match
+    """
+    offset = offsets.get(ref[0])
+    if offset is None or offset >= len(mm):
+        raise ValueError(f"Object {ref[0]} not found in xref")
+    
+    window = mm[offset:offset + _MAX_OBJECT_BYTES]
+    header = _OBJECT_HEADER.match(window)
+    if header is None or int(header.group(1)) != ref[0]:
+        raise ValueError(f"Object {ref[0]} header mismatch")
+    
+    end = window.find(b"endobj", header.end())
+    return window[header.end():end if end != -1 else len(window)]
+
+
+def _decode_pdf_string(raw: bytes, hex_string: bool) -> str:
+    """Decode a PDF literal or hex string (PDFDocEncoding approximated by Latin-1)."""
+    if hex_string:
+        digits = re.sub(rb"\s", b"", raw)
+        if len(digits) % 2:
+            digits += b"0"
+        data = bytes.fromhex(digits.decode("ascii"))
+    else:
+        data = bytearray()
+        i = 0
+        while i < len(raw):
+            char = raw[i:i + 1]
+            if char != b"\\":
+                data += char
+                i += 1
+                continue
+            escaped = raw[i + 1:i + 2]
+            if escaped in _LITERAL_ESCAPES:
+                data += _LITERAL_ESCAPES[escaped]
+                i += 2
+            elif escaped and escaped in b"01234567":
+                octal = re.match(rb"[0-7]{1,3}", raw[i + 1:i + 4]).group(0)
+                data.append(int(octal, 8) & 0xFF)
+                i += 1 + len(octal)
+            else:
+                # Line continuation or unknown escape: drop the backslash
+                i += 1
+        data = bytes(data)
+    
+    if data.startswith(codecs.BOM_UTF16_BE):
+        return data[2:].decode("utf-16-be", errors="replace")
+    return data.decode("latin-1")
+
+
+def _parse_info(info: bytes) -> Dict[str, str]:
+    """Extract string-valued entries from an information dictionary body."""
+    metadata = {}
+    for key in _INFO_KEYS:
+        match = re.search(
+            rb"/" + key.encode("ascii") + rb"\s*(?:\(((?:\\.|[^\\)])*)\)|<([0-9A-Fa-f\s]*)>)",
+            info,
+            re.DOTALL
+        )
+        if match is None:
+            continue
+        if match.group(1) is not None:
+            metadata[f"/{key}"] = _decode_pdf_string(match.group(1), hex_string=False)
+        else:
+            metadata[f"/{key}"] = _decode_pdf_string(match.group(2), hex_string=True)
+    return metadata
+
+
+def _inspect_xref(mm: mmap.mmap, xref_offset: int) -> Optional[Dict[str, Any]]:
+    """
+    Read page count, encryption flag and metadata through classic xref tables.
+    
+    Returns:
+        Optional[Dict[str, Any]]: Inspection result, or None if the file
+                                  needs the PyPDF2 fallback
+    """
+    offsets: Dict[int, int] = {}
+    trailer = None
+    seen = set()
+    offset: Optional[int] = xref_offset
+    
+    # Follow the /Prev chain; newer sections take precedence
+    try:
+        while offset is not None and offset not in seen:
+            seen.add(offset)
+            section, section_trailer, offset = _parse_xref_table(mm, offset)
+            for number, object_offset in section.items():
+                offsets.setdefault(number, object_offset)
+            if trailer is None:
+                trailer = section_trailer
+        
+        root_ref = _ref(trailer, b"Root")
+        if root_ref is None:
+            return None
+        pages_ref = _ref(_read_object(mm, offsets, root_ref), b"Pages")
+        if pages_ref is None:
+            return None
+        count = re.search(rb"/Count\s+(\d+)", _read_object(mm, offsets, pages_ref))
+        if count is None:
+            return None
+        
+        is_encrypted = b"/Encrypt" in trailer
+        info_ref = _ref(trailer, b"Info")
+        # Strings of encrypted documents are encrypted too
+        metadata = {}
+        if info_ref is not None and not is_encrypted:
+            metadata = _parse_info(_read_object(mm, offsets, info_ref))
+    except ValueError:
+        return None
+    
+    return {
+        "page_count": int(count.group(1)),
+        "is_encrypted": is_encrypted,
+        "metadata": metadata,
+        "method": "xref"
+    }
+
+
+def _inspect_pypdf2(pdf_path: str) -> Dict[str, Any]:
+    """
+    Inspect a PDF with PyPDF2, reading the page count from the page tree root.
+    
+    Raises:
+        InvalidPDFError: If PyPDF2 cannot read the file
+    """
+    try:
+        with open(pdf_path, "rb") as file:
+            reader = PyPDF2.PdfReader(file)
+            is_encrypted = reader.is_encrypted
+            
+            # /Count on the root avoids flattening the whole page tree
+            page_count = int(reader.trailer["/Root"]["/Pages"]["/Count"])
+            
+            metadata = {}
+            if not is_encrypted and reader.metadata:
+                for key, value in reader.metadata.items():
+                    if isinstance(value, str):
+                        metadata[key] = value
+    except Exception as e:
+        # PyPDF2 raises many exception types on malformed input (AttributeError,
+        # IndexError, AssertionError, RecursionError, ...); all mean a bad file
+        raise InvalidPDFError(f"Corrupted or invalid PDF format: {str(e)}") from e
+    
+    return {
+        "page_count": page_count,
+        "is_encrypted": is_encrypted,
+        "metadata": metadata,
+        "method": "pypdf2"
+    }
+
+
+def inspect_pdf(pdf_path: str) -> Dict[str, Any]:
+    """
+    Cheaply inspect a PDF file without parsing its pages.
+    
+    The header and the end-of-file trailer are checked through a memory map,
+    which rejects truncated uploads and non-PDF files after reading a few
+    kilobytes. Page count, encryption flag and metadata come from the
+    cross-reference table and trailer, falling back to PyPDF2's trailer for
+    cross-reference streams.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+    
+    Returns:
+        Dict[str, Any]: {
+            "file_size": int,        # Size in bytes
+            "pdf_version": str,      # Header version, e.g. "1.4"
+            "page_count": int,       # /Count of the page tree root
+            "is_encrypted": bool,    # True if the trailer has /Encrypt
+            "metadata": dict,        # Information dictionary strings
+            "method": str            # "xref" or "pypdf2"
+        }
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        InvalidPDFError: If the file is empty, truncated or not a PDF
+    
+    Examples:
+        >>> info = inspect_pdf("report.pdf")
+        >>> info["page_count"], info["is_encrypted"]
+        (60, False)
+    """
+    file_size = Path(pdf_path).stat().st_size
+    if file_size == 0:
+        raise InvalidPDFError("File is empty")
+    
+    with open(pdf_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header = _HEADER.search(mm[:_HEADER_WINDOW])
+            if header is None:
+                raise InvalidPDFError("Missing %PDF header")
+            
+            tail = mm[max(0, file_size - _TAIL_WINDOW):]
+            if b"%%EOF" not in tail:
+                raise InvalidPDFError("Missing %%EOF marker - file may be truncated")
+            
+            startxref = None
+            for startxref in _STARTXREF.finditer(tail):
+                pass
+            if startxref is None:
+                raise InvalidPDFError("Missing startxref - file may be truncated")
+            
+            xref_offset = int(startxref.group(1))
+            if xref_offset >= file_size:
+                raise InvalidPDFError("startxref points past the end of the file")
+            
+            result = _inspect_xref(mm, xref_offset)
+    
+    if result is None:
+        result = _inspect_pypdf2(pdf_path)
+    
+    return {"file_size": file_size, "pdf_version": header.group(1).decode("ascii"), **result}
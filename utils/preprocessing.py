@@ -10,9 +10,14 @@ Date: 2025
 License: MIT
 """
 
+import os
 import re
 import string
-from typing import List, Optional
+import threading
+import functools
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 import nltk
@@ -57,6 +62,282 @@ def download_nltk_dependencies() -> bool:
     return success
 
 
+class PreprocessingEngine:
+    """
+    Reusable text preprocessor holding resolved NLTK resources.
+    
+    NLTK resources are located (and downloaded if missing) once when the
+    engine is created, stop word sets are loaded once per language and kept
+    as frozensets, and the WordNet lemmatizer is warmed up so its corpus is
+    read before the first real call. Each preprocess() call is then pure
+    text processing. Missing resources are reported once and the affected
+    step falls back as before (whitespace split, no stop word removal or no
+    lemmatization).
+    
+    Lemmas are memoized in a bounded LRU cache shared by all calls: word
+    frequencies are heavily skewed, so most tokens become cache lookups
+    instead of WordNet morphology.
+    
+    Examples:
+        >>> engine = PreprocessingEngine()
+        >>> engine.preprocess("The quick brown fox jumps over the lazy dog!")
+        'quick brown fox jump lazy dog'
+    """
+    
+    def __init__(self, lemma_cache_size: int = 100000):
+        """
+        Resolve NLTK resources and warm up the tokenizer and lemmatizer.
+        
+        Args:
+            lemma_cache_size (int, optional): Maximum words in the lemma cache.
+                                              Defaults to 100000.
+        
+        Raises:
+            RuntimeError: If NLTK dependencies cannot be downloaded
+        """
+        if not download_nltk_dependencies():
+            raise RuntimeError("Failed to download required NLTK data")
+        
+        self._stopwords: Dict[str, FrozenSet[str]] = {}
+        self._stopwords_lock = threading.Lock()
+        
+        try:
+            word_tokenize("warm up")
+            self._tokenizer_available = True
+        except Exception as e:
+            print(f"[WARNING] Tokenization unavailable, using simple split: {str(e)}")
+            self._tokenizer_available = False
+        
+        self._lemmatizer: Optional[WordNetLemmatizer] = WordNetLemmatizer()
+        try:
+            # The WordNet corpus is loaded lazily on the first lemmatization
+            self._lemmatizer.lemmatize("warming")
+        except Exception as e:
+            print(f"[WARNING] Lemmatization unavailable: {str(e)}")
+            self._lemmatizer = None
+        
+        self.lemma_cache_size = lemma_cache_size
+        self._lemmatize: Optional[Callable[[str], str]] = None
+        if self._lemmatizer is not None:
+            self._lemmatize = functools.lru_cache(maxsize=lemma_cache_size)(self._lemmatizer.lemmatize)
+    
+    def lemma_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of the lemma cache.
+        
+        Returns:
+            Dict[str, Any]: Entry count, capacity, hits, misses and hit rate
+        """
+        if self._lemmatize is None:
+            return {"entries": 0, "maxsize": self.lemma_cache_size, "hits": 0, "misses": 0, "hit_rate": 0.0}
+        
+        info = self._lemmatize.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "entries": info.currsize,
+            "maxsize": info.maxsize,
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0
+        }
+    
+    def stop_words(self, language: str = 'english') -> FrozenSet[str]:
+        """
+        Get the stop word set of a language, loading it on first use.
+        
+        Args:
+            language (str, optional): NLTK stop word language. Defaults to 'english'.
+        
+        Returns:
+            FrozenSet[str]: Stop words, empty if the list is unavailable
+        """
+        words = self._stopwords.get(language)
+        if words is not None:
+            return words
+        
+        with self._stopwords_lock:
+            if language not in self._stopwords:
+                try:
+                    self._stopwords[language] = frozenset(stopwords.words(language))
+                except Exception as e:
+                    print(f"[WARNING] Stop words removal failed: {str(e)}")
+                    self._stopwords[language] = frozenset()
+            return self._stopwords[language]
+    
+    def preprocess(
+        self,
+        text: str,
+        remove_stopwords: bool = True,
+        apply_lemmatization: bool = True,
+        remove_punctuation: bool = True,
+        remove_digits: bool = True,
+        to_lowercase: bool = True,
+        language: str = 'english'
+    ) -> str:
+        """
+        Preprocess text with the engine's resources (see preprocess()).
+        
+        Returns:
+            str: Preprocessed and cleaned text
+        
+        Raises:
+            ValueError: If input text is not a string
+        """
+        # Input validation
+        if not isinstance(text, str):
+            raise ValueError("Input must be a string")
+        
+        if not text.strip():
+            return ""
+        
+        try:
+            # Steps 1-5: Fused whitespace, case, punctuation and digit normalization
+            text = normalize_text(
+                text,
+                to_lowercase=to_lowercase,
+                remove_punctuation=remove_punctuation,
+                remove_digits=remove_digits
+            )
+            
+            # Step 6: Tokenization
+            words = None
+            if self._tokenizer_available:
+                try:
+                    words = word_tokenize(text)
+                except Exception as e:
+                    print(f"[WARNING] Tokenization failed, using simple split: {str(e)}")
+            if words is None:
+                words = text.split()
+            
+            # Step 7: Remove stop words if requested
+            if remove_stopwords:
+                stop_words = self.stop_words(language)
+                if stop_words:
+                    words = [word for word in words if word and word not in stop_words]
+            
+            # Step 8: Apply lemmatization if requested
+            if apply_lemmatization and self._lemmatize is not None:
+                try:
+                    lemmatize = self._lemmatize
+                    words = [lemmatize(word) for word in words if word]
+                except Exception as e:
+                    print(f"[WARNING] Lemmatization failed: {str(e)}")
+            
+            # Step 9: Reconstruct cleaned text
+            cleaned_text = ' '.join(word for word in words if word.strip())
+            
+            # Final whitespace cleanup
+            cleaned_text = _WHITESPACE.sub(' ', cleaned_text).strip()
+            
+            return cleaned_text
+        
+        except Exception as e:
+            print(f"[ERROR] Preprocessing failed: {str(e)}")
+            return text  # Return original text if preprocessing fails
+
+
+# Whitespace runs other than a lone space, including non-breaking spaces and
+# line breaks; equivalent to substituting \s+ but single spaces are not
+# matched, so substitution copies far fewer segments
+_WHITESPACE = re.compile(r'[^\S ]\s*| \s+')
+
+# Unicode decimal digits, only needed once ASCII digits are translated away
+_DIGITS = re.compile(r'\d+')
+
+# Deletion tables keyed by (remove_punctuation, remove_digits)
+_DELETE_TABLES = {
+    (True, True): str.maketrans('', '', string.punctuation + string.digits),
+    (True, False): str.maketrans('', '', string.punctuation),
+    (False, True): str.maketrans('', '', string.digits),
+}
+
+
+def normalize_text(
+    text: str,
+    to_lowercase: bool = True,
+    remove_punctuation: bool = True,
+    remove_digits: bool = True
+) -> str:
+    """
+    Apply preprocessing steps 1-5 in as few passes over the text as possible.
+    
+    One precompiled whitespace substitution replaces the separate
+    non-breaking space, newline, tab and carriage return replacements and the
+    whitespace collapse. Punctuation and ASCII digits are deleted together by
+    a single translate() table; the Unicode \\d+ substitution only runs when
+    non-ASCII text remains. The result is identical to applying the steps one
+    by one.
+    
+    Args:
+        text (str): Input text
+        to_lowercase (bool, optional): Convert to lowercase. Defaults to True.
+        remove_punctuation (bool, optional): Remove ASCII punctuation. Defaults to True.
+        remove_digits (bool, optional): Remove decimal digits. Defaults to True.
+    
+    Returns:
+        str: Normalized text
+    
+    Examples:
+        >>> normalize_text("Hello,\\xa0World!\\n\\tSection 2")
+        'hello world section '
+    """
+    text = _WHITESPACE.sub(' ', text).strip()
+    
+    if to_lowercase:
+        text = text.lower()
+    
+    table = _DELETE_TABLES.get((bool(remove_punctuation), bool(remove_digits)))
+    if table is not None:
+        text = text.translate(table)
+    
+    if remove_digits and not text.isascii():
+        text = _DIGITS.sub('', text)
+    
+    return text
+
+
+_engine: Optional[PreprocessingEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_preprocessing_engine() -> PreprocessingEngine:
+    """
+    Get the process-wide preprocessing engine, creating it on first use.
+    
+    The lemma cache size is configured through LEMMA_CACHE_SIZE (default 100000).
+    
+    Returns:
+        PreprocessingEngine: The shared engine
+    
+    Raises:
+        RuntimeError: If NLTK dependencies cannot be downloaded
+    """
+    global _engine
+    
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = PreprocessingEngine(
+                    lemma_cache_size=int(os.environ.get("LEMMA_CACHE_SIZE", 100000))
+                )
+    
+    return _engine
+
+
+def get_lemma_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics of the shared engine's lemma cache.
+    
+    Returns:
+        Dict[str, Any]: Entry count, capacity, hits, misses and hit rate
+                        (all zero if the engine has not been created)
+    """
+    engine = _engine
+    if engine is None:
+        return {"entries": 0, "maxsize": 0, "hits": 0, "misses": 0, "hit_rate": 0.0}
+    return engine.lemma_cache_stats()
+
+
 def preprocess(
     text: str,
     remove_stopwords: bool = True,
@@ -80,6 +361,9 @@ def preprocess(
     8. Lemmatization (optional)
     9. Text reconstruction
     
+    NLTK resources are resolved once by the shared PreprocessingEngine, so
+    repeated calls do not touch the filesystem.
+    
     Args:
         text (str): Input text to preprocess
         remove_stopwords (bool, optional): Remove common stop words. Defaults to True.
@@ -88,14 +372,14 @@ def preprocess(
         remove_digits (bool, optional): Remove numeric digits. Defaults to True.
         to_lowercase (bool, optional): Convert to lowercase. Defaults to True.
         language (str, optional): Language for stop words. Defaults to 'english'.
-        
+    
     Returns:
         str: Preprocessed and cleaned text
-        
+    
     Raises:
         ValueError: If input text is empty or invalid
         RuntimeError: If NLTK dependencies are missing
-        
+    
     Examples:
         >>> text = "The quick brown fox jumps over the lazy dog!"
         >>> cleaned = preprocess(text)
@@ -122,67 +406,245 @@ def preprocess(
     if not text.strip():
         return ""
     
-    # Ensure NLTK dependencies are available
-    if not download_nltk_dependencies():
-        raise RuntimeError("Failed to download required NLTK data")
-    
-    try:
-        # Step 1: Unicode normalization and special character handling
-        text = text.replace('\xa0', ' ')  # Replace non-breaking spaces
-        text = text.replace('\u00a0', ' ')  # Another non-breaking space variant
-        text = text.replace('\n', ' ')     # Replace newlines with spaces
-        text = text.replace('\t', ' ')     # Replace tabs with spaces
-        text = text.replace('\r', ' ')     # Replace carriage returns
-        
-        # Step 2: Normalize whitespace (multiple spaces -> single space)
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Step 3: Convert to lowercase if requested
-        if to_lowercase:
-            text = text.lower()
-        
-        # Step 4: Remove punctuation if requested
-        if remove_punctuation:
-            text = text.translate(str.maketrans('', '', string.punctuation))
-        
-        # Step 5: Remove digits if requested
-        if remove_digits:
-            text = re.sub(r'\d+', '', text)
-        
-        # Step 6: Tokenization
-        try:
-            words = word_tokenize(text)
-        except Exception as e:
-            print(f"[WARNING] Tokenization failed, using simple split: {str(e)}")
-            words = text.split()
-        
-        # Step 7: Remove stop words if requested
-        if remove_stopwords:
-            try:
-                stop_words = set(stopwords.words(language))
-                words = [word for word in words if word and word not in stop_words]
-            except Exception as e:
-                print(f"[WARNING] Stop words removal failed: {str(e)}")
-        
-        # Step 8: Apply lemmatization if requested
-        if apply_lemmatization:
-            try:
-                lemmatizer = WordNetLemmatizer()
-                words = [lemmatizer.lemmatize(word) for word in words if word]
-            except Exception as e:
-                print(f"[WARNING] Lemmatization failed: {str(e)}")
+    return get_preprocessing_engine().preprocess(
+        text,
+        remove_stopwords=remove_stopwords,
+        apply_lemmatization=apply_lemmatization,
+        remove_punctuation=remove_punctuation,
+        remove_digits=remove_digits,
+        to_lowercase=to_lowercase,
+        language=language
+    )
+
+
+# Longest whitespace-free run carried between windows before it is flushed
+_MAX_CARRY_CHARS = 65536
+
+
+def _split_trailing_token(text: str) -> Tuple[str, str]:
+    """Split text before its last whitespace-delimited token, which may be incomplete."""
+    end = len(text)
+    while end > 0 and not text[end - 1].isspace():
+        end -= 1
+    return text[:end], text[end:]
+
+
+def preprocess_stream(
+    chunks: Iterable[str],
+    separator: str = "",
+    chunk_chars: int = 65536,
+    remove_stopwords: bool = True,
+    apply_lemmatization: bool = True,
+    remove_punctuation: bool = True,
+    remove_digits: bool = True,
+    to_lowercase: bool = True,
+    language: str = 'english'
+) -> Iterator[str]:
+    """
+    Preprocess a stream of text chunks with bounded memory.
+    
+    Chunks are buffered into windows of about `chunk_chars` characters and
+    each window is preprocessed on its own, so only one window's token lists
+    exist at a time instead of several copies of the whole document. A
+    window always ends at whitespace; the trailing partial token is carried
+    into the next window, so words split across chunk boundaries are
+    processed whole. With remove_punctuation=True (the default), joining the
+    yielded pieces with spaces gives the same tokens as preprocess() on the
+    concatenated text. With punctuation kept, tokenization near a window edge
+    can differ, since sentence splitting treats the window end as a sentence
+    end (e.g. "Dr." ending a window becomes "Dr" "."). Memory is bounded by
+    the window size plus the largest chunk; whitespace-free runs longer than
+    _MAX_CARRY_CHARS are flushed instead of carried.
+    
+    Args:
+        chunks (Iterable[str]): Text chunks in document order, e.g. PDF pages
+        separator (str, optional): Text inserted between chunks; use "\\n" for
+                                   pages, "" for arbitrary slices of a text.
+                                   Defaults to "".
+        chunk_chars (int, optional): Target window size in characters.
+                                     Defaults to 65536.
+        remove_stopwords, apply_lemmatization, remove_punctuation,
+        remove_digits, to_lowercase, language: Same as preprocess()
+    
+    Yields:
+        str: Non-empty preprocessed text of each window
+    
+    Raises:
+        ValueError: If a chunk is not a string or chunk_chars is not positive
+    
+    Examples:
+        >>> pages = (text for _, text in iter_pdf_pages("report.pdf"))
+        >>> cleaned = " ".join(preprocess_stream(pages, separator="\\n"))
+    """
+    if chunk_chars < 1:
+        raise ValueError("chunk_chars must be >= 1")
+    
+    engine = get_preprocessing_engine()
+    options = {
+        "remove_stopwords": remove_stopwords,
+        "apply_lemmatization": apply_lemmatization,
+        "remove_punctuation": remove_punctuation,
+        "remove_digits": remove_digits,
+        "to_lowercase": to_lowercase,
+        "language": language,
+    }
+    
+    pending: List[str] = []
+    pending_chars = 0
+    first = True
+    
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            raise ValueError("Chunks must be strings")
         
-        # Step 9: Reconstruct cleaned text
-        cleaned_text = ' '.join(word for word in words if word.strip())
+        if separator and not first:
+            pending.append(separator)
+            pending_chars += len(separator)
+        first = False
+        pending.append(chunk)
+        pending_chars += len(chunk)
         
-        # Final whitespace cleanup
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+        if pending_chars < chunk_chars:
+            continue
         
-        return cleaned_text
+        window, carry = _split_trailing_token("".join(pending))
+        if not window and len(carry) < _MAX_CARRY_CHARS:
+            # A single token so far; wait for the whitespace that ends it
+            pending = [carry]
+            continue
+        if len(carry) >= _MAX_CARRY_CHARS:
+            # Whitespace-free run too long to be a word: flush rather than grow
+            window, carry = window + carry, ""
+        pending = [carry] if carry else []
+        pending_chars = len(carry)
         
-    except Exception as e:
-        print(f"[ERROR] Preprocessing failed: {str(e)}")
-        return text  # Return original text if preprocessing fails
+        cleaned = engine.preprocess(window, **options)
+        if cleaned:
+            yield cleaned
+    
+    if pending:
+        cleaned = engine.preprocess("".join(pending), **options)
+        if cleaned:
+            yield cleaned
+
+
+def _default_workers() -> int:
+    """Worker count from PREPROCESS_WORKERS, defaulting to the CPU count."""
+    return int(os.environ.get("PREPROCESS_WORKERS", 0)) or os.cpu_count() or 1
+
+
+def _split_windows(text: str, chunk_chars: int) -> List[str]:
+    """Split text into windows of at most chunk_chars that end at whitespace."""
+    windows = []
+    start = 0
+    while len(text) - start > chunk_chars:
+        window, _ = _split_trailing_token(text[start:start + chunk_chars])
+        if not window:
+            # Whitespace-free run longer than a window: cut it at the budget
+            window = text[start:start + chunk_chars]
+        windows.append(window)
+        start += len(window)
+    windows.append(text[start:])
+    return windows
+
+
+def _init_worker() -> None:
+    """Process pool initializer: resolve NLTK resources once per worker."""
+    get_preprocessing_engine()
+
+
+def _preprocess_window(window: str, options: Dict[str, Any]) -> str:
+    """Preprocess one window inside a worker process."""
+    return get_preprocessing_engine().preprocess(window, **options)
+
+
+def preprocess_many(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_chars: int = 65536,
+    remove_stopwords: bool = True,
+    apply_lemmatization: bool = True,
+    remove_punctuation: bool = True,
+    remove_digits: bool = True,
+    to_lowercase: bool = True,
+    language: str = 'english'
+) -> List[str]:
+    """
+    Preprocess a batch of documents across a process pool.
+    
+    Tokenization and lemmatization are pure Python and hold the GIL, so a
+    batch is spread over worker processes, each building its own
+    PreprocessingEngine once in the pool initializer. Documents longer than
+    `chunk_chars` are split into whitespace-aligned windows (as in
+    preprocess_stream()) so one large document does not leave the other
+    workers idle; the windows are joined back per document. As with
+    preprocess_stream(), the result matches preprocess() token for token
+    only when punctuation is removed.
+    
+    Args:
+        texts (Iterable[str]): Documents to preprocess
+        workers (int, optional): Worker processes. Defaults to
+                                 PREPROCESS_WORKERS or the CPU count;
+                                 1 preprocesses in the calling process.
+        chunk_chars (int, optional): Maximum window size in characters.
+                                     Defaults to 65536.
+        remove_stopwords, apply_lemmatization, remove_punctuation,
+        remove_digits, to_lowercase, language: Same as preprocess()
+    
+    Returns:
+        List[str]: Preprocessed text of each document, in input order
+    
+    Raises:
+        ValueError: If a document is not a string or chunk_chars is not positive
+    
+    Examples:
+        >>> texts = [extract_text_from_pdf(path) for path in sorted(Path("reports").glob("*.pdf"))]
+        >>> cleaned = preprocess_many(texts, workers=4)
+    """
+    if chunk_chars < 1:
+        raise ValueError("chunk_chars must be >= 1")
+    
+    texts = list(texts)
+    if not all(isinstance(text, str) for text in texts):
+        raise ValueError("Input must be a list of strings")
+    
+    options = {
+        "remove_stopwords": remove_stopwords,
+        "apply_lemmatization": apply_lemmatization,
+        "remove_punctuation": remove_punctuation,
+        "remove_digits": remove_digits,
+        "to_lowercase": to_lowercase,
+        "language": language,
+    }
+    
+    # (document index, window) tasks; blank documents need no work
+    owners: List[int] = []
+    windows: List[str] = []
+    for index, text in enumerate(texts):
+        if text.strip():
+            for window in _split_windows(text, chunk_chars):
+                owners.append(index)
+                windows.append(window)
+    
+    if workers is None:
+        workers = _default_workers()
+    workers = min(workers, len(windows))
+    
+    if workers <= 1:
+        engine = get_preprocessing_engine()
+        cleaned = [engine.preprocess(window, **options) for window in windows]
+    else:
+        print(f"[INFO] Preprocessing {len(texts)} documents ({len(windows)} windows) with {workers} worker processes")
+        chunksize = max(1, len(windows) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            # map() returns results in submission order
+            cleaned = list(executor.map(_preprocess_window, windows, repeat(options), chunksize=chunksize))
+    
+    pieces: List[List[str]] = [[] for _ in texts]
+    for index, text in zip(owners, cleaned):
+        if text:
+            pieces[index].append(text)
+    return [" ".join(document) for document in pieces]
 
 
 def preprocess_for_summarization(text: str) -> str:
@@ -195,10 +657,10 @@ def preprocess_for_summarization(text: str) -> str:
     
     Args:
         text (str): Input text to preprocess
-        
+    
     Returns:
         str: Text preprocessed for summarization
-        
+    
     Examples:
         >>> text = "This is a sample document with various issues!"
         >>> clean_text = preprocess_for_summarization(text)
@@ -220,7 +682,7 @@ def preprocess_for_translation(text: str) -> str:
     
     Args:
         text (str): Input text to preprocess
-        
+    
     Returns:
         str: Text preprocessed for translation
     """
@@ -241,7 +703,7 @@ def get_text_statistics(text: str) -> dict:
     
     Args:
         text (str): Input text to analyze
-        
+    
     Returns:
         dict: Text statistics including character, word, and sentence counts
     """
@@ -272,7 +734,7 @@ def get_text_statistics(text: str) -> dict:
 
 # Initialize NLTK dependencies on module import
 try:
-    download_nltk_dependencies()
+    get_preprocessing_engine()
 except Exception as e:
     print(f"[WARNING] Failed to initialize NLTK dependencies: {e}")
 